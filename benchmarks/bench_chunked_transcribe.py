@@ -0,0 +1,65 @@
+"""Benchmark chunked parallel transcription: throughput against chunk count and threads per worker.
+
+Usage:
+    uv run python benchmarks/bench_chunked_transcribe.py "service sermon.wav" \
+        --whisper-cli /path/to/whisper-cli --model /path/to/ggml-large-v3.bin \
+        --chunks 1,2,4,8 --threads 1,2,4,8
+
+Prints one row per (chunks, threads per worker) combination with wall time and the
+realtime factor (seconds of audio transcribed per wall-clock second).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import wave
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from transcribe import get_default_whisper_cli, transcribe_chunked  # noqa: E402
+
+
+def parse_int_list(text):
+    return [int(v) for v in text.split(",") if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("wav", help="16 kHz mono WAV to transcribe")
+    parser.add_argument("--whisper-cli", default=None, help="whisper-cli executable (default: discovered)")
+    parser.add_argument("--model", required=True, help="ggml model file")
+    parser.add_argument("--chunks", type=parse_int_list, default=[1, 2, 4, 8], help="comma-separated chunk counts")
+    parser.add_argument("--threads", type=parse_int_list, default=[1, 2, 4], help="comma-separated threads per worker")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    whisper_cli = args.whisper_cli or get_default_whisper_cli()
+    with wave.open(args.wav, "rb") as wav:
+        audio_seconds = wav.getnframes() / wav.getframerate()
+
+    print(f"{os.path.basename(args.wav)}: {audio_seconds:.1f}s of audio, {os.cpu_count()} CPUs")
+    print(f"{'chunks':>6} {'threads':>7} {'wall s':>9} {'x realtime':>10} {'segments':>8}")
+    results = []
+    for chunks in args.chunks:
+        for threads in args.threads:
+            start = time.perf_counter()
+            segments = transcribe_chunked(whisper_cli, args.model, args.wav, chunks, threads_per_worker=threads)
+            wall = time.perf_counter() - start
+            realtime = audio_seconds / wall if wall > 0 else 0.0
+            print(f"{chunks:>6} {threads:>7} {wall:>9.2f} {realtime:>10.2f} {len(segments):>8}")
+            results.append({
+                "chunks": chunks,
+                "threads_per_worker": threads,
+                "wall_seconds": wall,
+                "realtime_factor": realtime,
+                "segments": len(segments),
+            })
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"audio_seconds": audio_seconds, "cpus": os.cpu_count(), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Benchmark whisper models: speed, peak memory and accuracy on a reference sermon clip.
+
+Usage:
+    uv run python benchmarks/bench_models.py --list
+    uv run python benchmarks/bench_models.py "reference sermon.wav" --reference "reference sermon.txt" \
+        --threads 4,8 --beam-sizes 1,5
+    uv run python benchmarks/bench_models.py clip.wav --models ggml-medium.bin,ggml-large-v3-turbo-q5_0.bin
+
+Runs whisper-cli once per (model, threads, beam size) over the clip and records, per run, the
+realtime factor (seconds of audio per wall-clock second), the peak resident memory of whisper-cli
+and, with --reference, the word error rate against the reference transcript. Results are stored
+in the model registry (next to jobs.json), and the app's model menu shows each model's fastest
+measured speed. Models default to every ggml-*.bin in the configured model folders.
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from transcribe import (  # noqa: E402
+    ModelRegistry,
+    get_default_whisper_cli,
+    get_installed_models,
+    load_config,
+    resolve_model_path,
+)
+
+
+def parse_int_list(text):
+    return [int(v) for v in text.split(",") if v.strip()]
+
+
+def words(text):
+    """Lower-cased words without punctuation (apostrophes kept), for WER."""
+    return re.sub(r"[^\w\s']", " ", text.lower()).split()
+
+
+def word_error_rate(reference, hypothesis):
+    """(substitutions + deletions + insertions) / reference words, by word-level edit distance."""
+    ref, hyp = words(reference), words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hyp, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ref_word != hyp_word)))
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def run_whisper(whisper_cli, model_path, wav_path, threads, beam_size):
+    """Run whisper-cli; returns (transcript, wall seconds, peak RSS bytes or None)."""
+    cmd = [whisper_cli, "-m", model_path, "-t", str(threads), "-bs", str(beam_size), "-np", "-nt", "-f", wav_path]
+    with tempfile.TemporaryFile("w+") as out:
+        start = time.perf_counter()
+        process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=out, stderr=subprocess.DEVNULL, text=True)
+        if hasattr(os, "wait4"):
+            # Reap it ourselves to get its resource usage (ru_maxrss: KiB on Linux, bytes on macOS).
+            _, status, usage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            peak_rss = usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+        else:
+            process.wait()
+            peak_rss = None
+        wall = time.perf_counter() - start
+        if process.returncode != 0:
+            raise RuntimeError(f"whisper-cli exited with {process.returncode} on {os.path.basename(model_path)}")
+        out.seek(0)
+        return out.read(), wall, peak_rss
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("wav", nargs="?", help="16 kHz mono WAV reference clip")
+    parser.add_argument("--reference", help="reference transcript of the clip (plain text) for WER")
+    parser.add_argument("--list", action="store_true", help="list the registered models and their results, then exit")
+    parser.add_argument("--models", help="comma-separated model names or paths (default: all installed)")
+    parser.add_argument("--whisper-cli", default=None, help="whisper-cli executable (default: configured/discovered)")
+    parser.add_argument("--threads", type=parse_int_list, default=[os.cpu_count() or 4], help="comma-separated thread counts")
+    parser.add_argument("--beam-sizes", type=parse_int_list, default=[5], help="comma-separated beam sizes")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    config = load_config()
+    model_dirs = config.get("model_dirs")
+    registry = ModelRegistry()
+    if args.models:
+        models = [resolve_model_path(m.strip(), model_dirs) for m in args.models.split(",") if m.strip()]
+    else:
+        models = get_installed_models(model_dirs)
+
+    if args.list:
+        for path in models:
+            print(registry.describe(path))
+            for result in registry.benchmarks(path):
+                print(f"    {format_result(result)}")
+        return 0
+    if not args.wav:
+        parser.error("a reference clip is required (or --list)")
+    if not models:
+        parser.error("no models found; set the model folders in Settings or pass --models")
+
+    whisper_cli = args.whisper_cli or config.get("whisper_cli") or get_default_whisper_cli()
+    with wave.open(args.wav, "rb") as wav:
+        audio_seconds = wav.getnframes() / wav.getframerate()
+    reference = None
+    if args.reference:
+        with open(args.reference, "r") as f:
+            reference = f.read()
+
+    print(f"{os.path.basename(args.wav)}: {audio_seconds:.1f}s of audio, {os.cpu_count()} CPUs")
+    results = []
+    for model_path in models:
+        header = registry.info(model_path)
+        print(f"{os.path.basename(model_path)} ({header.get('type', '?')} {header.get('quantization', '?')})")
+        for threads in args.threads:
+            for beam_size in args.beam_sizes:
+                transcript, wall, peak_rss = run_whisper(whisper_cli, model_path, args.wav, threads, beam_size)
+                result = {
+                    "profile": {"threads": threads, "beam_size": beam_size},
+                    "realtime_factor": audio_seconds / wall if wall > 0 else 0.0,
+                    "wall_seconds": wall,
+                    "audio_seconds": audio_seconds,
+                    "peak_rss_mb": peak_rss / 1024**2 if peak_rss is not None else None,
+                    "wer": word_error_rate(reference, transcript) if reference is not None else None,
+                    "clip": os.path.basename(args.wav),
+                    "measured_at": datetime.now().isoformat(timespec="seconds"),
+                }
+                registry.record_benchmark(model_path, result)
+                results.append({"model": model_path, **result})
+                print(f"    {format_result(result)}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+def format_result(result):
+    profile = result["profile"]
+    text = (f"threads {profile['threads']:>2}, beam {profile['beam_size']}: "
+            f"{result['realtime_factor']:6.2f}x realtime")
+    if result.get("peak_rss_mb") is not None:
+        text += f", peak {result['peak_rss_mb']:.0f} MB"
+    if result.get("wer") is not None:
+        text += f", WER {result['wer'] * 100:.1f}%"
+    return text
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Benchmark segment-parallel video encoding against the single-process encode.
+
+Usage:
+    uv run python benchmarks/bench_parallel_encode.py "service.mp4" --encoder av1 --segments 1,2,4,8
+    uv run python benchmarks/bench_parallel_encode.py "service.mp4" --in 2530 --out 4683 --encoder h265 --runs 3
+
+Re-encodes the cut (default: the whole file) once per segment count. 1 is the current single ffmpeg
+process; N > 1 splits the cut at keyframes into N segments encoded in parallel, each with its share
+of the cores, and joins them with the concat demuxer. Reports the wall time (median of --runs),
+speedup and output size for each. The source is re-encoded even if it is already in the target codec.
+Set the winning count as "Parallel encode segments" in Settings or `--encode-segments` in batch mode.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from transcribe import (  # noqa: E402
+    VIDEO_ENCODER_OPTIONS,
+    ExtractAndTranscribeThread,
+    probe_duration_ms,
+)
+
+
+def parse_int_list(text):
+    return [int(v) for v in text.split(",") if v.strip()]
+
+
+def encode_once(source, in_s, out_s, encoder, preset, segments, work):
+    """One encode of the cut; returns (wall seconds, output bytes)."""
+    job = ExtractAndTranscribeThread(
+        source, int(in_s * 1000), int(out_s * 1000), f"bench-{segments}",
+        video_encoder=encoder, video_preset=preset, do_transcribe=False, smart_cut=False,
+        encode_segments=segments,
+    )
+    # No probe stage here: an unknown source codec forces a re-encode instead of a stream copy.
+    job.source_codec = ""
+    output = os.path.join(work, f"bench-{segments} sermon.mp4")
+    start = time.perf_counter()
+    job.video_extract(output)
+    wall = time.perf_counter() - start
+    size = os.path.getsize(output)
+    os.remove(output)
+    return wall, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="service recording")
+    parser.add_argument("--in", dest="in_s", type=float, default=0.0, help="cut start in seconds (default: 0)")
+    parser.add_argument("--out", dest="out_s", type=float, help="cut end in seconds (default: end of file)")
+    parser.add_argument("--encoder", choices=[key for _, key in VIDEO_ENCODER_OPTIONS], default="av1")
+    parser.add_argument("--preset", help="encoder preset (default: the app's default for the encoder)")
+    parser.add_argument("--segments", type=parse_int_list, default=[1, 2, 4, 8], help="comma-separated segment counts")
+    parser.add_argument("--runs", type=int, default=1, help="encodes per segment count (median is reported)")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    out_s = args.out_s
+    if out_s is None:
+        duration_ms = probe_duration_ms(args.source)
+        if duration_ms is None:
+            parser.error("could not read the duration (is ffprobe installed?); pass --out")
+        out_s = duration_ms / 1000
+    cut_s = out_s - args.in_s
+
+    print(f"{os.path.basename(args.source)}: {cut_s:.1f}s cut, {args.encoder}, {os.cpu_count()} CPUs")
+    print(f"{'segments':>8} {'wall s':>9} {'speedup':>8} {'x realtime':>10} {'size MB':>9} {'size vs 1':>9}")
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench-encode-") as work:
+        # The job writes next to its input, so encode from a link in the scratch directory.
+        source = os.path.join(work, os.path.basename(args.source))
+        os.symlink(os.path.abspath(args.source), source)
+        for segments in args.segments:
+            runs = [encode_once(source, args.in_s, out_s, args.encoder, args.preset, segments, work)
+                    for _ in range(max(1, args.runs))]
+            wall = statistics.median(w for w, _ in runs)
+            size = statistics.median(s for _, s in runs)
+            results.append({"segments": segments, "wall_seconds": wall, "size_bytes": size,
+                            "realtime_factor": cut_s / wall if wall > 0 else 0.0})
+            baseline = results[0]
+            print(f"{segments:>8} {wall:>9.2f} {baseline['wall_seconds'] / wall:>7.2f}x "
+                  f"{cut_s / wall:>10.1f} {size / 1024**2:>9.2f} {size / baseline['size_bytes']:>8.3f}x")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"source": args.source, "cut_seconds": cut_s, "encoder": args.encoder,
+                       "preset": args.preset, "cpus": os.cpu_count(), "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
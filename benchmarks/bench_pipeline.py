@@ -0,0 +1,260 @@
+"""Reproducible benchmark of every pipeline stage on synthetic media, for comparing commits.
+
+Usage:
+    uv run python benchmarks/bench_pipeline.py --json baseline.json
+    uv run python benchmarks/bench_pipeline.py --duration 1800 --codec hevc --runs 3 --compare baseline.json
+    uv run python benchmarks/bench_pipeline.py --scenarios probe,copy,smart_cut --reencode h265,av1
+
+Generates a synthetic "sermon" with ffmpeg's lavfi sources (testsrc2 video, a sine tone over
+pink noise for audio) of the given length, codec and resolution, cached under --media-dir so
+every run and every commit measures the same file. Each scenario then runs the real job stages
+on it and records their wall time (median of --runs):
+
+    probe       cold ffprobe of the source (media_info with an empty probe cache)
+    copy        video stage, target codec = source codec, stream copy from the nearest keyframe
+    smart_cut   video stage, re-encoding only the partial GOPs at the cut edges
+    reencode    video stage, one scenario per --reencode encoder
+    transcribe  audio extract + transcribe stages, with benchmarks/stub_whisper_cli.py standing
+                in for whisper-cli (--whisper-speed seconds per audio second)
+
+The cut runs from 10% to 90% of the file, so neither edge falls on a keyframe. --json writes the
+results with the commit, ffmpeg version and machine they were measured on; --compare prints the
+change per stage against such a file and exits 1 if any stage is slower by more than
+--max-regression percent (and 50 ms). The app's stage and process logs are not touched.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import transcribe  # noqa: E402
+from transcribe import (  # noqa: E402
+    CACHE_DIR,
+    ENCODER_SOURCE_CODECS,
+    PROBE_CACHE,
+    SUPERVISOR,
+    VIDEO_ENCODER_OPTIONS,
+    ExtractAndTranscribeThread,
+    ProbeCache,
+    media_info,
+)
+
+SCENARIOS = ("probe", "copy", "smart_cut", "reencode", "transcribe")
+# ffmpeg encoder per --codec for the synthetic source, and the app encoder key that copies it
+SOURCE_CODECS = {"h264": ("libx264", "h264"), "hevc": ("libx265", "h265")}
+# Changes smaller than this are timer noise, whatever their percentage (e.g. on the probe stage)
+REGRESSION_FLOOR_S = 0.05
+STUB_WHISPER_CLI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stub_whisper_cli.py")
+
+
+def parse_list(text):
+    return [v.strip() for v in text.split(",") if v.strip()]
+
+
+def synthetic_sermon(media_dir, duration_s, codec, resolution, fps):
+    """Path of the synthetic recording for these settings, generating it on first use."""
+    path = os.path.join(media_dir, f"synthetic-{codec}-{resolution}-{fps}fps-{duration_s}s.mp4")
+    if os.path.exists(path):
+        return path
+    os.makedirs(media_dir, exist_ok=True)
+    vcodec = SOURCE_CODECS[codec][0]
+    print(f"Generating {os.path.basename(path)}...")
+    tmp_path = f"{path}.tmp.mp4"
+    subprocess.run([
+        "ffmpeg", "-v", "error", "-y",
+        "-f", "lavfi", "-i", f"testsrc2=size={resolution}:rate={fps}:duration={duration_s}",
+        "-f", "lavfi", "-i", f"sine=frequency=220:sample_rate=48000:duration={duration_s}",
+        "-f", "lavfi", "-i", f"anoisesrc=color=pink:amplitude=0.05:sample_rate=48000:duration={duration_s}",
+        "-filter_complex", "[1:a][2:a]amix=inputs=2:normalize=0[a]",
+        "-map", "0:v", "-map", "[a]",
+        # A keyframe every 2 s, like a typical camera or OBS recording
+        "-c:v", vcodec, "-preset", "veryfast", "-g", str(2 * fps), "-pix_fmt", "yuv420p",
+        "-c:a", "aac", "-b:a", "128k", "-ac", "2",
+        tmp_path,
+    ], check=True)
+    os.replace(tmp_path, path)
+    return path
+
+
+def run_job(source, in_ms, out_ms, whisper_cli, **options):
+    """Run one job's stages on source; returns the job (see its stage_timings). Raises if the job failed."""
+    job = ExtractAndTranscribeThread(source, in_ms, out_ms, "bench", whisper_cli=whisper_cli, **options)
+    messages = []
+    job.finished.connect(messages.append)
+    # A cold probe cache each time, as for a recording opened for the first time
+    PROBE_CACHE._entries = {}
+    job.run()
+    if not messages or not messages[-1].startswith("Process complete"):
+        raise RuntimeError(messages[-1] if messages else "job did not finish")
+    for name in os.listdir(os.path.dirname(source)):
+        if name.startswith("bench sermon."):
+            os.remove(os.path.join(os.path.dirname(source), name))
+    return job
+
+
+def measure(scenario, source, work, in_ms, out_ms, args):
+    """{stage: seconds} for one run of a scenario."""
+    if scenario == "probe":
+        cache = ProbeCache(os.path.join(work, f"probe-{time.perf_counter_ns()}.json"))
+        start = time.perf_counter()
+        if media_info(source, cache) is None:
+            raise RuntimeError("ffprobe could not read the source")
+        return {"probe": time.perf_counter() - start}
+    if scenario == "transcribe":
+        job = run_job(source, in_ms, out_ms, args.whisper_cli, do_transcode=False, single_pass=False)
+        return {stage: job.stage_timings[stage] for stage in ("audio", "transcribe")}
+    copy_encoder = SOURCE_CODECS[args.codec][1]
+    if scenario in ("copy", "smart_cut"):
+        encoder, smart_cut = copy_encoder, scenario == "smart_cut"
+    else:
+        encoder, smart_cut = scenario.split(":", 1)[1], False
+    job = run_job(source, in_ms, out_ms, args.whisper_cli, video_encoder=encoder, do_transcribe=False,
+                  smart_cut=smart_cut)
+    if encoder == copy_encoder and not job._can_copy_video():
+        # Without a readable codec the job re-encodes, which would be timed as a copy.
+        raise RuntimeError(f"ffprobe did not report the source as {args.codec}, so the video was re-encoded")
+    return {"video": job.stage_timings["video"]}
+
+
+def scenario_names(args):
+    names = []
+    for scenario in args.scenarios:
+        if scenario == "reencode":
+            names += [f"reencode:{encoder}" for encoder in args.reencode]
+        else:
+            names.append(scenario)
+    return names
+
+
+def environment():
+    """Where the results were measured: commit, ffmpeg and machine."""
+    repo = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def output(cmd):
+        try:
+            return subprocess.run(cmd, cwd=repo, capture_output=True, text=True, timeout=10).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            return ""
+
+    ffmpeg_version = output(["ffmpeg", "-version"]).splitlines()
+    return {
+        "commit": output(["git", "rev-parse", "--short", "HEAD"]),
+        "dirty": bool(output(["git", "status", "--porcelain", "--untracked-files=no"])),
+        "ffmpeg": ffmpeg_version[0] if ffmpeg_version else "",
+        "machine": platform.machine(),
+        "system": platform.platform(),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "measured_at": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def compare(results, baseline_path, max_regression):
+    """Print each stage's change against baseline_path; True if none regressed past max_regression %."""
+    with open(baseline_path, "r") as f:
+        baseline = json.load(f)
+    before = baseline.get("results", {})
+    print(f"\nvs {os.path.basename(baseline_path)} (commit {baseline.get('environment', {}).get('commit') or '?'}):")
+    ok = True
+    for key, seconds in results.items():
+        if key not in before:
+            print(f"{key:>28} {'':>9} {seconds:>9.2f}   (new)")
+            continue
+        change = 100.0 * (seconds - before[key]) / before[key] if before[key] > 0 else 0.0
+        regressed = change > max_regression and seconds - before[key] > REGRESSION_FLOOR_S
+        ok = ok and not regressed
+        print(f"{key:>28} {before[key]:>9.2f} {seconds:>9.2f} {change:>+7.1f}%{'  REGRESSION' if regressed else ''}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=int, default=300, help="synthetic recording length in seconds (default: 300)")
+    parser.add_argument("--codec", choices=sorted(SOURCE_CODECS), default="h264", help="synthetic recording codec")
+    parser.add_argument("--resolution", default="1280x720")
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--scenarios", type=parse_list, default=list(SCENARIOS),
+                        help=f"comma-separated, from {','.join(SCENARIOS)} (default: all)")
+    parser.add_argument("--reencode", type=parse_list, default=None,
+                        help="comma-separated encoders for the reencode scenario (default: those not copying --codec)")
+    parser.add_argument("--whisper-cli", default=STUB_WHISPER_CLI, help="whisper-cli executable (default: the stub)")
+    parser.add_argument("--whisper-speed", type=float, default=0.01,
+                        help="stub whisper-cli seconds per audio second (default: 0.01)")
+    parser.add_argument("--media-dir", default=os.path.join(CACHE_DIR, "bench-media"),
+                        help="where synthetic recordings are kept between runs")
+    parser.add_argument("--runs", type=int, default=1, help="runs per scenario (median is reported)")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    parser.add_argument("--compare", help="results JSON from an earlier run to compare against")
+    parser.add_argument("--max-regression", type=float, default=10.0,
+                        help="with --compare, exit 1 if a stage is this many percent slower (default: 10)")
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    encoders = [key for _, key in VIDEO_ENCODER_OPTIONS]
+    if args.reencode is None:
+        source_codec = args.codec
+        args.reencode = [e for e in encoders if source_codec not in ENCODER_SOURCE_CODECS.get(e, ())]
+    elif set(args.reencode) - set(encoders):
+        parser.error(f"unknown encoders: {', '.join(sorted(set(args.reencode) - set(encoders)))}")
+    # The app passes whisper-cli fixed arguments, so the stub takes its speed from the environment.
+    os.environ["STUB_WHISPER_SPEED"] = str(args.whisper_speed)
+
+    source_media = synthetic_sermon(args.media_dir, args.duration, args.codec, args.resolution, args.fps)
+    in_ms, out_ms = args.duration * 100, args.duration * 900
+    cut_s = (out_ms - in_ms) / 1000
+    env = environment()
+    print(f"{os.path.basename(source_media)}: {cut_s:.0f}s cut, {env['cpus']} CPUs, commit {env['commit'] or '?'}"
+          f"{' (dirty)' if env['dirty'] else ''}")
+    print(f"{'scenario.stage':>28} {'wall s':>9} {'x realtime':>10}")
+
+    results = {}
+    errors = {}
+    with tempfile.TemporaryDirectory(prefix="bench-pipeline-") as work:
+        # Keep the user's stage/process logs and probe cache out of it.
+        transcribe.STAGE_LOG_PATH = os.path.join(work, "stage_timings.csv")
+        SUPERVISOR.log_path = os.path.join(work, "processes.csv")
+        PROBE_CACHE.path = os.path.join(work, "probe.json")
+        # The job writes next to its input, so run it on a link in the scratch directory.
+        source = os.path.join(work, os.path.basename(source_media))
+        os.symlink(os.path.abspath(source_media), source)
+        for scenario in scenario_names(args):
+            try:
+                runs = [measure(scenario, source, work, in_ms, out_ms, args) for _ in range(max(1, args.runs))]
+            except Exception as e:
+                errors[scenario] = str(e)
+                print(f"{scenario:>28} failed: {e}")
+                continue
+            for stage in runs[0]:
+                key = f"{scenario}.{stage}"
+                results[key] = statistics.median(run[stage] for run in runs)
+                media_s = args.duration if stage == "probe" else cut_s
+                print(f"{key:>28} {results[key]:>9.2f} {media_s / results[key]:>10.1f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "environment": env,
+                "media": {"duration_seconds": args.duration, "codec": args.codec, "resolution": args.resolution,
+                          "fps": args.fps, "cut_seconds": cut_s},
+                "whisper": {"cli": args.whisper_cli, "stub_seconds_per_audio_second": args.whisper_speed},
+                "runs": args.runs,
+                "results": results,
+                "errors": errors,
+            }, f, indent=2)
+    if args.compare and not compare(results, args.compare, args.max_regression):
+        return 1
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""Benchmark GUI startup: time to first paint and time to interactive, from process launch.
+
+Usage:
+    uv run python benchmarks/bench_startup.py --runs 5
+    uv run python benchmarks/bench_startup.py --runs 5 --max-first-paint 1.5 --max-interactive 3
+
+Launches `transcribe.py --startup-timing` repeatedly. Each run paints its window, loads VLC and
+discovers models, prints its milestones and quits. Reports the median and worst run. Exits with
+status 1 when a --max-* budget is exceeded, so it can guard against startup regressions. The first
+run is a cold start (nothing in the OS file cache); use --warmup to leave it out.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+TRANSCRIBE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "transcribe.py")
+MILESTONES = ("window_created", "first_paint", "interactive")
+
+
+def launch_once(timeout):
+    """One launch; returns seconds from launch to each milestone."""
+    launched = time.time()
+    proc = subprocess.run(
+        [sys.executable, TRANSCRIBE, "--startup-timing"],
+        stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=timeout,
+    )
+    for line in proc.stdout.splitlines():
+        if line.startswith("STARTUP "):
+            times = json.loads(line[len("STARTUP "):])
+            return {name: times[name] - launched for name in MILESTONES}
+    raise RuntimeError(f"no startup timings (exit {proc.returncode}): {proc.stderr.strip()[-500:]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="measured launches (default: 5)")
+    parser.add_argument("--warmup", type=int, default=0, help="launches to run first and not count")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds to wait for one launch")
+    parser.add_argument("--max-first-paint", type=float, help="fail if the median first paint is slower (s)")
+    parser.add_argument("--max-interactive", type=float, help="fail if the median time to interactive is slower (s)")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    for _ in range(args.warmup):
+        launch_once(args.timeout)
+
+    print(f"{'run':>4} {'window s':>9} {'paint s':>9} {'interactive s':>13}")
+    runs = []
+    for i in range(args.runs):
+        result = launch_once(args.timeout)
+        runs.append(result)
+        print(f"{i + 1:>4} {result['window_created']:>9.3f} {result['first_paint']:>9.3f} {result['interactive']:>13.3f}")
+
+    summary = {
+        name: {"median": statistics.median(r[name] for r in runs), "max": max(r[name] for r in runs)}
+        for name in MILESTONES
+    }
+    print(f"median: first paint {summary['first_paint']['median']:.3f}s, "
+          f"interactive {summary['interactive']['median']:.3f}s")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"runs": runs, "summary": summary}, f, indent=2)
+
+    failed = False
+    if args.max_first_paint is not None and summary["first_paint"]["median"] > args.max_first_paint:
+        print(f"FAIL: first paint over budget ({args.max_first_paint}s)")
+        failed = True
+    if args.max_interactive is not None and summary["interactive"]["median"] > args.max_interactive:
+        print(f"FAIL: time to interactive over budget ({args.max_interactive}s)")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
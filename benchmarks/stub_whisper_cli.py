@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Stand-in for whisper.cpp's whisper-cli, to benchmark and exercise the pipeline without a model.
+
+Usage (point the app, batch mode or a benchmark at it instead of a real whisper-cli):
+    python transcribe.py batch services/ --whisper-cli benchmarks/stub_whisper_cli.py --no-whisper-server
+    STUB_WHISPER_SPEED=0.05 python benchmarks/bench_pipeline.py --whisper-cli benchmarks/stub_whisper_cli.py
+
+Accepts whisper-cli's -m/-t/-bs/-np/-nt/-pp/-f arguments (-f - reads the WAV from stdin). Takes
+--seconds-per-audio-second of the input's duration, printing one "[start --> end]  text" segment
+every --segment-seconds as it goes (plain text with -nt) and, with -pp, whisper-cli's progress
+lines on stderr. The defaults can also be set with STUB_WHISPER_SPEED, STUB_WHISPER_SEGMENT_S,
+STUB_WHISPER_LOAD_S and STUB_WHISPER_TEXT, for callers that pass whisper-cli's arguments only.
+"""
+import argparse
+import io
+import os
+import sys
+import time
+import wave
+
+
+def audio_seconds(data):
+    """Duration of a WAV held in memory. A WAV piped from ffmpeg has no valid sizes, so count the bytes."""
+    with wave.open(io.BytesIO(data), "rb") as wav:
+        rate, width, channels = wav.getframerate(), wav.getsampwidth(), wav.getnchannels()
+    data_at = data.find(b"data") + 8
+    return max(0, len(data) - data_at) / (rate * width * channels)
+
+
+def timestamp(seconds):
+    ms = int(round(seconds * 1000))
+    return f"{ms // 3600000:02d}:{ms // 60000 % 60:02d}:{ms // 1000 % 60:02d}.{ms % 1000:03d}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-m", "--model", default="stub")
+    parser.add_argument("-f", "--file", required=True, help="WAV file, or - for stdin")
+    parser.add_argument("-t", "--threads", type=int, default=4)
+    parser.add_argument("-bs", "--beam-size", type=int, default=5)
+    parser.add_argument("-np", "--no-prints", action="store_true")
+    parser.add_argument("-nt", "--no-timestamps", action="store_true")
+    parser.add_argument("-pp", "--print-progress", action="store_true")
+    parser.add_argument("--seconds-per-audio-second", type=float,
+                        default=float(os.environ.get("STUB_WHISPER_SPEED", 0.01)), help="simulated inference speed")
+    parser.add_argument("--segment-seconds", type=float, default=float(os.environ.get("STUB_WHISPER_SEGMENT_S", 5.0)))
+    parser.add_argument("--load-seconds", type=float, default=float(os.environ.get("STUB_WHISPER_LOAD_S", 0.0)),
+                        help="simulated model load time")
+    parser.add_argument("--text", default=os.environ.get("STUB_WHISPER_TEXT", "stub segment"),
+                        help="segment text (numbered)")
+    args = parser.parse_args()
+
+    if args.file == "-":
+        data = sys.stdin.buffer.read()
+    else:
+        with open(args.file, "rb") as f:
+            data = f.read()
+    try:
+        duration = audio_seconds(data)
+    except (wave.Error, EOFError) as e:
+        print(f"error: failed to read WAV file '{args.file}': {e}", file=sys.stderr)
+        return 1
+
+    time.sleep(args.load_seconds)
+    start = 0.0
+    count = 0
+    reported = -1
+    while start < duration:
+        end = min(duration, start + args.segment_seconds)
+        time.sleep((end - start) * args.seconds_per_audio_second)
+        count += 1
+        text = f"{args.text} {count}"
+        print(text if args.no_timestamps else f"[{timestamp(start)} --> {timestamp(end)}]   {text}", flush=True)
+        percent = int(100 * end / duration)
+        if args.print_progress and percent // 5 > reported:
+            reported = percent // 5
+            print(f"whisper_print_progress_callback: progress = {percent:3d}%", file=sys.stderr, flush=True)
+        start = end
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
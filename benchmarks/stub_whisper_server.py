@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Stand-in for whisper.cpp's whisper-server, to exercise the resident-model backend without a model.
+
+Usage (point the app or batch mode at it instead of a real whisper-server):
+    python transcribe.py batch services/ --whisper-server benchmarks/stub_whisper_server.py
+    # or "whisper_server": "/path/to/benchmarks/stub_whisper_server.py" in config.json
+
+Accepts whisper-server's -m/--host/--port/-t arguments. Like the real server, it only starts
+listening after "loading" the model (--load-seconds). POST /inference with a multipart WAV upload
+answers in verbose_json after --seconds-per-audio-second of the upload's duration, with one
+segment every --segment-seconds.
+"""
+import argparse
+import io
+import json
+import time
+import wave
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-m", "--model", default="stub")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("-t", "--threads", type=int, default=4)
+    parser.add_argument("--load-seconds", type=float, default=2.0, help="simulated model load time")
+    parser.add_argument("--seconds-per-audio-second", type=float, default=0.02, help="simulated inference speed")
+    parser.add_argument("--segment-seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    time.sleep(args.load_seconds)
+    # whisper-server runs one inference at a time
+    inference_lock = Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path != "/inference":
+                self.send_error(404)
+                return
+            data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            riff = data.find(b"RIFF")
+            try:
+                with wave.open(io.BytesIO(data[riff:]), "rb") as wav:
+                    duration = wav.getnframes() / wav.getframerate()
+            except (wave.Error, EOFError):
+                self._reply({"error": "failed to read WAV file"})
+                return
+            with inference_lock:
+                time.sleep(duration * args.seconds_per_audio_second)
+            segments = []
+            start = 0.0
+            while start < duration:
+                end = min(duration, start + args.segment_seconds)
+                segments.append({"id": len(segments), "start": start, "end": end,
+                                 "text": f" stub segment {len(segments) + 1}"})
+                start = end
+            self._reply({"text": "".join(s["text"] for s in segments), "segments": segments})
+
+        def _reply(self, body):
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    ThreadingHTTPServer((args.host, args.port), Handler).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,18 @@
 import sys
-import vlc
+import argparse
+import csv
+import hashlib
 import json
 import os
+import re
+import signal
+import socket
+import struct
+import uuid
+import wave
 import platformdirs
 import shutil
+import numpy as np
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -20,26 +29,176 @@ from PySide6.QtWidgets import (
     QDialogButtonBox,
     QLineEdit,
     QCheckBox,
+    QSpinBox,
+    QListWidget,
+    QListWidgetItem,
+    QProgressBar,
+    QMessageBox,
+    QStyle,
 )
-from PySide6.QtCore import Qt, QTimer, QThread, Signal
+from PySide6.QtCore import Qt, QEvent, QObject, QPoint, QTimer, QThread, Signal
+from PySide6.QtGui import QColor, QPainter, QPixmap
+import asyncio
+import atexit
+import http.client
 import subprocess
+import tempfile
+import time
+import queue
+import threading
+import bisect
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager, nullcontext
 from datetime import datetime
-from urllib.parse import unquote
 from ffmpeg import FFmpeg
 
 
 CONFIG_DIR = platformdirs.user_config_dir("sermon-transcribe")
 CONFIG_PATH = os.path.join(CONFIG_DIR, "config.json")
+DATA_DIR = platformdirs.user_data_dir("sermon-transcribe")
+JOBS_PATH = os.path.join(DATA_DIR, "jobs.json")
+# One row per finished stage (media seconds, wall seconds, realtime factor) for capacity planning.
+STAGE_LOG_PATH = os.path.join(DATA_DIR, "stage_timings.csv")
+# One row per child process (ffmpeg, ffprobe, whisper): exit status, wall/CPU time and peak memory
+PROCESS_LOG_PATH = os.path.join(DATA_DIR, "processes.csv")
+# Per model file: ggml header metadata and measured benchmark results (see benchmarks/bench_models.py)
+MODEL_REGISTRY_PATH = os.path.join(DATA_DIR, "models.json")
+CACHE_DIR = platformdirs.user_cache_dir("sermon-transcribe")
+RESULT_CACHE_DIR = os.path.join(CACHE_DIR, "results")
+PROBE_CACHE_PATH = os.path.join(CACHE_DIR, "probe.json")
+WAVEFORM_CACHE_DIR = os.path.join(CACHE_DIR, "waveforms")
+THUMBNAIL_CACHE_DIR = os.path.join(CACHE_DIR, "thumbnails")
+PROXY_CACHE_DIR = os.path.join(CACHE_DIR, "proxies")
+PROBE_CACHE_MAX_ENTRIES = 500
+DEFAULT_CACHE_MAX_GB = 20
 
 DEFAULT_WHISPER_CLI = "/Users/ted/dev/whisper.cpp/build/bin/whisper-cli"
 DEFAULT_MODELS_DIR = "/Users/ted/dev/whisper.cpp/models"
 
+# whisper.cpp ggml model header: magic, then 11 int32 hyperparameters
+GGML_MAGIC = 0x67676D6C
+GGML_HPARAMS = ("n_vocab", "n_audio_ctx", "n_audio_state", "n_audio_head", "n_audio_layer",
+                "n_text_ctx", "n_text_state", "n_text_head", "n_text_layer", "n_mels", "ftype")
+GGML_QNT_VERSION_FACTOR = 1000  # ftype carries the quantization version in its thousands
+GGML_FTYPES = {0: "f32", 1: "f16", 2: "q4_0", 3: "q4_1", 7: "q8_0", 8: "q5_0", 9: "q5_1",
+               10: "q2_k", 11: "q3_k", 12: "q4_k", 13: "q5_k", 14: "q6_k"}
+WHISPER_SIZES = {4: "tiny", 6: "base", 12: "small", 24: "medium", 32: "large"}
+WHISPER_MULTILINGUAL_VOCAB = 51865  # English-only (.en) models have a smaller vocabulary
+
 VIDEO_ENCODER_OPTIONS = [
     ("H.264", "h264"),
     ("H.265 / HEVC", "h265"),
     ("AV1 (SVT)", "av1"),
 ]
 DEFAULT_VIDEO_ENCODER = "h264"
+# ffmpeg video options per target encoder.
+ENCODER_SETTINGS = {
+    "h264": {"vcodec": "libx264", "preset": "fast", "crf": 28},
+    "h265": {"vcodec": "libx265", "preset": "fast", "crf": 30},
+    # Replicate Handbrake AV1 (SVT) settings from user logs:
+    # preset 6, tune=psnr, profile main (default), crf 34.50 (RF), level auto
+    "av1": {"vcodec": "libsvtav1", "preset": 6, "crf": 34.5, "svtav1-params": "tune=1"},
+}
+# Presets each encoder can be switched to, fastest first (ENCODER_SETTINGS holds the default one)
+X26X_PRESETS = ("ultrafast", "superfast", "veryfast", "faster", "fast", "medium", "slow")
+ENCODER_PRESETS = {"h264": X26X_PRESETS, "h265": X26X_PRESETS, "av1": (12, 10, 8, 6, 4)}
+# Preset setting that picks the slowest preset predicted to finish within the target encode time
+AUTO_PRESET = "auto"
+DEFAULT_TARGET_ENCODE_MINUTES = 30
+# Segment-parallel encode: per-encoder option capping the threads of one segment's encoder
+SEGMENT_THREAD_OPTIONS = {"h264": ("threads", "{n}"), "h265": ("x265-params", "pools={n}"), "av1": ("svtav1-params", "lp={n}")}
+# Segments shorter than this are not worth an extra encoder start-up (and lookahead) each
+MIN_ENCODE_SEGMENT_S = 20
+# Pre-flight encode estimate: sample clips spread over the cut, encoded with each preset
+ESTIMATE_SAMPLES = 3
+ESTIMATE_SAMPLE_S = 4
+# ffprobe codec names that can be stream-copied (or smart cut) into each target encoder.
+ENCODER_SOURCE_CODECS = {
+    "h264": ("h264", "avc1"),
+    "h265": ("hevc", "hev1", "hvc1"),
+}
+# MP4 sample entries that allow the in-band parameter sets a smart-cut join carries.
+SMART_CUT_TAGS = {"h264": "avc3", "h265": "hev1"}
+# Sample entries for a plain stream copy: ffmpeg writes HEVC as hev1 by default, which QuickTime and iOS reject.
+COPY_TAGS = {"h265": "hvc1"}
+KEYFRAME_SEARCH_WINDOW_S = 30  # how far past in/out (and before out) we look for keyframes
+
+VIDEO_EXTENSIONS = (".mp4", ".mov", ".mkv")
+# Timeline range shown while neither ffprobe nor VLC has reported the real duration.
+PLACEHOLDER_DURATION_MS = 600000
+
+# Energy VAD used to pick chunk boundaries for parallel transcription
+VAD_FRAME_MS = 30
+VAD_SEARCH_WINDOW_S = 30  # how far from an even split we look for a pause
+VAD_MIN_PAUSE_MS = 300  # smoothing window; split in the quietest stretch this long
+
+# Checkpointed stages of one extract/transcribe job, in order
+JOB_STAGES = ("probe", "video", "audio", "transcribe")
+# A resumed stage output must be within this much of the expected in/out duration
+DURATION_TOLERANCE_MS = 1500
+# Job statuses after which its checkpoints no longer change (a re-queued identical job may inherit them)
+FINISHED_JOB_STATUSES = ("done", "failed", "cancelled")
+# Worker pool sizes of the pipelined scheduler, per stage
+DEFAULT_STAGE_LIMITS = {"probe": 2, "video": 1, "audio": 1, "transcribe": 1}
+DEFAULT_STAGE_QUEUE_SIZE = 2
+
+WHISPER_SEGMENT_RE = re.compile(
+    r"^\[(\d+):(\d+):(\d+)\.(\d+) --> (\d+):(\d+):(\d+)\.(\d+)\]\s*(.*)$"
+)
+# whisper-cli -pp prints "whisper_print_progress_callback: progress =  42%" to stderr
+WHISPER_PROGRESS_RE = re.compile(r"progress\s*=\s*(\d+)%")
+PROGRESS_INTERVAL_S = 0.5  # minimum time between progress signals of one job
+# Process supervisor: how often a running child checks for cancel, and how much stderr is kept for errors
+CANCEL_POLL_S = 0.02
+STDERR_TAIL_LINES = 20
+# "-progress pipe:2" writes key=value lines; out_time_us is the output position in microseconds
+FFMPEG_PROGRESS_RE = re.compile(r"^(\w+)=(.*)$")
+# Resident whisper-server: waits for the model to load, and how many models stay loaded at once (~3 GB each)
+WHISPER_SERVER_START_TIMEOUT_S = 300
+WHISPER_SERVER_MAX_RESIDENT = 1
+# Overview waveform: low-rate mono decode, reduced to peak/RMS per 10 ms bin, then halved per pyramid level
+WAVEFORM_SAMPLE_RATE = 2000
+WAVEFORM_BIN_SAMPLES = 20
+WAVEFORM_BLOCK_BINS = 1 << 16  # bins reduced per memory-mapped block
+# Filmstrip: keyframe thumbnails tiled into JPEG sprite sheets
+THUMBNAIL_WIDTH = 160
+THUMBNAIL_HEIGHT = 90
+THUMBNAIL_TILE = (10, 10)  # columns x rows per sheet
+THUMBNAIL_MIN_INTERVAL_S = 5
+THUMBNAIL_MAX_COUNT = 720  # longer recordings get a wider spacing
+# Playback proxy: small short-GOP H.264 stand-in for sources that are heavy to decode
+PROXY_HEIGHT = 360
+PROXY_GOP_FRAMES = 15  # a keyframe every ~0.5 s, so any seek decodes only a few frames
+PROXY_MIN_SOURCE_HEIGHT = 1080  # sources taller than this get a proxy...
+PROXY_SOURCE_CODECS = ("hevc", "av1", "vp9")  # ...as do these codecs at any size
+# Seek controller: a seek counts as done when VLC reports the new time, or after this long
+SEEK_TIMEOUT_MS = 300
+SEEK_LATENCY_SAMPLES = 200  # recent seek-to-frame latencies kept for the stats
+# Sermon in/out suggestion: one speech/music/silence label per second of 16 kHz audio
+LABEL_SILENCE, LABEL_MUSIC, LABEL_SPEECH = 0, 1, 2
+SUGGEST_SAMPLE_RATE = 16000
+SUGGEST_FRAME_SAMPLES = 400  # 25 ms analysis frames, 40 per labelled second
+SUGGEST_BLOCK_S = 60  # seconds analysed per memory-mapped block
+SUGGEST_SILENCE_DB = 40  # this far below the loud (95th percentile) level counts as silence
+SUGGEST_LOW_ENERGY_RATIO = 0.2  # speech: many frames in each second well below its mean energy
+SUGGEST_HIGH_ZCR_RATIO = 0.08  # speech: unvoiced consonants give frames of high zero-crossing rate
+SUGGEST_SMOOTH_S = 5  # majority vote over this many seconds
+SUGGEST_MAX_GAP_S = 20  # pauses (or a short hymn verse) up to this long do not end the sermon
+# Non-speech stripped from the whisper input: runs at least this long, keeping STRIP_PAD_S at each edge
+DEFAULT_STRIP_MIN_GAP_S = 5
+STRIP_PAD_S = 1
+
+
+# python-vlc, imported by load_vlc() on first use: loading libvlc and its plugins is most of a cold start.
+vlc = None
+
+
+def load_vlc():
+    global vlc
+    if vlc is None:
+        import vlc
+    return vlc
 
 
 def load_config():
@@ -61,14 +220,55 @@ def save_config(config):
         print(f"Failed to save config: {e}")
 
 
-def get_installed_models():
-    """Discover whisper models from the default models directory (ggml-*.bin files)."""
-    models = []
-    if os.path.isdir(DEFAULT_MODELS_DIR):
-        for f in os.listdir(DEFAULT_MODELS_DIR):
-            if f.startswith("ggml-") and f.endswith(".bin"):
-                models.append(f)
-    return sorted(models)
+def get_installed_models(model_dirs=None):
+    """Discover whisper models (ggml-*.bin files) in the model directories. Returns their paths sorted by
+    file name; when two directories hold the same file name, the first directory wins.
+    """
+    models = {}
+    for directory in model_dirs or [DEFAULT_MODELS_DIR]:
+        if os.path.isdir(directory):
+            for f in os.listdir(directory):
+                if f.startswith("ggml-") and f.endswith(".bin"):
+                    models.setdefault(f, os.path.join(directory, f))
+    return [models[name] for name in sorted(models)]
+
+
+def resolve_model_path(model, model_dirs=None):
+    """A model given as a path, or as a file name looked up in the model directories."""
+    if os.path.sep in model:
+        return model
+    for directory in model_dirs or [DEFAULT_MODELS_DIR]:
+        candidate = os.path.join(directory, model)
+        if os.path.isfile(candidate):
+            return candidate
+    return os.path.join(DEFAULT_MODELS_DIR, model)
+
+
+def read_ggml_header(path):
+    """Type, quantization and hyperparameters from a whisper.cpp ggml model's header, or None if it is not one."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read(4 * (1 + len(GGML_HPARAMS)))
+    except OSError:
+        return None
+    if len(data) < 4 * (1 + len(GGML_HPARAMS)):
+        return None
+    magic, *values = struct.unpack(f"<I{len(GGML_HPARAMS)}i", data)
+    if magic != GGML_MAGIC:
+        return None
+    header = dict(zip(GGML_HPARAMS, values))
+    size = WHISPER_SIZES.get(header["n_audio_layer"], f"{header['n_audio_layer']}-layer")
+    if size == "large":
+        if header["n_mels"] == 128:
+            size += "-v3"
+        if header["n_text_layer"] < header["n_audio_layer"]:
+            size += "-turbo"  # full encoder, pruned decoder
+    if header["n_vocab"] < WHISPER_MULTILINGUAL_VOCAB:
+        size += ".en"
+    ftype = header["ftype"] % GGML_QNT_VERSION_FACTOR
+    header["type"] = size
+    header["quantization"] = GGML_FTYPES.get(ftype, f"ftype {ftype}")
+    return header
 
 
 def get_default_whisper_cli():
@@ -96,192 +296,2852 @@ def get_default_whisper_cli():
         if c and os.path.isfile(c) and os.access(c, os.X_OK):
             return c
 
-    # 3. Absolute fallback (may not exist; user will be prompted to set via settings)
-    return DEFAULT_WHISPER_CLI
+    # 3. Absolute fallback (may not exist; user will be prompted to set via settings)
+    return DEFAULT_WHISPER_CLI
+
+
+def probe_duration_ms(path):
+    """Container duration of a media file in milliseconds via ffprobe, or None if it cannot be read."""
+    info = media_info(path)
+    return info.duration_ms if info else None
+
+
+def parse_timestamp_ms(value):
+    """Parse seconds (number or numeric string) or "[HH:]MM:SS[.mmm]" into milliseconds. None/"" -> None."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value * 1000)
+    text = str(value).strip()
+    if not text:
+        return None
+    seconds = 0.0
+    for part in text.split(":"):
+        seconds = seconds * 60 + float(part)
+    return int(round(seconds * 1000))
+
+
+def file_fingerprint(path, block=1 << 20):
+    """Fast content hash: file size plus SHA-1 of the first, middle and last `block` bytes
+    (the whole file when it is small). Returns None if the file cannot be read.
+    """
+    try:
+        size = os.path.getsize(path)
+        digest = hashlib.sha1(str(size).encode())
+        with open(path, "rb") as f:
+            if size <= 3 * block:
+                digest.update(f.read())
+            else:
+                for offset in (0, (size - block) // 2, size - block):
+                    f.seek(offset)
+                    digest.update(f.read(block))
+        return f"{size}-{digest.hexdigest()}"
+    except OSError:
+        return None
+
+
+def describe_output(path, expected_duration_ms=None):
+    """Record what a finished stage wrote, so a later resume can tell whether it is still intact."""
+    record = {"path": path, "fingerprint": file_fingerprint(path)}
+    if expected_duration_ms is not None:
+        record["expected_duration_ms"] = expected_duration_ms
+    return record
+
+
+def output_still_valid(record):
+    """True if a checkpointed output is unchanged and (for media) its ffprobe duration still matches."""
+    path = record.get("path")
+    if not path or not os.path.isfile(path):
+        return False
+    if file_fingerprint(path) != record.get("fingerprint"):
+        return False
+    expected = record.get("expected_duration_ms")
+    if expected:
+        actual = probe_duration_ms(path)
+        # No ffprobe -> trust the content hash alone
+        if actual is not None and abs(actual - expected) > DURATION_TOLERANCE_MS:
+            return False
+    return True
+
+
+class ProcessResult:
+    """How a supervised child process ended, with its resource usage (None where the platform has no wait4)."""
+
+    def __init__(self, args, returncode, cancelled, wall_s, usage, stdout, stderr_tail):
+        self.args = args
+        self.returncode = returncode
+        self.cancelled = cancelled
+        self.wall_s = wall_s
+        self.user_s = usage.ru_utime if usage else None
+        self.sys_s = usage.ru_stime if usage else None
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        self.max_rss_bytes = (usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)) if usage else None
+        self.stdout = stdout
+        self.stderr_tail = stderr_tail
+
+    @property
+    def ok(self):
+        return self.returncode == 0 and not self.cancelled
+
+    def error_line(self):
+        return self.stderr_tail[-1] if self.stderr_tail else f"exit status {self.returncode}"
+
+
+class ProcessSupervisor:
+    """Runs every child process (ffmpeg, ffprobe, whisper) under one asyncio loop on a background thread.
+
+    Both output streams are drained concurrently, line by line (a chatty stderr can never fill its pipe),
+    and a child is polled for cancel every CANCEL_POLL_S. Cancelling kills its whole process group at once
+    (just the child on Windows).
+    Each child is reaped with wait4 where available (Popen.wait elsewhere), and its exit status and
+    resource usage go to PROCESS_LOG_PATH.
+    Callers stay synchronous: start() returns a concurrent.futures.Future of the ProcessResult.
+    """
+
+    def __init__(self, log_path=PROCESS_LOG_PATH):
+        self.log_path = log_path
+        self._loop = None
+        self._lock = threading.Lock()
+        # Reaping blocks in wait4 (or Popen.wait), one thread per running child; on Windows the pipes
+        # are drained on these threads too
+        self._reapers = ThreadPoolExecutor(max_workers=64, thread_name_prefix="reaper")
+
+    def _event_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="process-supervisor", daemon=True).start()
+            return self._loop
+
+    def start(self, args, is_cancelled=None, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+              on_stdout_line=None, on_stderr_line=None, capture_stdout=False, timeout=None):
+        """Spawn args now (so fds passed as stdin/stdout may be closed on return) and supervise it.
+        on_*_line(text) are called on the supervisor thread; capture_stdout collects stdout into the result.
+        """
+        pipe_stdout = bool(on_stdout_line or capture_stdout)
+        process = subprocess.Popen(
+            args,
+            stdin=stdin,
+            stdout=subprocess.PIPE if pipe_stdout else stdout,
+            stderr=subprocess.PIPE,
+            # Own process group, so cancel also reaches anything the child started
+            start_new_session=(os.name == "posix"),
+        )
+        return asyncio.run_coroutine_threadsafe(
+            self._supervise(process, list(args), is_cancelled, on_stdout_line, on_stderr_line, capture_stdout,
+                            timeout),
+            self._event_loop(),
+        )
+
+    def run(self, args, **kwargs):
+        return self.start(args, **kwargs).result()
+
+    async def _supervise(self, process, args, is_cancelled, on_stdout_line, on_stderr_line, capture_stdout, timeout):
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+        stdout_lines = [] if capture_stdout else None
+
+        def on_stderr(line):
+            stderr_tail.append(line)
+            if on_stderr_line:
+                on_stderr_line(line)
+
+        def on_stdout(line):
+            if stdout_lines is not None:
+                stdout_lines.append(line)
+            if on_stdout_line:
+                on_stdout_line(line)
+
+        drains = [self._drain(process.stderr, on_stderr)]
+        if process.stdout is not None:
+            drains.append(self._drain(process.stdout, on_stdout))
+        draining = asyncio.gather(*drains)
+        reaping = loop.run_in_executor(self._reapers, self._reap, process)
+        cancelled = False
+        while not reaping.done():
+            await asyncio.wait([reaping], timeout=CANCEL_POLL_S)
+            if reaping.done():
+                break
+            timed_out = timeout is not None and time.perf_counter() - started > timeout
+            if timed_out or (is_cancelled and is_cancelled()):
+                self._kill(process)
+                cancelled = True
+                break
+        returncode, usage = await reaping
+        await draining
+        result = ProcessResult(args, returncode, cancelled, time.perf_counter() - started, usage,
+                               "\n".join(stdout_lines) if stdout_lines is not None else None, list(stderr_tail))
+        self._log(result)
+        return result
+
+    async def _drain(self, pipe, on_line):
+        """Read a pipe to EOF, handing over each line (split at \\n or \\r, as ffmpeg's stats use \\r)."""
+        loop = asyncio.get_running_loop()
+        if os.name != "posix":
+            # Popen's pipes on Windows are not overlapped, so the loop cannot watch them; read on a thread.
+            await loop.run_in_executor(self._reapers, self._drain_blocking, pipe, on_line)
+            return
+        reader = asyncio.StreamReader()
+        transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), pipe)
+        pending = b""
+        try:
+            while True:
+                data = await reader.read(1 << 16)
+                if not data:
+                    break
+                pending = self._split_lines(pending + data, on_line)
+            if pending:
+                on_line(pending.decode(errors="replace"))
+        finally:
+            transport.close()
+
+    @classmethod
+    def _drain_blocking(cls, pipe, on_line):
+        pending = b""
+        try:
+            while data := os.read(pipe.fileno(), 1 << 16):
+                pending = cls._split_lines(pending + data, on_line)
+            if pending:
+                on_line(pending.decode(errors="replace"))
+        finally:
+            pipe.close()
+
+    @staticmethod
+    def _split_lines(data, on_line):
+        """Hand over each complete line in data; returns the incomplete rest."""
+        lines = re.split(rb"\r\n|\r|\n", data)
+        for line in lines[:-1]:
+            on_line(line.decode(errors="replace"))
+        return lines[-1]
+
+    @staticmethod
+    def _reap(process):
+        if hasattr(os, "wait4"):
+            _, status, usage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            return process.returncode, usage
+        return process.wait(), None
+
+    @staticmethod
+    def _kill(process):
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def _log(self, result):
+        try:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            new_file = not os.path.exists(self.log_path)
+            with open(self.log_path, "a", newline="") as f:
+                writer = csv.writer(f)
+                if new_file:
+                    writer.writerow(["finished", "program", "exit_status", "cancelled", "wall_s", "user_s",
+                                     "sys_s", "max_rss_mb", "arguments"])
+                writer.writerow([
+                    datetime.now().isoformat(timespec="seconds"), os.path.basename(result.args[0]),
+                    result.returncode, int(result.cancelled), f"{result.wall_s:.2f}",
+                    f"{result.user_s:.2f}" if result.user_s is not None else "",
+                    f"{result.sys_s:.2f}" if result.sys_s is not None else "",
+                    f"{result.max_rss_bytes / 1024**2:.0f}" if result.max_rss_bytes is not None else "",
+                    " ".join(result.args[1:])[:500],
+                ])
+        except Exception as e:
+            print(f"Failed to log process: {e}")
+
+
+SUPERVISOR = ProcessSupervisor()
+
+
+def run_cancellable(args, is_cancelled=None, stdout=subprocess.DEVNULL):
+    """Run a command, stopping it if is_cancelled() turns true. stdout may be a file to capture output in.
+    Returns True if it ran to completion with exit status 0.
+    """
+    return SUPERVISOR.run(args, is_cancelled=is_cancelled, stdout=stdout).ok
+
+
+def ffmpeg_with_progress(args):
+    """ffmpeg arguments that report progress as key=value lines on stderr instead of the \\r stats line."""
+    return [args[0], "-nostats", "-progress", "pipe:2", *args[1:]]
+
+
+def decode_mono_pcm(path, raw_path, rate, is_cancelled=None):
+    """Decode the first audio stream of path to raw s16le mono at `rate`.
+    Returns False if ffmpeg fails or is cancelled.
+    """
+    decode = FFmpeg().option("y").input(path).output(
+        raw_path, map="0:a:0", ac=1, ar=rate, f="s16le", acodec="pcm_s16le"
+    )
+    return run_cancellable(decode.arguments, is_cancelled)
+
+
+def source_identity_key(path):
+    """Cache key for derived data of a source file (waveform, thumbnails): its path, size and mtime."""
+    st = os.stat(path)
+    return ResultCache.key(os.path.abspath(path), st.st_size, st.st_mtime_ns)
+
+
+def audio_second_features(samples, rate=SUGGEST_SAMPLE_RATE):
+    """Per-second features of float32 mono samples (whole seconds only), computed for all seconds at once:
+    (level in dBFS, low-energy frame ratio, high zero-crossing-rate frame ratio, mean spectral flux).
+    """
+    per_second = rate // SUGGEST_FRAME_SAMPLES
+    n = len(samples) // rate
+    frames = samples[:n * rate].reshape(n, per_second, -1)
+    energy = (frames * frames).mean(axis=2)
+    level_db = 10 * np.log10(energy.mean(axis=1) + 1e-10)
+    low_energy = (energy < 0.5 * energy.mean(axis=1, keepdims=True)).mean(axis=1)
+    zcr = (np.signbit(frames[:, :, 1:]) != np.signbit(frames[:, :, :-1])).mean(axis=2)
+    high_zcr = (zcr > 1.5 * zcr.mean(axis=1, keepdims=True)).mean(axis=1)
+    spectrum = np.abs(np.fft.rfft(frames * np.hanning(frames.shape[2]).astype(np.float32), axis=2))
+    spectrum /= spectrum.sum(axis=2, keepdims=True) + 1e-10
+    flux = (np.diff(spectrum, axis=1) ** 2).sum(axis=2).mean(axis=1)
+    return level_db, low_energy, high_zcr, flux
+
+
+def classify_audio(samples, rate=SUGGEST_SAMPLE_RATE, is_cancelled=None):
+    """Label each second of int16 mono samples (e.g. a memmap) as LABEL_SILENCE, LABEL_MUSIC or LABEL_SPEECH.
+
+    Speech alternates syllables and short gaps, so within a second it has many low-energy frames, bursts of
+    high zero-crossing rate and a changing spectrum; sustained music has none of the three.
+    A second is speech when at least two of those hold; labels are then smoothed by majority vote.
+    Returns None if cancelled.
+    """
+    is_cancelled = is_cancelled or (lambda: False)
+    block = SUGGEST_BLOCK_S * rate
+    features = []
+    for start in range(0, len(samples) // rate * rate, block):
+        if is_cancelled():
+            return None
+        chunk = np.asarray(samples[start:start + block], dtype=np.float32) / 32768.0
+        features.append(audio_second_features(chunk, rate))
+    if not features:
+        return np.zeros(0, dtype=np.int8)
+    level_db, low_energy, high_zcr, flux = (np.concatenate(f) for f in zip(*features))
+
+    silent = level_db < max(np.percentile(level_db, 95) - SUGGEST_SILENCE_DB, -90)
+    flux_threshold = np.median(flux[~silent]) if (~silent).any() else 0.0
+    votes = (
+        (low_energy >= SUGGEST_LOW_ENERGY_RATIO).astype(np.int8)
+        + (high_zcr >= SUGGEST_HIGH_ZCR_RATIO)
+        + (flux >= flux_threshold)
+    )
+    speech = (votes >= 2) & ~silent
+    window = np.ones(SUGGEST_SMOOTH_S)
+    speech = np.convolve(speech, window, mode="same") > SUGGEST_SMOOTH_S / 2
+    silent = np.convolve(silent, window, mode="same") > SUGGEST_SMOOTH_S / 2
+
+    labels = np.full(len(level_db), LABEL_MUSIC, dtype=np.int8)
+    labels[silent] = LABEL_SILENCE
+    labels[speech] = LABEL_SPEECH
+    return labels
+
+
+def longest_speech_block(labels, max_gap_s=SUGGEST_MAX_GAP_S):
+    """(start_s, end_s) of the longest run of speech seconds, bridging non-speech gaps up to max_gap_s."""
+    speech = np.flatnonzero(labels == LABEL_SPEECH)
+    if not len(speech):
+        return None
+    # Split wherever consecutive speech seconds are further apart than the allowed gap.
+    breaks = np.flatnonzero(np.diff(speech) > max_gap_s + 1)
+    starts = np.concatenate([[speech[0]], speech[breaks + 1]])
+    ends = np.concatenate([speech[breaks], [speech[-1]]]) + 1
+    best = int(np.argmax(ends - starts))
+    return int(starts[best]), int(ends[best])
+
+
+class JobQueue:
+    """Extract/transcribe jobs persisted to JOBS_PATH, with a checkpoint per finished stage.
+
+    Each job is a plain dict (id, input_file, in/out points, options, status, message, stages).
+    Stage checkpoints are written from the worker thread, so all access goes through a lock.
+    """
+
+    def __init__(self, path=JOBS_PATH):
+        self.path = path
+        self._lock = threading.RLock()
+        self._jobs = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                jobs = json.load(f)
+        except Exception:
+            return []
+        for job in jobs:
+            # A job that was running when the app closed or crashed resumes from its checkpoints.
+            if job.get("status") == "running":
+                job["status"] = "queued"
+                job["message"] = "Interrupted; will resume"
+        return jobs
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self._jobs, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"Failed to save job queue: {e}")
+
+    def jobs(self):
+        with self._lock:
+            return json.loads(json.dumps(self._jobs))
+
+    def get(self, job_id):
+        with self._lock:
+            for job in self._jobs:
+                if job["id"] == job_id:
+                    return json.loads(json.dumps(job))
+        return None
+
+    def add(self, input_file, in_point, out_point, base_name, options):
+        job = {
+            "id": uuid.uuid4().hex,
+            "input_file": input_file,
+            "in_point": in_point,
+            "out_point": out_point,
+            "base_name": base_name,
+            "options": options,
+            "source": file_fingerprint(input_file),
+            "status": "queued",
+            "message": "Queued",
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "stages": {},
+        }
+        with self._lock:
+            # Re-running the same cut with the same options picks up whatever the last run finished
+            # (not a queued or running one: its stages are still being written).
+            for previous in reversed(self._jobs):
+                if previous.get("status") not in FINISHED_JOB_STATUSES:
+                    continue
+                if (previous["input_file"], previous["in_point"], previous["out_point"], previous["options"]) == (
+                    input_file, in_point, out_point, options
+                ) and previous.get("source") == job["source"]:
+                    job["stages"] = dict(previous.get("stages", {}))
+                    break
+            self._jobs.append(job)
+            self._save()
+        return job
+
+    def update(self, job_id, **fields):
+        with self._lock:
+            for job in self._jobs:
+                if job["id"] == job_id:
+                    job.update(fields)
+                    self._save()
+                    return
+
+    def remove(self, job_id):
+        with self._lock:
+            self._jobs = [job for job in self._jobs if job["id"] != job_id]
+            self._save()
+
+    def next_queued(self):
+        with self._lock:
+            for job in self._jobs:
+                if job.get("status") == "queued":
+                    return json.loads(json.dumps(job))
+        return None
+
+    def checkpoint(self, job_id, stage, outputs, info=None):
+        """Mark one stage finished, with the outputs it wrote (see describe_output).
+        Returns False (recording nothing) if an output fails the checks a resume would make.
+        """
+        if not all(output_still_valid(output) for output in outputs):
+            return False
+        with self._lock:
+            for job in self._jobs:
+                if job["id"] == job_id:
+                    job.setdefault("stages", {})[stage] = {
+                        "finished": datetime.now().isoformat(timespec="seconds"),
+                        "outputs": outputs,
+                        "info": info or {},
+                    }
+                    self._save()
+                    return True
+        return False
+
+    def valid_stage(self, job_id, stage):
+        """The stage's checkpoint if it finished and its outputs are still intact, else None."""
+        job = self.get(job_id)
+        record = (job or {}).get("stages", {}).get(stage)
+        if record and all(output_still_valid(output) for output in record.get("outputs", [])):
+            return record
+        return None
+
+    def verify_source(self, job_id):
+        """Drop all checkpoints if the source file changed since the job was queued."""
+        with self._lock:
+            for job in self._jobs:
+                if job["id"] == job_id:
+                    current = file_fingerprint(job["input_file"])
+                    if current != job.get("source"):
+                        job["source"] = current
+                        job["stages"] = {}
+                        self._save()
+                    return
+
+
+def model_fingerprint(model_path):
+    """Identify a whisper model by file name, size and mtime (cheap; models are multi-GB)."""
+    try:
+        st = os.stat(model_path)
+        return f"{os.path.basename(model_path)}:{st.st_size}:{int(st.st_mtime)}"
+    except OSError:
+        return os.path.basename(model_path or "")
+
+
+# Outputs people open and edit in place; always copied so an edit can never reach the cache.
+EDITABLE_OUTPUT_EXTENSIONS = (".txt", ".srt", ".vtt", ".json")
+
+
+def _link_or_copy(src, dst):
+    """Hard-link media when src and dst share a filesystem (instant), otherwise copy."""
+    tmp_dst = f"{dst}.tmp"
+    if os.path.exists(tmp_dst):
+        os.remove(tmp_dst)
+    if not src.lower().endswith(EDITABLE_OUTPUT_EXTENSIONS):
+        try:
+            os.link(src, tmp_dst)
+            os.replace(tmp_dst, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, tmp_dst)
+    os.replace(tmp_dst, dst)
+
+
+class ProbeCache:
+    """ffprobe results keyed by absolute path, valid while the file's size and mtime are unchanged.
+
+    Held in memory and mirrored to PROBE_CACHE_PATH, so reopening a recording (or resuming a batch)
+    does not launch ffprobe again. Each entry holds named fields ("probe", "keyframes").
+    """
+
+    def __init__(self, path=PROBE_CACHE_PATH, max_entries=PROBE_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = None
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"Failed to save {os.path.basename(self.path)}: {e}")
+
+    @staticmethod
+    def _stat(media_path):
+        try:
+            st = os.stat(media_path)
+        except OSError:
+            return None
+        return [st.st_size, st.st_mtime_ns]
+
+    def get(self, media_path, field):
+        stat = self._stat(media_path)
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load()
+            entry = self._entries.get(os.path.abspath(media_path))
+            if not entry or stat is None or entry.get("stat") != stat:
+                return None
+            return entry.get(field)
+
+    def put(self, media_path, field, value):
+        stat = self._stat(media_path)
+        if stat is None:
+            return
+        key = os.path.abspath(media_path)
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load()
+            entry = self._entries.pop(key, None)
+            if not entry or entry.get("stat") != stat:
+                entry = {"stat": stat}
+            entry[field] = value
+            # Re-inserted last, so the oldest entries are the first dropped.
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._save()
+
+
+PROBE_CACHE = ProbeCache()
+
+
+class ModelRegistry:
+    """Whisper model files with their ggml header metadata and recorded benchmark results.
+
+    Stored like the probe cache (keyed by path, dropped when the file's size or mtime changes), so a
+    re-downloaded model is re-read and needs benchmarking again.
+    """
+
+    def __init__(self, path=MODEL_REGISTRY_PATH):
+        self.store = ProbeCache(path)
+
+    def info(self, model_path):
+        header = self.store.get(model_path, "header")
+        if header is None:
+            header = read_ggml_header(model_path) or {}
+            self.store.put(model_path, "header", header)
+        return header
+
+    def benchmarks(self, model_path):
+        return self.store.get(model_path, "benchmarks") or []
+
+    def record_benchmark(self, model_path, result):
+        """Keep result (a dict with a "profile" of threads / beam size), replacing any earlier run of that profile."""
+        results = [r for r in self.benchmarks(model_path) if r.get("profile") != result.get("profile")]
+        self.store.put(model_path, "benchmarks", results + [result])
+
+    def fastest(self, model_path):
+        return max(self.benchmarks(model_path), key=lambda r: r["realtime_factor"], default=None)
+
+    def describe(self, model_path):
+        """Label for the model combo: name, type / quantization, size, and the fastest measured speed."""
+        header = self.info(model_path)
+        label = os.path.basename(model_path)
+        details = [" ".join(v for v in (header.get("type"), header.get("quantization")) if v) or "unrecognized format"]
+        try:
+            details.append(f"{os.path.getsize(model_path) / 1024**3:.1f} GB")
+        except OSError:
+            pass
+        best = self.fastest(model_path)
+        if best:
+            # Minutes per hour of audio is what the turnaround deadline is measured in
+            speed = f"{best['realtime_factor']:.1f}x realtime (~{60 / best['realtime_factor']:.1f} min/hour)"
+            if best.get("wer") is not None:
+                speed += f", WER {best['wer'] * 100:.0f}%"
+            details.append(speed)
+        return f"{label} — {', '.join(d for d in details if d)}"
+
+
+class MediaInfo:
+    """Codec, duration, audio layout and keyframes of one media file, from a single
+    `ffprobe -show_streams -show_format` run (see media_info(), which caches it).
+    """
+
+    def __init__(self, path, probe, cache=PROBE_CACHE):
+        self.path = path
+        self.cache = cache
+        self.format = probe.get("format", {})
+        streams = probe.get("streams", [])
+        self.video = next((st for st in streams if st.get("codec_type") == "video"), {})
+        self.audio = next((st for st in streams if st.get("codec_type") == "audio"), {})
+
+    @staticmethod
+    def _float(value, default=None):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return default
+
+    @property
+    def video_codec(self):
+        return (self.video.get("codec_name") or "").lower()
+
+    @property
+    def video_height(self):
+        return int(self.video.get("height") or 0)
+
+    @property
+    def duration_ms(self):
+        duration = self._float(self.format.get("duration"))
+        return int(duration * 1000) if duration is not None else None
+
+    @property
+    def start_time(self):
+        """Timestamp of the first packet; ffmpeg -ss positions are relative to this."""
+        return self._float(self.format.get("start_time"), 0.0)
+
+    @property
+    def has_audio(self):
+        return bool(self.audio)
+
+    @property
+    def audio_channels(self):
+        return int(self.audio.get("channels") or 0)
+
+    @property
+    def audio_layout(self):
+        return self.audio.get("channel_layout") or ""
+
+    @property
+    def audio_sample_rate(self):
+        return int(self.audio.get("sample_rate") or 0)
+
+    def _probe_keyframes(self, intervals=None, is_cancelled=None):
+        cmd = ["ffprobe", "-v", "error", "-select_streams", "v:0"]
+        if intervals:
+            cmd += ["-read_intervals", intervals]
+        cmd += ["-show_entries", "packet=pts_time,flags", "-of", "csv=p=0", self.path]
+        try:
+            # Output goes to a file: a full scan of a long recording lists millions of packets.
+            with tempfile.TemporaryFile(mode="w+") as output:
+                if not run_cancellable(cmd, is_cancelled, stdout=output):
+                    return []
+                output.seek(0)
+                lines = output.read().splitlines()
+        except OSError:
+            return []
+        keyframes = set()
+        for line in lines:
+            pts_time, _, flags = line.partition(",")
+            if "K" in flags and pts_time not in ("", "N/A"):
+                keyframes.add(round(float(pts_time) - self.start_time, 6))
+        return sorted(keyframes)
+
+    def keyframes(self, is_cancelled=None):
+        """Every keyframe time (seconds from the start of the file). Reads all packet headers once;
+        the index is cached with the probe.
+        """
+        cached = self.cache.get(self.path, "keyframes")
+        if cached is not None:
+            return cached
+        keyframes = self._probe_keyframes(is_cancelled=is_cancelled)
+        if keyframes:
+            self.cache.put(self.path, "keyframes", keyframes)
+        return keyframes
+
+    def keyframes_near(self, around_s, window_s=KEYFRAME_SEARCH_WINDOW_S):
+        """Keyframe times within window_s of each time in around_s. Uses the full index if it has
+        been built; otherwise only packet headers in those windows are read.
+        """
+        cached = self.cache.get(self.path, "keyframes")
+        if cached is None:
+            intervals = ",".join(
+                f"{max(0.0, self.start_time + t - window_s):.3f}%+{2 * window_s}" for t in around_s
+            )
+            cached = self._probe_keyframes(intervals)
+        return [k for k in cached if any(abs(k - t) <= window_s for t in around_s)]
+
+
+def media_info(path, cache=PROBE_CACHE):
+    """MediaInfo for path, probing it at most once per file version. None if ffprobe cannot read it."""
+    if not path:
+        return None
+    probe = cache.get(path, "probe")
+    if probe is None:
+        try:
+            result = SUPERVISOR.run(
+                ["ffprobe", "-v", "error", "-show_streams", "-show_format", "-of", "json", path],
+                capture_stdout=True, timeout=15,
+            )
+            probe = json.loads(result.stdout or "null") if result.ok else None
+        except (OSError, ValueError):
+            return None
+        if not probe or not probe.get("format"):
+            return None
+        cache.put(path, "probe", probe)
+    return MediaInfo(path, probe, cache)
+
+
+def suggest_sermon_points(path, is_cancelled=None, cache=PROBE_CACHE):
+    """Suggested (in_ms, out_ms) around the longest continuous speech block of path's audio, or None.
+    Cached per file version with its probe, so reopening a file (or a batch re-run) does not re-analyse it.
+    """
+    cached = cache.get(path, "sermon_suggestion")
+    if cached is not None:
+        return tuple(cached) if cached else None
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=CACHE_DIR) as work:
+        raw_path = os.path.join(work, "audio.raw")
+        if not decode_mono_pcm(path, raw_path, SUGGEST_SAMPLE_RATE, is_cancelled):
+            return None
+        points = sermon_points_from_raw(raw_path, is_cancelled)
+    if points is None:
+        return None
+    cache.put(path, "sermon_suggestion", points)
+    return tuple(points) if points else None
+
+
+def sermon_points_from_raw(raw_path, is_cancelled=None):
+    """[in_ms, out_ms] of the longest speech block in raw s16le mono samples at SUGGEST_SAMPLE_RATE,
+    [] if there is none, or None if cancelled. (The cacheable form of suggest_sermon_points.)
+    """
+    if not os.path.getsize(raw_path):
+        return []
+    samples = np.memmap(raw_path, dtype="<i2", mode="r")
+    labels = classify_audio(samples, SUGGEST_SAMPLE_RATE, is_cancelled)
+    del samples
+    if labels is None:
+        return None
+    block = longest_speech_block(labels)
+    return [block[0] * 1000, block[1] * 1000] if block else []
+
+
+def encoder_settings(encoder, preset=None):
+    """ffmpeg video options for encoder, with preset (one of ENCODER_PRESETS, as text or number) in place of
+    the default. An unknown preset, or none, keeps ENCODER_SETTINGS as it is.
+    """
+    settings = dict(ENCODER_SETTINGS.get(encoder, ENCODER_SETTINGS[DEFAULT_VIDEO_ENCODER]))
+    for known in ENCODER_PRESETS.get(encoder, ()):
+        if preset is not None and str(known) == str(preset):
+            settings["preset"] = known
+    return settings
+
+
+def estimate_encodes(path, in_s, out_s, encoders=None, is_cancelled=None, on_estimate=None, cache=PROBE_CACHE):
+    """Predicted encode time and output size of the cut in_s..out_s for each encoder and preset.
+
+    Encodes ESTIMATE_SAMPLES clips of ESTIMATE_SAMPLE_S spread over the cut with every preset, and scales
+    the wall time and bytes per sample second up to the cut (adding the copied audio). Timings belong to
+    this machine, so they are cached per file version and cut alongside its probe. Returns a list of
+    {"encoder", "preset", "encode_s", "size_bytes"}, each also passed to on_estimate as it is known.
+    Encoders that ffmpeg lacks are left out; None if the source cannot be read.
+    """
+    info = media_info(path, cache)
+    if info is None or out_s <= in_s:
+        return None
+    duration = out_s - in_s
+    sample_s = min(ESTIMATE_SAMPLE_S, duration / ESTIMATE_SAMPLES)
+    starts = [in_s + (i + 0.5) * duration / ESTIMATE_SAMPLES - sample_s / 2 for i in range(ESTIMATE_SAMPLES)]
+    audio_bytes = int(info.audio.get("bit_rate") or 0) * duration / 8
+    estimates = []
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=CACHE_DIR) as work:
+        sample_path = os.path.join(work, "sample.mp4")
+        for encoder in encoders or ENCODER_PRESETS:
+            for preset in ENCODER_PRESETS[encoder]:
+                field = f"encode_estimate:{in_s:.3f}:{out_s:.3f}:{encoder}:{preset}"
+                estimate = cache.get(path, field)
+                if estimate is None:
+                    wall_s, size = 0.0, 0
+                    for start in starts:
+                        encode = FFmpeg().option("y").input(path, ss=f"{start:.3f}", t=f"{sample_s:.3f}").output(
+                            sample_path, map="0:v:0", an=None, **encoder_settings(encoder, preset)
+                        )
+                        result = SUPERVISOR.run(encode.arguments, is_cancelled=is_cancelled)
+                        if not result.ok:
+                            break
+                        wall_s += result.wall_s
+                        size += os.path.getsize(sample_path)
+                    if result.cancelled:
+                        return estimates
+                    if not result.ok:
+                        # Not built into this ffmpeg (or cannot encode this source): skip the encoder.
+                        break
+                    scale = duration / (sample_s * len(starts))
+                    estimate = {"encode_s": wall_s * scale, "size_bytes": int(size * scale + audio_bytes)}
+                    cache.put(path, field, estimate)
+                estimate = {"encoder": encoder, "preset": preset, **estimate}
+                estimates.append(estimate)
+                if on_estimate:
+                    on_estimate(estimate)
+    return estimates
+
+
+def pick_preset(estimates, encoder, target_s):
+    """The slowest (smallest output) preset of encoder predicted to finish within target_s, else the
+    fastest one. None if there is no estimate for encoder.
+    """
+    order = [str(p) for p in ENCODER_PRESETS.get(encoder, ())]
+    rows = sorted((e for e in estimates if e["encoder"] == encoder), key=lambda e: order.index(str(e["preset"])))
+    if not rows:
+        return None
+    fitting = [e for e in rows if e["encode_s"] <= target_s]
+    return (fitting[-1] if fitting else rows[0])["preset"]
+
+
+def format_estimate(estimate):
+    """"~4.2 min, ~310 MB" (seconds and tenths of a MB for short cuts)."""
+    encode_s, size_mb = estimate["encode_s"], estimate["size_bytes"] / 1024**2
+    time_text = f"~{encode_s:.0f}s" if encode_s < 120 else f"~{encode_s / 60:.1f} min"
+    return f"{time_text}, ~{size_mb:.1f} MB" if size_mb < 10 else f"{time_text}, ~{size_mb:.0f} MB"
+
+
+def format_estimates(estimates, target_s=None):
+    """One line per estimate ("H.264 veryfast: ~4.2 min, ~310 MB"), marking each encoder's auto pick."""
+    labels = dict((key, label) for label, key in VIDEO_ENCODER_OPTIONS)
+    picks = {}
+    if target_s is not None:
+        picks = {e["encoder"]: pick_preset(estimates, e["encoder"], target_s) for e in estimates}
+    lines = []
+    for e in estimates:
+        line = f"{labels.get(e['encoder'], e['encoder'])} {e['preset']}: {format_estimate(e)}"
+        if picks.get(e["encoder"]) == e["preset"]:
+            line += "  <- auto"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+class ResultCache:
+    """Content-addressed store of stage outputs (video, WAV, transcript) with LRU eviction.
+
+    Keys are hashes of everything that determines an output (source hash, in/out, encoder, model...),
+    so re-running a service with only a different model or encoder reuses the unchanged stages.
+    """
+
+    def __init__(self, directory=RESULT_CACHE_DIR, max_bytes=DEFAULT_CACHE_MAX_GB * 1024**3):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(directory, "index.json")
+        self._lock = threading.Lock()
+        self._index = self._load()
+
+    @staticmethod
+    def key(*parts):
+        return hashlib.sha1(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+    def _load(self):
+        try:
+            with open(self.index_path, "r") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save(self):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self._index, f, indent=2)
+            os.replace(tmp_path, self.index_path)
+        except Exception as e:
+            print(f"Failed to save result cache index: {e}")
+
+    def _entry_path(self, key, entry):
+        return os.path.join(self.directory, f"{key}{entry['ext']}")
+
+    def _valid_entry(self, key):
+        """The index entry for key if its file is still what was stored, else None. Outputs are hard-linked
+        into the cache, so editing one in place changes the cached copy too; such entries are dropped.
+        Call with the lock held.
+        """
+        entry = self._index.get(key)
+        if not entry:
+            return None
+        path = self._entry_path(key, entry)
+        if (os.path.isfile(path) and os.path.getsize(path) == entry["size"]
+                and file_fingerprint(path) == entry.get("fingerprint")):
+            return entry
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        del self._index[key]
+        self._save()
+        return None
+
+    def has(self, key):
+        with self._lock:
+            return self._valid_entry(key) is not None
+
+    def restore(self, key, dest):
+        """Place the cached output for key at dest. Returns False on a miss."""
+        with self._lock:
+            entry = self._valid_entry(key)
+            if not entry:
+                return False
+            entry["last_used"] = time.time()
+            cached = self._entry_path(key, entry)
+            self._save()
+        _link_or_copy(cached, dest)
+        return True
+
+    def store(self, key, src):
+        if self.max_bytes <= 0 or not os.path.isfile(src):
+            return
+        ext = os.path.splitext(src)[1]
+        os.makedirs(self.directory, exist_ok=True)
+        cached = os.path.join(self.directory, f"{key}{ext}")
+        _link_or_copy(src, cached)
+        with self._lock:
+            self._index[key] = {"ext": ext, "size": os.path.getsize(cached),
+                                "fingerprint": file_fingerprint(cached), "last_used": time.time()}
+            self._evict()
+            self._save()
+
+    def _evict(self):
+        total = sum(entry["size"] for entry in self._index.values())
+        for key, entry in sorted(self._index.items(), key=lambda item: item[1]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(self._entry_path(key, entry))
+            except OSError:
+                pass
+            total -= entry["size"]
+            del self._index[key]
+
+
+def wav_frame_energies(wav_path, frame_ms=VAD_FRAME_MS):
+    """Return (RMS per frame as a float32 array, samples per frame, sample rate) for a 16-bit mono WAV.
+    The file is read in one-minute blocks so memory stays flat for long sermons.
+    """
+    with wave.open(wav_path, "rb") as wav:
+        if wav.getsampwidth() != 2 or wav.getnchannels() != 1:
+            raise ValueError(f"Expected 16-bit mono WAV: {wav_path}")
+        rate = wav.getframerate()
+        frame_len = max(1, rate * frame_ms // 1000)
+        block = frame_len * (60_000 // frame_ms)
+        energies = []
+        carry = np.empty(0, dtype=np.float32)
+        while True:
+            data = wav.readframes(block)
+            if not data:
+                break
+            samples = np.concatenate([carry, np.frombuffer(data, dtype="<i2").astype(np.float32)])
+            whole = len(samples) // frame_len * frame_len
+            carry = samples[whole:]
+            if whole:
+                frames = samples[:whole].reshape(-1, frame_len)
+                energies.append(np.sqrt(np.mean(frames * frames, axis=1)))
+        if len(carry):
+            energies.append(np.array([np.sqrt(np.mean(carry * carry))], dtype=np.float32))
+    if not energies:
+        return np.empty(0, dtype=np.float32), frame_len, rate
+    return np.concatenate(energies).astype(np.float32), frame_len, rate
+
+
+def wav_data_offset(wav_path):
+    """(byte offset, byte length) of the sample data of a RIFF WAV (ffmpeg may write a LIST chunk first)."""
+    with open(wav_path, "rb") as f:
+        file_size = os.fstat(f.fileno()).st_size
+        f.seek(12)
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError(f"No data chunk in {wav_path}")
+            chunk_id, size = struct.unpack("<4sI", header)
+            if chunk_id == b"data":
+                return f.tell(), min(size, file_size - f.tell())
+            f.seek(size + (size & 1), 1)
+
+
+class SpeechMap:
+    """The spans of a recording kept in its speech-only copy, mapping times in the copy back to the original."""
+
+    def __init__(self, spans, total_s):
+        # (start_s, end_s) of each kept span in the original, in order
+        self.spans = spans
+        self.total_s = total_s
+        self.compact_starts = []
+        position = 0.0
+        for start, end in spans:
+            self.compact_starts.append(position)
+            position += end - start
+        self.kept_s = position
+
+    @property
+    def skipped_s(self):
+        return self.total_s - self.kept_s
+
+    def to_original(self, t, is_end=False):
+        """Original time of t in the speech-only copy. A segment end exactly on a cut stays in the span
+        before it (is_end), so no segment stretches over the removed non-speech.
+        """
+        find = bisect.bisect_left if is_end else bisect.bisect_right
+        i = max(0, find(self.compact_starts, t) - 1)
+        return self.spans[i][0] + (t - self.compact_starts[i])
+
+
+def compact_speech(wav_path, out_path, min_gap_s=DEFAULT_STRIP_MIN_GAP_S, pad_s=STRIP_PAD_S, is_cancelled=None):
+    """Write out_path as wav_path without its silence and music runs of min_gap_s or more (classify_audio
+    labels per second; pad_s is kept at each edge so word onsets are not clipped).
+    Returns the SpeechMap of the kept audio (out_path is only written if anything is skipped), or None if cancelled.
+    """
+    with wave.open(wav_path, "rb") as wav:
+        params = wav.getparams()
+    if params.sampwidth != 2 or params.nchannels != 1 or params.framerate != SUGGEST_SAMPLE_RATE:
+        raise ValueError(f"Expected 16-bit mono {SUGGEST_SAMPLE_RATE} Hz WAV: {wav_path}")
+    offset, length = wav_data_offset(wav_path)
+    n_samples = min(params.nframes, length // 2)
+    total_s = n_samples / params.framerate
+    if total_s < max(min_gap_s, SUGGEST_SMOOTH_S):
+        # Too short to hold a run worth skipping (or to smooth the labels over)
+        return SpeechMap([(0.0, total_s)], total_s)
+    samples = np.memmap(wav_path, dtype="<i2", mode="r", offset=offset, shape=(n_samples,))
+    labels = classify_audio(samples, params.framerate, is_cancelled)
+    del samples
+    if labels is None:
+        return None
+
+    # Runs of non-speech seconds: starts where speech turns off, ends where it turns back on.
+    non_speech = np.concatenate([[False], labels != LABEL_SPEECH, [False]]).astype(np.int8)
+    edges = np.diff(non_speech)
+    run_starts, run_ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    long_runs = (run_ends - run_starts) >= min_gap_s
+    spans = []
+    position = 0.0
+    for run_start, run_end in zip(run_starts[long_runs], run_ends[long_runs]):
+        cut_start = run_start + (pad_s if run_start > 0 else 0)
+        cut_end = min(total_s, run_end - (pad_s if run_end < len(labels) else 0))
+        if cut_end - cut_start <= 0:
+            continue
+        if cut_start > position:
+            spans.append((position, float(cut_start)))
+        position = float(cut_end)
+    if position < total_s:
+        spans.append((position, total_s))
+    if not spans:
+        # No speech found at all: more likely a misclassification than a sermon without words.
+        spans = [(0.0, total_s)]
+    speech_map = SpeechMap(spans, total_s)
+    if speech_map.skipped_s <= 0:
+        return speech_map
+
+    rate = params.framerate
+    with wave.open(wav_path, "rb") as src, wave.open(out_path, "wb") as dst:
+        dst.setparams(params)
+        for start, end in spans:
+            src.setpos(int(start * rate))
+            remaining = int(end * rate) - int(start * rate)
+            while remaining > 0:
+                data = src.readframes(min(remaining, 1 << 20))
+                if not data:
+                    break
+                dst.writeframes(data)
+                remaining -= len(data) // params.sampwidth
+    return speech_map
+
+
+def find_split_points(wav_path, n_chunks, search_window_s=VAD_SEARCH_WINDOW_S, min_pause_ms=VAD_MIN_PAUSE_MS):
+    """Pick n_chunks - 1 sample offsets to cut the WAV at, each in the quietest pause near an even split."""
+    if n_chunks <= 1:
+        return []
+    energies, frame_len, rate = wav_frame_energies(wav_path)
+    n_frames = len(energies)
+    if n_frames < n_chunks:
+        return []
+
+    pause = max(1, min_pause_ms // VAD_FRAME_MS)
+    smoothed = np.convolve(energies, np.ones(pause, dtype=np.float32) / pause, mode="same")
+    # Never look further than half a chunk away so the pieces stay roughly balanced.
+    search = max(1, min(int(search_window_s * 1000 // VAD_FRAME_MS), n_frames // n_chunks // 2))
+
+    splits = []
+    previous = 0
+    for i in range(1, n_chunks):
+        target = n_frames * i // n_chunks
+        lo = max(previous + 1, target - search)
+        hi = min(n_frames - 1, target + search)
+        if lo >= hi:
+            continue
+        frame = lo + int(np.argmin(smoothed[lo:hi]))
+        splits.append(frame * frame_len)
+        previous = frame
+    return splits
+
+
+def write_wav_chunks(wav_path, split_points, out_dir):
+    """Cut wav_path at the given sample offsets. Returns [(chunk_path, start_sample), ...] in order."""
+    chunks = []
+    with wave.open(wav_path, "rb") as src:
+        params = src.getparams()
+        bounds = [0, *split_points, src.getnframes()]
+        for index, (start, end) in enumerate(zip(bounds, bounds[1:])):
+            if end <= start:
+                continue
+            chunk_path = os.path.join(out_dir, f"chunk{index:03d}.wav")
+            src.setpos(start)
+            with wave.open(chunk_path, "wb") as dst:
+                dst.setparams(params)
+                remaining = end - start
+                while remaining > 0:
+                    data = src.readframes(min(remaining, 1 << 20))
+                    if not data:
+                        break
+                    dst.writeframes(data)
+                    remaining -= len(data) // params.sampwidth
+            chunks.append((chunk_path, start))
+    return chunks
+
+
+def parse_whisper_segment(line):
+    """Parse a whisper-cli "[hh:mm:ss.mmm --> hh:mm:ss.mmm]  text" line into (start_s, end_s, text), or None."""
+    match = WHISPER_SEGMENT_RE.match(line.strip())
+    if not match:
+        return None
+    g = match.groups()
+    start = int(g[0]) * 3600 + int(g[1]) * 60 + int(g[2]) + int(g[3]) / 1000
+    end = int(g[4]) * 3600 + int(g[5]) * 60 + int(g[6]) + int(g[7]) / 1000
+    return start, end, g[8].strip()
+
+
+def format_timestamp(seconds, decimal_mark="."):
+    """hh:mm:ss.mmm (VTT), or hh:mm:ss,mmm with decimal_mark="," (SRT)."""
+    ms = int(round(seconds * 1000))
+    hours, ms = divmod(ms, 3600000)
+    minutes, ms = divmod(ms, 60000)
+    secs, ms = divmod(ms, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{decimal_mark}{ms:03d}"
+
+
+class TranscriptWriter:
+    """Writes transcript segments to <base>.txt, .srt, .vtt and .json as whisper produces them.
+
+    Each file is written as <path>.part and flushed after every segment, so a crash or cancel leaves the
+    transcript so far on disk; finish() renames the .part files into place. Timestamps are shifted by
+    offset_s (the in point), so they refer to the original recording. With a speech_map (a speech-only
+    input, see compact_speech), times are first mapped back to the uncut audio. Only the open files are held.
+    """
+
+    FORMATS = (".txt", ".srt", ".vtt", ".json")
+
+    def __init__(self, text_path, offset_s=0.0, speech_map=None):
+        base = os.path.splitext(text_path)[0]
+        self.speech_map = speech_map
+        self.paths = [base + ext for ext in self.FORMATS]
+        self.offset_s = offset_s
+        self.count = 0
+        self.finished = False
+        self.files = {ext: open(f"{base}{ext}.part", "w", encoding="utf-8") for ext in self.FORMATS}
+        self.files[".vtt"].write("WEBVTT\n\n")
+        self.files[".json"].write(f'{{"offset_s": {offset_s}, "segments": [')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if not self.finished:
+            self.close()
+
+    def add(self, start_s, end_s, text):
+        if self.speech_map is not None:
+            start_s, end_s = self.speech_map.to_original(start_s), self.speech_map.to_original(end_s, is_end=True)
+        start, end = start_s + self.offset_s, end_s + self.offset_s
+        self.count += 1
+        files = self.files
+        files[".txt"].write(f"{text}\n")
+        files[".srt"].write(
+            f"{self.count}\n{format_timestamp(start, ',')} --> {format_timestamp(end, ',')}\n{text}\n\n"
+        )
+        files[".vtt"].write(f"{format_timestamp(start)} --> {format_timestamp(end)}\n{text}\n\n")
+        segment = json.dumps({"start": round(start, 3), "end": round(end, 3), "text": text})
+        files[".json"].write(f"{',' if self.count > 1 else ''}\n  {segment}")
+        for f in files.values():
+            f.flush()
+
+    def finish(self):
+        """Complete the files and move them into place (each rename is atomic)."""
+        self.files[".json"].write("\n]}\n")
+        self.close()
+        for path in self.paths:
+            os.replace(f"{path}.part", path)
+        self.finished = True
+
+    def close(self):
+        for f in self.files.values():
+            f.close()
+
+
+def transcribe_chunked(whisper_cli, model_path, wav_path, n_chunks, threads_per_worker=None, workers=None, is_cancelled=None, on_progress=None, on_segment=None):
+    """Transcribe wav_path as n_chunks pieces split at pauses, with up to `workers` whisper-cli processes
+    (default: one per chunk) running in parallel. Returns [(start_s, end_s, text), ...] in order, with
+    timestamps relative to the start of wav_path. on_progress(seconds) is called with the total audio
+    transcribed so far each time a chunk finishes. With on_segment(start_s, end_s, text), segments are
+    handed over in order as soon as every earlier chunk is done, and are not collected (returns []).
+    """
+    is_cancelled = is_cancelled or (lambda: False)
+    workers = workers or n_chunks
+    threads_per_worker = threads_per_worker or max(1, (os.cpu_count() or 1) // max(1, workers))
+
+    with tempfile.TemporaryDirectory(prefix="sermon-chunks-") as chunk_dir:
+        split_points = find_split_points(wav_path, n_chunks)
+        with wave.open(wav_path, "rb") as wav:
+            rate = wav.getframerate()
+            total_samples = wav.getnframes()
+        chunks = write_wav_chunks(wav_path, split_points, chunk_dir)
+        chunk_ends = [start for _, start in chunks[1:]] + [total_samples]
+        chunk_seconds = {path: (end - start) / rate for (path, start), end in zip(chunks, chunk_ends)}
+        done = {"seconds": 0.0}
+        done_lock = threading.Lock()
+        # Set by the first chunk to fail, so the others' whisper-cli processes are killed too.
+        failed = threading.Event()
+
+        def run_chunk(chunk):
+            chunk_path, start_sample = chunk
+            offset = start_sample / rate
+            cmd = [whisper_cli, "-m", model_path, "-np", "-t", str(threads_per_worker), "-f", chunk_path]
+            result = SUPERVISOR.run(cmd, is_cancelled=lambda: is_cancelled() or failed.is_set(), capture_stdout=True)
+            if result.cancelled:
+                return []
+            if result.returncode != 0:
+                failed.set()
+                raise RuntimeError(f"whisper-cli failed on {os.path.basename(chunk_path)}: {result.error_line()}")
+            if on_progress:
+                with done_lock:
+                    done["seconds"] += chunk_seconds[chunk_path]
+                    on_progress(done["seconds"])
+            segments = []
+            for line in result.stdout.splitlines():
+                parsed = parse_whisper_segment(line)
+                if parsed:
+                    start, end, text = parsed
+                    segments.append((start + offset, end + offset, text))
+            return segments
+
+        # Threads only wait on the supervised whisper-cli children; the work itself runs out of process.
+        segments = []
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(chunks)))) as pool:
+            # map() yields in chunk order, each as soon as it (and every chunk before it) is done.
+            for chunk_segments in pool.map(run_chunk, chunks):
+                if on_segment:
+                    for segment in chunk_segments:
+                        on_segment(*segment)
+                else:
+                    segments.extend(chunk_segments)
+
+    return segments
+
+
+def find_whisper_server(whisper_cli=None):
+    """Locate whisper.cpp's whisper-server: next to whisper-cli (both are built into build/bin), else on PATH."""
+    if whisper_cli:
+        sibling = os.path.join(os.path.dirname(whisper_cli), "whisper-server")
+        if os.path.isfile(sibling) and os.access(sibling, os.X_OK):
+            return sibling
+    return shutil.which("whisper-server")
+
+
+class WhisperServer:
+    """A resident whisper-server process with one model loaded, transcribing WAV files sent over local HTTP.
+
+    The server runs one inference at a time; concurrent callers queue on `lock`.
+    """
+
+    def __init__(self, executable, model_path, threads=None):
+        self.executable = executable
+        self.model_path = model_path
+        self.threads = threads
+        # Future of the supervised server process's ProcessResult; setting stopping kills it
+        self.exit = None
+        self.stopping = False
+        self.port = None
+        self.load_seconds = None
+        # Wall seconds of each inference request
+        self.latencies = []
+        self.lock = threading.Lock()
+
+    def start(self, timeout=WHISPER_SERVER_START_TIMEOUT_S):
+        """Launch the server and wait until it accepts connections (it only listens once the model is loaded)."""
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            self.port = probe.getsockname()[1]
+        cmd = [self.executable, "-m", self.model_path, "--host", "127.0.0.1", "--port", str(self.port)]
+        if self.threads:
+            cmd += ["-t", str(self.threads)]
+        started = time.perf_counter()
+        self.stopping = False
+        self.exit = SUPERVISOR.start(cmd, is_cancelled=lambda: self.stopping)
+        while True:
+            if self.exit.done():
+                raise RuntimeError(f"whisper-server exited: {self.exit.result().error_line()}")
+            try:
+                socket.create_connection(("127.0.0.1", self.port), timeout=1).close()
+                break
+            except OSError:
+                if time.perf_counter() - started > timeout:
+                    self.stop()
+                    raise RuntimeError(f"whisper-server did not load the model within {timeout}s")
+                time.sleep(0.1)
+        self.load_seconds = time.perf_counter() - started
+
+    def is_running(self):
+        return self.exit is not None and not self.exit.done()
+
+    def stop(self):
+        if self.is_running():
+            self.stopping = True
+            self.exit.result()
+
+    def transcribe(self, wav_path, is_cancelled=None):
+        """Transcribe wav_path into [(start_s, end_s, text), ...], or None if cancelled.
+        The server has no way to abort an inference, so cancelling stops it (the next job starts a new one).
+        """
+        is_cancelled = is_cancelled or (lambda: False)
+        result = {}
+
+        def request():
+            try:
+                result["segments"] = self._post_inference(wav_path)
+            except Exception as e:
+                result["error"] = e
+
+        with self.lock:
+            started = time.perf_counter()
+            worker = threading.Thread(target=request, daemon=True)
+            worker.start()
+            while worker.is_alive():
+                worker.join(0.5)
+                if worker.is_alive() and is_cancelled():
+                    self.stop()
+                    worker.join()
+                    return None
+            if "error" in result:
+                raise RuntimeError(f"whisper-server failed: {result['error']}")
+            self.latencies.append(time.perf_counter() - started)
+            return result["segments"]
+
+    def _post_inference(self, wav_path):
+        """POST the WAV to /inference as multipart form data, streamed from disk."""
+        boundary = uuid.uuid4().hex
+        head = (
+            f"--{boundary}\r\nContent-Disposition: form-data; name=\"response_format\"\r\n\r\nverbose_json\r\n"
+            f"--{boundary}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"audio.wav\"\r\n"
+            "Content-Type: audio/wav\r\n\r\n"
+        ).encode()
+        tail = f"\r\n--{boundary}--\r\n".encode()
+
+        def body():
+            yield head
+            with open(wav_path, "rb") as f:
+                while block := f.read(1 << 20):
+                    yield block
+            yield tail
+
+        connection = http.client.HTTPConnection("127.0.0.1", self.port)
+        try:
+            connection.request("POST", "/inference", body=body(), headers={
+                "Content-Type": f"multipart/form-data; boundary={boundary}",
+                "Content-Length": str(len(head) + os.path.getsize(wav_path) + len(tail)),
+            })
+            response = connection.getresponse()
+            data = response.read()
+        finally:
+            connection.close()
+        if response.status != 200:
+            raise RuntimeError(f"HTTP {response.status}: {data[:200].decode(errors='replace')}")
+        reply = json.loads(data)
+        if "error" in reply:
+            raise RuntimeError(reply["error"])
+        if "segments" not in reply:
+            text = reply.get("text", "").strip()
+            return [(0.0, 0.0, text)] if text else []
+        return [(float(seg["start"]), float(seg["end"]), seg["text"].strip()) for seg in reply["segments"]]
+
+
+class WhisperServerPool:
+    """WhisperServers by (executable, model), started on first use and kept running between jobs.
+
+    At most max_resident models stay loaded or loading (the least recently used idle one is stopped to
+    make room; with none idle, callers fall back to whisper-cli). A model loads outside the pool lock, so
+    jobs wanting another server are not held up; jobs wanting the same one wait for that load.
+    A server that fails to start is not retried, so callers fall back to whisper-cli straight away.
+    """
+
+    def __init__(self, max_resident=WHISPER_SERVER_MAX_RESIDENT):
+        self.max_resident = max_resident
+        self.servers = {}
+        # key -> (server being started, Event set once it is up or has failed)
+        self.loading = {}
+        self.failed = set()
+        self.lock = threading.Lock()
+
+    def get(self, executable, model_path, threads=None):
+        """A running server with model_path loaded (loading it if needed), or None if one cannot be started."""
+        key = (executable, os.path.abspath(model_path))
+        while True:
+            with self.lock:
+                if key in self.failed:
+                    return None
+                if key not in self.loading:
+                    server = self.servers.pop(key, None)
+                    if server is not None and server.is_running():
+                        # Most recently used last
+                        self.servers[key] = server
+                        return server
+                    if not self._make_room():
+                        print(f"whisper-server: no idle slot for {os.path.basename(model_path)}, using whisper-cli")
+                        return None
+                    server = WhisperServer(executable, model_path, threads)
+                    loaded = threading.Event()
+                    self.loading[key] = (server, loaded)
+                    break
+                loaded = self.loading[key][1]
+            loaded.wait()
+
+        try:
+            server.start()
+        except (OSError, RuntimeError) as e:
+            print(f"whisper-server unavailable, using whisper-cli: {e}")
+            server = None
+        with self.lock:
+            del self.loading[key]
+            if server is None:
+                self.failed.add(key)
+            else:
+                self.servers[key] = server
+        loaded.set()
+        if server is not None:
+            print(f"whisper-server loaded {os.path.basename(model_path)} in {server.load_seconds:.1f}s")
+        return server
+
+    def _make_room(self):
+        """Stop least recently used idle servers until another fits; False if none can be stopped (lock held)."""
+        for other_key, other in list(self.servers.items()):
+            if len(self.servers) + len(self.loading) < self.max_resident:
+                break
+            if not other.lock.locked():
+                del self.servers[other_key]
+                other.stop()
+        return len(self.servers) + len(self.loading) < self.max_resident
+
+    def format_stats(self):
+        parts = []
+        with self.lock:
+            servers = list(self.servers.values())
+        for server in servers:
+            latencies = server.latencies
+            mean = sum(latencies) / len(latencies) if latencies else 0.0
+            parts.append(f"{os.path.basename(server.model_path)}: loaded in {server.load_seconds:.1f}s, "
+                         f"{len(latencies)} job(s), {mean:.1f}s mean latency")
+        return "; ".join(parts)
+
+    def shutdown(self):
+        with self.lock:
+            # A server still loading fails its start() once stopped.
+            for server in [*self.servers.values(), *(server for server, _ in self.loading.values())]:
+                server.stop()
+            self.servers.clear()
+
+
+WHISPER_SERVERS = WhisperServerPool()
+atexit.register(WHISPER_SERVERS.shutdown)
+
+
+
+class WaveformPyramid:
+    """Peak and RMS envelope of a recording's audio at WAVEFORM_BIN_SAMPLES / WAVEFORM_SAMPLE_RATE
+    seconds per bin (level 0), with each further level halving the resolution.
+
+    columns() picks the coarsest level that still has a bin per pixel, so drawing costs
+    O(pixels) however long the recording is.
+    """
+
+    def __init__(self, peaks, rms, bin_seconds=WAVEFORM_BIN_SAMPLES / WAVEFORM_SAMPLE_RATE):
+        self.bin_seconds = bin_seconds
+        self.levels = [(peaks.astype(np.float32), rms.astype(np.float32))]
+        while len(self.levels[-1][0]) > 1:
+            peaks, rms = self.levels[-1]
+            if len(peaks) % 2:
+                peaks, rms = np.append(peaks, 0.0), np.append(rms, 0.0)
+            self.levels.append((
+                peaks.reshape(-1, 2).max(axis=1),
+                np.sqrt((rms.reshape(-1, 2) ** 2).mean(axis=1)),
+            ))
+
+    @property
+    def duration_s(self):
+        return len(self.levels[0][0]) * self.bin_seconds
+
+    @classmethod
+    def from_raw(cls, raw_path, is_cancelled=None, rate=WAVEFORM_SAMPLE_RATE):
+        """Reduce raw s16le mono samples at `rate` (a multiple of WAVEFORM_SAMPLE_RATE) to level 0,
+        block by block through a memory map, so a three-hour service never has to fit in memory.
+        """
+        is_cancelled = is_cancelled or (lambda: False)
+        bin_samples = WAVEFORM_BIN_SAMPLES * rate // WAVEFORM_SAMPLE_RATE
+        samples = np.memmap(raw_path, dtype="<i2", mode="r") if os.path.getsize(raw_path) else np.empty(0, "<i2")
+        n_bins = -(-len(samples) // bin_samples)
+        peaks = np.zeros(n_bins, dtype=np.float32)
+        rms = np.zeros(n_bins, dtype=np.float32)
+        block = WAVEFORM_BLOCK_BINS * bin_samples
+        for start in range(0, len(samples), block):
+            if is_cancelled():
+                return None
+            chunk = np.asarray(samples[start:start + block], dtype=np.float32) / 32768.0
+            chunk = np.pad(chunk, (0, -len(chunk) % bin_samples)).reshape(-1, bin_samples)
+            first = start // bin_samples
+            peaks[first:first + len(chunk)] = np.abs(chunk).max(axis=1)
+            rms[first:first + len(chunk)] = np.sqrt((chunk * chunk).mean(axis=1))
+        del samples
+        return cls(peaks, rms)
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        peaks, rms = self.levels[0]
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(tmp_path, peaks=peaks.astype(np.float16), rms=rms.astype(np.float16),
+                 bin_seconds=self.bin_seconds)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with np.load(path) as data:
+                return cls(data["peaks"], data["rms"], float(data["bin_seconds"]))
+        except Exception:
+            return None
+
+    def columns(self, start_s, end_s, n):
+        """(peaks, rms) arrays of length n covering [start_s, end_s)."""
+        if n <= 0 or end_s <= start_s:
+            return np.zeros(0, np.float32), np.zeros(0, np.float32)
+        span_bins = (end_s - start_s) / self.bin_seconds
+        level = 0
+        while level + 1 < len(self.levels) and span_bins / 2 ** (level + 1) >= n:
+            level += 1
+        peaks, rms = self.levels[level]
+        if not len(peaks):
+            return np.zeros(n, np.float32), np.zeros(n, np.float32)
+        bin_s = self.bin_seconds * 2 ** level
+        edges = np.clip((np.linspace(start_s, end_s, n + 1) / bin_s).astype(np.int64), 0, len(peaks))
+        # Every pixel reduces at least one bin at this level; pixels past the end read as silence.
+        valid = edges[:-1] < len(peaks)
+        starts = np.minimum(edges[:-1], len(peaks) - 1)
+        stop = max(int(edges[-1]), int(starts[-1]) + 1)
+        col_peaks = np.where(valid, np.maximum.reduceat(peaks[:stop], starts), 0.0)
+        col_rms = np.where(valid, np.maximum.reduceat(rms[:stop], starts), 0.0)
+        return col_peaks, col_rms
+
+
+def waveform_cache_path(path):
+    """Pyramid cache file for a source, keyed on its identity (path, size, mtime)."""
+    return os.path.join(WAVEFORM_CACHE_DIR, f"{source_identity_key(path)}.npz")
+
+
+class Filmstrip:
+    """Thumbnails every `interval_s` seconds of a source, tiled into JPEG sprite sheets in `directory`.
+    Sheets are loaded on first use (on the GUI thread, as QPixmap).
+    """
+
+    def __init__(self, directory, interval_s, count, tile=THUMBNAIL_TILE,
+                 size=(THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT)):
+        self.directory = directory
+        self.interval_s = interval_s
+        self.count = count
+        self.tile = tuple(tile)
+        self.size = tuple(size)
+        self._sheets = {}
+
+    @classmethod
+    def load(cls, directory):
+        try:
+            with open(os.path.join(directory, "index.json"), "r") as f:
+                index = json.load(f)
+            return cls(directory, index["interval_s"], index["count"], index["tile"], index["size"])
+        except Exception:
+            return None
+
+    def save_index(self):
+        with open(os.path.join(self.directory, "index.json"), "w") as f:
+            json.dump({"interval_s": self.interval_s, "count": self.count, "tile": self.tile,
+                       "size": self.size}, f)
+
+    @staticmethod
+    def sheet_name(number):
+        return f"sheet_{number:03d}.jpg"
+
+    def thumbnail(self, ms):
+        """QPixmap of the thumbnail nearest to ms, or None if it is not available."""
+        if self.count <= 0:
+            return None
+        index = min(self.count - 1, max(0, int(round(ms / 1000 / self.interval_s))))
+        per_sheet = self.tile[0] * self.tile[1]
+        number = index // per_sheet + 1  # ffmpeg numbers image sequences from 1
+        sheet = self._sheets.get(number)
+        if sheet is None:
+            sheet = QPixmap(os.path.join(self.directory, self.sheet_name(number)))
+            if sheet.isNull():
+                return None
+            self._sheets[number] = sheet
+        cell = index % per_sheet
+        width, height = self.size
+        return sheet.copy((cell % self.tile[0]) * width, (cell // self.tile[0]) * height, width, height)
+
+
+class JobCancelled(Exception):
+    """Raised inside a stage action when its child process was killed by cancel; ends the step early."""
+
+
+class ExtractAndTranscribeThread(QThread):
+    status_update = Signal(str)
+    # stage, percent done, speed (x realtime), ETA in seconds (-1 while unknown)
+    progress = Signal(str, float, float, float)
+    finished = Signal(str)
+
+    def __init__(self, input_file, in_point, out_point, base_name, whisper_cli=None, model_path=None, video_encoder=DEFAULT_VIDEO_ENCODER, video_preset=None, target_encode_s=None, do_transcribe=True, do_transcode=True, single_pass=True, smart_cut=True, stream_audio=False, transcribe_chunks=1, threads_per_worker=None, encode_segments=1, strip_non_speech=False, strip_min_gap_s=DEFAULT_STRIP_MIN_GAP_S, whisper_server=None, ffmpeg_slot=None, whisper_slot=None, job_queue=None, job_id=None, result_cache=None):
+        super().__init__()
+        self.input_file = input_file
+        self.in_point = in_point
+        self.out_point = out_point
+        self.base_name = base_name
+        self.is_cancelled = False
+        self.whisper_cli = whisper_cli or get_default_whisper_cli()
+        self.model_path = model_path or os.path.join(DEFAULT_MODELS_DIR, "ggml-large-v3.bin")
+        self.video_encoder = video_encoder or DEFAULT_VIDEO_ENCODER
+        # A preset from ENCODER_PRESETS, AUTO_PRESET (slowest one predicted to finish in target_encode_s)
+        # or None for the ENCODER_SETTINGS default.
+        self.video_preset = video_preset or None
+        self.target_encode_s = target_encode_s or DEFAULT_TARGET_ENCODE_MINUTES * 60
+        self._auto_preset = None
+        self.do_transcribe = bool(do_transcribe)
+        self.do_transcode = bool(do_transcode)
+        # Produce the sermon video and the whisper WAV from one decode of the source
+        # (only meaningful when both transcoding and transcription are enabled).
+        self.single_pass = bool(single_pass)
+        # Same-codec trims: re-encode only the partial GOPs at the cut edges and stream-copy the rest.
+        self.smart_cut = bool(smart_cut)
+        # Pipe 16 kHz WAV from ffmpeg straight into whisper-cli instead of writing sermon.wav.
+        self.stream_audio = bool(stream_audio)
+        # >1: split the WAV at pauses and run that many whisper-cli workers in parallel.
+        self.transcribe_chunks = max(1, int(transcribe_chunks or 1))
+        self.threads_per_worker = threads_per_worker
+        # >1: re-encode the cut as that many keyframe-aligned segments in parallel ffmpeg processes.
+        self.encode_segments = max(1, int(encode_segments or 1))
+        # Transcribe a copy of the WAV without silence/music runs this long (see compact_speech).
+        self.strip_non_speech = bool(strip_non_speech)
+        self.strip_min_gap_s = strip_min_gap_s or DEFAULT_STRIP_MIN_GAP_S
+        # SpeechMap of the speech-only WAV being transcribed (None: the whole WAV)
+        self._speech_map = None
+        # whisper-server executable to keep the model resident between jobs (None: one whisper-cli per job).
+        self.whisper_server = whisper_server
+        # Optional semaphores shared between jobs to cap concurrent ffmpeg / whisper stages (batch mode).
+        self.ffmpeg_slot = ffmpeg_slot or nullcontext()
+        self.whisper_slot = whisper_slot or nullcontext()
+        # Wall-clock seconds per stage, filled in as the stages complete.
+        self.stage_timings = {}
+        # Stage being timed and when it started (progress speed/ETA are measured against it).
+        self._current_stage = None
+        self._stage_started = 0.0
+        self._last_progress = 0.0
+        # Persistent queue entry to checkpoint finished stages into (None: no resume support).
+        self.job_queue = job_queue
+        self.job_id = job_id
+        # Filled by the probe stage (or its checkpoint); None until probed.
+        self.source_codec = None
+        # Shared ResultCache of stage outputs keyed on source hash + in/out + encoder/model (None: off).
+        self.result_cache = result_cache
+        self._source_key = None
+
+
+    def run(self):
+        try:
+            for step in self.prepare():
+                if not self.run_step(step):
+                    return
+            self.finished.emit(self._complete_message())
+        except Exception as e:
+            self.finished.emit(f"Error during processing: {str(e)}")
+
+    def prepare(self):
+        """Validate checkpoints against the source and return the job's steps (see _stage_plan)."""
+        if self.job_queue is not None:
+            self.job_queue.verify_source(self.job_id)
+        return self._stage_plan()
+
+    def run_step(self, step):
+        """Run one step of the plan (skipping it if checkpointed or cached). False if cancelled."""
+        stages, outputs, slots, action = step
+        if self._stages_already_done(stages):
+            self.status_update.emit(f"Reusing completed {'+'.join(stages)} output.")
+            return True
+        if self._restore_from_cache(stages, outputs):
+            self.status_update.emit(f"Restored {'+'.join(stages)} output from cache.")
+            self._checkpoint(stages, outputs)
+            return True
+        # Start from fresh files: a cached output may be hard-linked to the previous copy.
+        for paths in outputs.values():
+            for path in paths:
+                if os.path.exists(path):
+                    os.remove(path)
+        with ExitStack() as stack:
+            for slot in slots:
+                stack.enter_context(slot)
+            stack.enter_context(self._timed_stage("+".join(stages)))
+            try:
+                action()
+            except JobCancelled:
+                pass
+        if self.is_cancelled:
+            return False
+        self._store_in_cache(stages, outputs)
+        self._checkpoint(stages, outputs)
+        return True
+
+    def _stage_plan(self):
+        """The steps for this job as (stage names, {stage: output paths}, slots to hold, action).
+        A step covering several JOB_STAGES (e.g. single pass video+audio) checkpoints them together.
+        """
+        prefix = self.output_prefix()
+        sermon_video = f"{prefix} sermon.mp4"
+        sermon_audio = f"{prefix} sermon.wav"
+        sermon_text = f"{prefix} sermon.txt"
+        # The transcript in every TranscriptWriter format (.txt, .srt, .vtt, .json)
+        transcripts = [os.path.splitext(sermon_text)[0] + ext for ext in TranscriptWriter.FORMATS]
+
+        in_time = self.format_time_with_ms(self.in_point / 1000)
+        out_time = self.format_time_with_ms(self.out_point / 1000)
+        ffmpeg, whisper = self.ffmpeg_slot, self.whisper_slot
+
+        plan = [(("probe",), {}, (), self.probe_source)]
+
+        if self.do_transcribe and self.stream_audio:
+            if self.do_transcode and self.single_pass:
+                plan.append((
+                    ("video", "audio", "transcribe"),
+                    {"video": [sermon_video], "transcribe": transcripts},
+                    (ffmpeg, whisper),
+                    lambda: self.stream_transcribe(self.input_file, sermon_text, ss=in_time, to=out_time,
+                                                   sermon_video=sermon_video),
+                ))
+            elif self.do_transcode:
+                plan.append((("video",), {"video": [sermon_video]}, (ffmpeg,),
+                             lambda: self.video_extract(sermon_video)))
+                plan.append((("audio", "transcribe"), {"transcribe": transcripts}, (ffmpeg, whisper),
+                             lambda: self.stream_transcribe(sermon_video, sermon_text)))
+            else:
+                plan.append((("audio", "transcribe"), {"transcribe": transcripts}, (ffmpeg, whisper),
+                             lambda: self.stream_transcribe(self.input_file, sermon_text, ss=in_time, to=out_time)))
+            return plan
+
+        if self.do_transcode and self.do_transcribe and self.single_pass:
+            plan.append((("video", "audio"), {"video": [sermon_video], "audio": [sermon_audio]}, (ffmpeg,),
+                         lambda: self.video_audio_extract(sermon_video, sermon_audio)))
+        else:
+            if self.do_transcode:
+                plan.append((("video",), {"video": [sermon_video]}, (ffmpeg,),
+                             lambda: self.video_extract(sermon_video)))
+            if self.do_transcribe:
+                if self.do_transcode:
+                    audio_step = lambda: self.audio_extract(sermon_video, sermon_audio)
+                else:
+                    audio_step = lambda: self.audio_extract(self.input_file, sermon_audio, ss=in_time, to=out_time)
+                plan.append((("audio",), {"audio": [sermon_audio]}, (ffmpeg,), audio_step))
+
+        if self.do_transcribe:
+            plan.append((("transcribe",), {"transcribe": transcripts}, (whisper,),
+                         lambda: self.transcribe(sermon_audio, sermon_text)))
+        return plan
+
+    def output_prefix(self):
+        """Path every output of this job starts with ("<base name> sermon.mp4" etc. next to the input)."""
+        return os.path.join(os.path.dirname(os.path.abspath(self.input_file)), self.base_name)
+
+    def _cache_key(self, stage, path):
+        """Everything that determines a stage's output: source content, cut, and encoder or model
+        (and, for the transcript, which of its formats path is).
+        """
+        if self._source_key is None:
+            self._source_key = file_fingerprint(self.input_file)
+        cut = (self._source_key, self.in_point, self.out_point)
+        if stage == "video":
+            key = ["video", *cut, self.video_encoder, self._use_smart_cut()]
+            if self.video_preset:
+                # Only when set, so outputs made with the default preset keep their cache entries
+                key += [self.video_preset, self.target_encode_s if self.video_preset == AUTO_PRESET else None]
+            if self.encode_segments > 1:
+                key += ["segments", self.encode_segments]
+            return ResultCache.key(*key)
+        if stage == "audio":
+            return ResultCache.key("audio", *cut)
+        key = ["transcribe", *cut, model_fingerprint(self.model_path), self.transcribe_chunks, os.path.splitext(path)[1]]
+        if self.strip_non_speech and not self.stream_audio:
+            key += ["strip", self.strip_min_gap_s]
+        return ResultCache.key(*key)
+
+    def _restore_from_cache(self, stages, outputs):
+        if self.result_cache is None:
+            return False
+        wanted = [(stage, path) for stage in stages for path in outputs.get(stage, [])]
+        if not wanted or not all(self.result_cache.has(self._cache_key(stage, path)) for stage, path in wanted):
+            return False
+        return all(self.result_cache.restore(self._cache_key(stage, path), path) for stage, path in wanted)
+
+    def _store_in_cache(self, stages, outputs):
+        if self.result_cache is None:
+            return
+        for stage in stages:
+            for path in outputs.get(stage, []):
+                self.result_cache.store(self._cache_key(stage, path), path)
+
+    def _stages_already_done(self, stages):
+        if self.job_queue is None:
+            return False
+        records = [self.job_queue.valid_stage(self.job_id, stage) for stage in stages]
+        if not all(records):
+            return False
+        if "probe" in stages:
+            self.source_codec = records[0]["info"].get("codec")
+        return True
+
+    def _checkpoint(self, stages, outputs):
+        """Record finished stages in the job queue (only if every output they promised exists and is valid)."""
+        if self.job_queue is None:
+            return
+        expected_ms = self.out_point - self.in_point
+        for stage in stages:
+            paths = outputs.get(stage, [])
+            if not all(os.path.isfile(path) for path in paths):
+                return
+            described = [
+                describe_output(path, expected_ms if not path.endswith(EDITABLE_OUTPUT_EXTENSIONS) else None)
+                for path in paths
+            ]
+            info = {"codec": self.source_codec} if stage == "probe" else None
+            if not self.job_queue.checkpoint(self.job_id, stage, described, info):
+                self.status_update.emit(f"Not checkpointing {stage}: its output failed validation.")
+                return
+        self.status_update.emit(f"Finished {'+'.join(stages)}.")
+
+    def probe_source(self):
+        """Probe the source once per job; the result is checkpointed so a resume skips ffprobe."""
+        self.status_update.emit("Probing source video...")
+        info = media_info(self.input_file)
+        # ffprobe unavailable or unreadable file -> no codec, so the video is re-encoded
+        self.source_codec = info.video_codec if info else ""
+        if info and self.do_transcribe and not info.has_audio:
+            raise RuntimeError("The source has no audio stream to transcribe.")
+
+    @contextmanager
+    def _timed_stage(self, name):
+        """Record the wall-clock duration of one stage in self.stage_timings, and log its
+        realtime factor (sermon seconds per wall second) to STAGE_LOG_PATH when it succeeds.
+        """
+        start = time.perf_counter()
+        self._current_stage, self._stage_started, self._last_progress = name, start, 0.0
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stage_timings[name] = elapsed
+            self._current_stage = None
+        if name == "probe":
+            # Reads headers only; a realtime factor says nothing about capacity.
+            return
+        media_s = (self.out_point - self.in_point) / 1000
+        rtf = media_s / elapsed if elapsed > 0 else 0.0
+        if not self.is_cancelled:
+            self._log_stage(name, media_s, elapsed, rtf)
+
+    def _log_stage(self, name, media_s, elapsed, rtf):
+        try:
+            os.makedirs(os.path.dirname(STAGE_LOG_PATH), exist_ok=True)
+            new_file = not os.path.exists(STAGE_LOG_PATH)
+            with open(STAGE_LOG_PATH, "a", newline="") as f:
+                writer = csv.writer(f)
+                if new_file:
+                    writer.writerow(["finished", "file", "stage", "media_s", "wall_s", "realtime_factor",
+                                     "encoder", "model"])
+                writer.writerow([
+                    datetime.now().isoformat(timespec="seconds"), os.path.basename(self.input_file), name,
+                    f"{media_s:.1f}", f"{elapsed:.2f}", f"{rtf:.2f}",
+                    self.video_encoder if "video" in name else "",
+                    os.path.basename(self.model_path) if "transcribe" in name else "",
+                ])
+        except Exception as e:
+            print(f"Failed to log stage timing: {e}")
+
+    def _report_progress(self, done_s, final=False):
+        """Emit progress for the current stage, with done_s seconds of the sermon processed."""
+        total = (self.out_point - self.in_point) / 1000
+        now = time.perf_counter()
+        if total <= 0 or self._current_stage is None:
+            return
+        if not final and now - self._last_progress < PROGRESS_INTERVAL_S:
+            return
+        self._last_progress = now
+        done = min(max(done_s, 0.0), total)
+        elapsed = now - self._stage_started
+        speed = done / elapsed if elapsed > 0 else 0.0
+        eta = (total - done) / speed if speed > 0 else -1.0
+        self.progress.emit(self._current_stage, 100.0 * done / total, speed, eta)
+
+    def _execute_ffmpeg(self, ffmpeg, offset_s=0.0):
+        """Run an FFmpeg command under the supervisor, reporting its output time (plus offset_s) as stage
+        progress. Raises JobCancelled as soon as the job is cancelled (the run step discards the partial output).
+        """
+        self._check_ffmpeg(self._start_ffmpeg(ffmpeg, lambda t: self._report_progress(offset_s + t)).result())
+
+    def _start_ffmpeg(self, ffmpeg, on_time, is_cancelled=None):
+        """Start an FFmpeg command under the supervisor; on_time(seconds) gets its output position.
+        Returns the future of its ProcessResult (see _check_ffmpeg).
+        """
+        def on_stderr_line(line):
+            match = FFMPEG_PROGRESS_RE.match(line)
+            if match and match.group(1) == "out_time_us" and match.group(2).lstrip("-").isdigit():
+                on_time(max(0, int(match.group(2))) / 1_000_000)
+
+        return SUPERVISOR.start(
+            ffmpeg_with_progress(ffmpeg.arguments),
+            is_cancelled=is_cancelled or (lambda: self.is_cancelled),
+            on_stderr_line=on_stderr_line,
+        )
+
+    def _check_ffmpeg(self, result):
+        if result.cancelled and self.is_cancelled:
+            raise JobCancelled()
+        if result.returncode != 0:
+            errors = [line for line in result.stderr_tail if not FFMPEG_PROGRESS_RE.match(line)]
+            raise RuntimeError(f"ffmpeg failed: {errors[-1] if errors else result.returncode}")
+
+    def _complete_message(self):
+        if not self.stage_timings:
+            return "Process complete."
+        timings = ", ".join(f"{name} {secs:.1f}s" for name, secs in self.stage_timings.items())
+        return f"Process complete ({timings})."
+
+    def _source_codec(self):
+        if self.source_codec is None:
+            info = media_info(self.input_file)
+            self.source_codec = info.video_codec if info else ""
+        return self.source_codec
+
+    def _can_copy_video(self):
+        """True if the source video is already in the target codec (safe to -c:v copy)."""
+        return self._source_codec() in ENCODER_SOURCE_CODECS.get(self.video_encoder, ())
+
+    def _use_smart_cut(self):
+        return self.smart_cut and self._can_copy_video()
+
+    def video_extract(self, sermon_video):
+        if self._use_smart_cut():
+            self.smart_cut_extract(sermon_video)
+            return
+
+        # Decide early (and only once) whether this will be a pure copy or actual re-encode.
+        is_copy = self._can_copy_video()
+        if not is_copy and self._use_segment_encode():
+            self.segment_encode(sermon_video)
+            return
+
+        in_time = self.format_time_with_ms(self.in_point / 1000)
+        out_time = self.format_time_with_ms(self.out_point / 1000)
+
+        if is_copy:
+            self.status_update.emit("Preparing to extract video segment...")
+        else:
+            self.status_update.emit("Preparing to extract and transcode video segment...")
+
+        extract = (
+            FFmpeg()
+            .option("y")
+            .input(self.input_file, ss=in_time, to=out_time)
+        )
+
+        if is_copy:
+            self.status_update.emit("Input is already in the target codec — using fast copy (no re-encode)...")
+
+        extract_video = extract.output(sermon_video, **self._video_output_options(is_copy))
+        self._execute_ffmpeg(extract_video)
+        self.status_update.emit("Video segment extracted successfully.")
+
+    def smart_cut_extract(self, sermon_video):
+        """Trim a same-codec source without re-encoding it: only the partial GOPs between the cut
+        points and the nearest keyframes inside them are encoded; the whole GOPs in between are
+        stream-copied, and the pieces are joined with the concat demuxer. Audio is copied.
+        """
+        start = self.in_point / 1000
+        end = self.out_point / 1000
+        info = media_info(self.input_file)
+        keyframes = info.keyframes_near((start, end)) if info else []
+        inside = [t for t in keyframes if start <= t <= end]
+        if len(inside) < 2:
+            # No whole GOP between the cut points: nothing to copy.
+            self.status_update.emit("No keyframes inside the cut; re-encoding the segment...")
+            self._execute_ffmpeg(FFmpeg().option("y").input(
+                self.input_file,
+                ss=self.format_time_with_ms(start),
+                to=self.format_time_with_ms(end),
+            ).output(sermon_video, **self._video_output_options(False)))
+            self.status_update.emit("Video segment extracted successfully.")
+            return
+
+        first, last = inside[0], inside[-1]
+        self.status_update.emit(
+            f"Smart cut: copying {last - first:.1f}s, re-encoding {first - start:.1f}s + {end - last:.1f}s at the edges..."
+        )
+        edge_options = {**self._encoder_settings(), "an": None}
+        with tempfile.TemporaryDirectory(prefix="smartcut-", dir=os.path.dirname(sermon_video) or None) as work:
+            parts = []
+            # MPEG-TS parts carry their parameter sets in-band, so encoded and copied GOPs can be joined.
+            for name, part_start, part_end, options in (
+                ("head", start, first, edge_options),
+                ("middle", first, last, {"vcodec": "copy", "an": None}),
+                ("tail", last, end, edge_options),
+            ):
+                if part_end - part_start < 0.001:
+                    continue
+                part = os.path.join(work, f"{name}.ts")
+                # Input seeking with copy lands on the keyframe at or before ss; keep ss on its keyframe.
+                self._execute_ffmpeg(FFmpeg().option("y").input(
+                    self.input_file, ss=f"{part_start:.6f}", t=f"{part_end - part_start:.6f}"
+                ).output(part, f="mpegts", **options), offset_s=part_start - start)
+                parts.append(part)
+                if self.is_cancelled:
+                    return
+
+            concat_list = os.path.join(work, "parts.txt")
+            with open(concat_list, "w") as f:
+                for part in parts:
+                    escaped = part.replace("'", "'\\''")
+                    f.write(f"file '{escaped}'\n")
+
+            self._execute_ffmpeg(FFmpeg().option("y").input(
+                concat_list, f="concat", safe=0
+            ).input(
+                self.input_file,
+                ss=self.format_time_with_ms(start),
+                to=self.format_time_with_ms(end),
+            ).output(
+                sermon_video,
+                {"map": ["0:v:0", "1:a?"], "tag:v": SMART_CUT_TAGS[self.video_encoder]},
+                c="copy",
+                movflags="+faststart",
+            ))
+        self.status_update.emit("Video segment extracted successfully.")
+
+    def _use_segment_encode(self):
+        return self.encode_segments > 1 and (self.out_point - self.in_point) / 1000 >= 2 * MIN_ENCODE_SEGMENT_S
+
+    def _segment_bounds(self):
+        """Split times of the cut for a segment-parallel encode: even splits moved to the nearest keyframe
+        (so no segment decodes frames before its start), at least MIN_ENCODE_SEGMENT_S apart.
+        """
+        start = self.in_point / 1000
+        end = self.out_point / 1000
+        n = min(self.encode_segments, int((end - start) // MIN_ENCODE_SEGMENT_S))
+        targets = [start + (end - start) * i / n for i in range(1, n)]
+        info = media_info(self.input_file)
+        keyframes = info.keyframes_near(targets) if info else []
+        bounds = [start]
+        for target in targets:
+            keyframe = min(keyframes, key=lambda k: abs(k - target), default=target)
+            for split in (keyframe, target):
+                if split - bounds[-1] >= MIN_ENCODE_SEGMENT_S and end - split >= MIN_ENCODE_SEGMENT_S:
+                    bounds.append(split)
+                    break
+        return bounds + [end]
+
+    def segment_encode(self, sermon_video):
+        """Re-encode the cut as keyframe-aligned segments in parallel ffmpeg processes, each with its share
+        of the cores, then join them losslessly with the concat demuxer and copy the source audio back in.
+        Single 1080p x265 / SVT-AV1 encodes do not keep many cores busy; separate encoders do.
+        """
+        bounds = self._segment_bounds()
+        segments = list(zip(bounds, bounds[1:]))
+        threads = max(1, (os.cpu_count() or 1) // len(segments))
+        settings = self._encoder_settings()
+        option, value = SEGMENT_THREAD_OPTIONS.get(self.video_encoder, SEGMENT_THREAD_OPTIONS[DEFAULT_VIDEO_ENCODER])
+        value = value.format(n=threads)
+        settings[option] = f"{settings[option]}:{value}" if option in settings else value
+        self.status_update.emit(f"Encoding {len(segments)} segments in parallel ({threads} threads each)...")
+
+        start = bounds[0]
+        # Output position of each segment; summed for the stage progress (all updated on the supervisor thread)
+        positions = [0.0] * len(segments)
+        failed = []
+
+        def on_time(i, t):
+            positions[i] = t
+            self._report_progress(sum(positions))
+
+        with tempfile.TemporaryDirectory(prefix="segments-", dir=os.path.dirname(sermon_video) or None) as work:
+            parts = []
+            futures = []
+            for i, (part_start, part_end) in enumerate(segments):
+                # Matroska parts from one encoder and settings share their codec headers, so they concat as-is.
+                part = os.path.join(work, f"part{i:03d}.mkv")
+                encode = FFmpeg().option("y").input(
+                    self.input_file, ss=f"{part_start:.6f}", t=f"{part_end - part_start:.6f}"
+                ).output(part, map="0:v:0", an=None, **settings)
+                futures.append(self._start_ffmpeg(
+                    encode, lambda t, i=i: on_time(i, t), is_cancelled=lambda: self.is_cancelled or bool(failed)
+                ))
+                parts.append(part)
+            for future in as_completed(futures):
+                result = future.result()
+                if result.returncode != 0 and not result.cancelled:
+                    # Stop the other segments; this one's error is reported.
+                    failed.append(result)
+            for result in failed + [future.result() for future in futures]:
+                self._check_ffmpeg(result)
+
+            concat_list = os.path.join(work, "parts.txt")
+            with open(concat_list, "w") as f:
+                for part in parts:
+                    escaped = part.replace("'", "'\\''")
+                    f.write(f"file '{escaped}'\n")
+
+            self.status_update.emit(f"Joining {len(segments)} segments...")
+            self._execute_ffmpeg(FFmpeg().option("y").input(
+                concat_list, f="concat", safe=0
+            ).input(
+                self.input_file,
+                ss=self.format_time_with_ms(start),
+                to=self.format_time_with_ms(bounds[-1]),
+            ).output(
+                sermon_video,
+                {"map": ["0:v:0", "1:a?"]},
+                c="copy",
+                movflags="+faststart",
+            ))
+        self.status_update.emit("Video segment extracted successfully.")
+
+    def video_audio_extract(self, sermon_video, sermon_audio):
+        """Write the trimmed sermon video and the 16 kHz mono WAV as two outputs of one ffmpeg run.
+        The source is read and decoded once instead of re-reading the freshly written video.
+        """
+        in_time = self.format_time_with_ms(self.in_point / 1000)
+        out_time = self.format_time_with_ms(self.out_point / 1000)
+
+        if self._use_smart_cut():
+            # The smart cut never decodes most of the video, so there is no shared decode to reuse.
+            self.smart_cut_extract(sermon_video)
+            if not self.is_cancelled:
+                self.audio_extract(self.input_file, sermon_audio, ss=in_time, to=out_time)
+            return
+
+        is_copy = self._can_copy_video()
+        if not is_copy and self._use_segment_encode():
+            # The segments decode separately; the WAV comes from its own (cheap) audio-only pass.
+            self.segment_encode(sermon_video)
+            self.audio_extract(self.input_file, sermon_audio, ss=in_time, to=out_time)
+            return
+        if is_copy:
+            self.status_update.emit("Extracting video segment and audio (fast copy, single pass)...")
+        else:
+            self.status_update.emit("Transcoding video segment and extracting audio (single pass)...")
+
+        extract = (
+            FFmpeg()
+            .option("y")
+            .input(self.input_file, ss=in_time, to=out_time)
+            .output(sermon_video, **self._video_output_options(is_copy))
+            .output(sermon_audio, acodec="pcm_s16le", ac=1, ar=16000)
+        )
+        self._execute_ffmpeg(extract)
+        self.status_update.emit("Video segment and audio extracted successfully.")
+
+    def _video_output_options(self, is_copy):
+        """ffmpeg output options for the sermon video for the selected encoder."""
+        if is_copy:
+            options = {"vcodec": "copy", "acodec": "copy", "movflags": "+faststart"}
+            if self.video_encoder in COPY_TAGS:
+                options["tag:v"] = COPY_TAGS[self.video_encoder]
+            return options
+        return {**self._encoder_settings(), "acodec": "copy", "movflags": "+faststart"}
+
+    def _encoder_settings(self):
+        """ffmpeg options for the selected encoder and preset. An auto preset is picked (once per job) from
+        sample encodes of the cut; see estimate_encodes.
+        """
+        if self.video_preset != AUTO_PRESET:
+            return encoder_settings(self.video_encoder, self.video_preset)
+        if self._auto_preset is None:
+            self.status_update.emit("Timing sample encodes to pick a preset...")
+            estimates = estimate_encodes(self.input_file, self.in_point / 1000, self.out_point / 1000,
+                                         [self.video_encoder], lambda: self.is_cancelled) or []
+            if self.is_cancelled:
+                raise JobCancelled()
+            preset = pick_preset(estimates, self.video_encoder, self.target_encode_s)
+            if preset is None:
+                preset = ENCODER_SETTINGS.get(self.video_encoder, ENCODER_SETTINGS[DEFAULT_VIDEO_ENCODER])["preset"]
+                self.status_update.emit(f"Could not time sample encodes; using preset {preset}")
+            else:
+                predicted = next(e for e in estimates if e["preset"] == preset)
+                self.status_update.emit(
+                    f"Preset {preset}: {format_estimate(predicted)} (target {self.target_encode_s / 60:g} min)"
+                )
+            self._auto_preset = preset
+        return encoder_settings(self.video_encoder, self._auto_preset)
+
+    def audio_extract(self, video_file, audio_file, ss=None, to=None):
+        self.status_update.emit("Converting video to audio...")
+
+        input_kwargs = {}
+        if ss is not None and to is not None:
+            input_kwargs = {"ss": ss, "to": to}
+
+        extract_audio = (
+            FFmpeg()
+            .option("y")
+            .input(video_file, **input_kwargs)
+            .output(audio_file, acodec="pcm_s16le", ac=1, ar=16000)
+        )
+
+        self._execute_ffmpeg(extract_audio)
+        self.status_update.emit("Audio conversion completed successfully.")
+
+    def stream_transcribe(self, source, sermon_text, ss=None, to=None, sermon_video=None):
+        """Decode 16 kHz mono WAV to a pipe and feed it to whisper-cli on stdin (no sermon.wav on disk).
+        If sermon_video is given, the trimmed video is written by the same ffmpeg run (single pass).
+        """
+        self.status_update.emit("Streaming audio into whisper...")
+
+        input_kwargs = {}
+        if ss is not None and to is not None:
+            input_kwargs = {"ss": ss, "to": to}
+
+        if sermon_video and self._use_smart_cut():
+            # Smart cut runs its own ffmpeg passes; then only audio is streamed from the source.
+            self.smart_cut_extract(sermon_video)
+            sermon_video = None
+        elif sermon_video and not self._can_copy_video() and self._use_segment_encode():
+            self.segment_encode(sermon_video)
+            sermon_video = None
+
+        stream = FFmpeg().option("y").input(source, **input_kwargs)
+        if sermon_video:
+            stream = stream.output(sermon_video, **self._video_output_options(self._can_copy_video()))
+        stream = stream.output("pipe:1", f="wav", acodec="pcm_s16le", ac=1, ar=16000)
+
+        # ffmpeg writes straight into whisper's stdin; the supervisor drains both stderrs.
+        audio_read, audio_write = os.pipe()
+        try:
+            ffmpeg_exit = SUPERVISOR.start(stream.arguments, is_cancelled=lambda: self.is_cancelled,
+                                           stdout=audio_write)
+        except OSError:
+            os.close(audio_read)
+            raise
+        finally:
+            os.close(audio_write)
+        self.transcribe("-", sermon_text, audio_stdin=audio_read, audio_feed=ffmpeg_exit)
+
+    def transcribe(self, sermon_audio, sermon_text, audio_stdin=None, audio_feed=None):
+        """Run whisper-cli over sermon_audio. Pass sermon_audio="-" with audio_stdin (a pipe's read fd, closed
+        here) to read a piped WAV, and audio_feed (the future of the process writing it) so a transcript of
+        audio cut short by a failed feed is left as .part. Segments are written to the transcript files as
+        whisper prints them (see TranscriptWriter).
+        """
+        if self.strip_non_speech and audio_stdin is None and self._speech_map is None:
+            self.transcribe_speech_only(sermon_audio, sermon_text)
+            return
+        if self.transcribe_chunks > 1 and audio_stdin is None:
+            self.transcribe_parallel(sermon_audio, sermon_text)
+            return
+        # The server takes a file upload, so streamed audio always goes to whisper-cli.
+        if self.whisper_server and audio_stdin is None:
+            server = WHISPER_SERVERS.get(self.whisper_server, self.model_path, self.threads_per_worker)
+            if server is not None:
+                try:
+                    self.transcribe_with_server(server, sermon_audio, sermon_text)
+                    return
+                except RuntimeError as e:
+                    self.status_update.emit(f"{e}; falling back to whisper-cli")
+
+        self.status_update.emit("Transcribing audio...")
+
+        whisper_cmd = [
+            self.whisper_cli,
+            "-m",
+            self.model_path,
+            "-np",
+            "-pp",
+            "-f",
+            sermon_audio,
+        ]
+
+        # stderr carries the -pp progress lines; the supervisor keeps its tail for the error message.
+        def on_stderr_line(line):
+            match = WHISPER_PROGRESS_RE.search(line)
+            if match:
+                total = self._speech_map.kept_s if self._speech_map else (self.out_point - self.in_point) / 1000
+                self._report_transcribed(total * int(match.group(1)) / 100)
+
+        with self._transcript_writer(sermon_text) as writer:
+            def on_stdout_line(line):
+                # "[00:00:00.000 --> 00:00:04.000]  text"
+                segment = parse_whisper_segment(line)
+                if segment:
+                    writer.add(*segment)
+
+            try:
+                exit_future = SUPERVISOR.start(
+                    whisper_cmd,
+                    is_cancelled=lambda: self.is_cancelled,
+                    stdin=audio_stdin if audio_stdin is not None else subprocess.DEVNULL,
+                    on_stdout_line=on_stdout_line,
+                    on_stderr_line=on_stderr_line,
+                )
+            finally:
+                if audio_stdin is not None:
+                    # whisper now owns the read end; closing ours lets ffmpeg see EPIPE if whisper exits early.
+                    os.close(audio_stdin)
+            result = exit_future.result()
+            # whisper exits 0 on a truncated WAV, so the feed must have succeeded too before finishing.
+            feed = audio_feed.result() if audio_feed is not None else None
+
+            if result.cancelled or (feed is not None and feed.cancelled):
+                self.status_update.emit("Transcription cancelled.")
+            elif result.returncode != 0:
+                # Raise so the stage is not checkpointed (or reported) as done.
+                raise RuntimeError(f"whisper-cli failed: {result.error_line()}")
+            elif feed is not None and feed.returncode != 0:
+                raise RuntimeError(f"ffmpeg failed: {feed.error_line()}")
+            else:
+                writer.finish()
+                self._report_progress((self.out_point - self.in_point) / 1000, final=True)
+                self.status_update.emit("Transcription completed successfully.")
+
+    def _report_transcribed(self, audio_s, final=False):
+        """Report transcription progress with audio_s of the WAV being transcribed done. Times in a
+        speech-only copy are mapped back to the cut, so progress and ETA are against the whole sermon.
+        """
+        if self._speech_map is not None:
+            audio_s = self._speech_map.to_original(audio_s, is_end=True)
+        self._report_progress(audio_s, final)
+
+    def _transcript_writer(self, sermon_text):
+        return TranscriptWriter(sermon_text, self.in_point / 1000, self._speech_map)
+
+    def transcribe_speech_only(self, sermon_audio, sermon_text):
+        """Transcribe a copy of sermon_audio without its long silence and music (whisper spends time on
+        those and may fill them with hallucinated text). Timestamps are mapped back to the full audio.
+        """
+        self.status_update.emit("Finding silence and music to skip...")
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with tempfile.TemporaryDirectory(prefix="speech-", dir=CACHE_DIR) as work:
+            speech_audio = os.path.join(work, "speech.wav")
+            speech_map = compact_speech(sermon_audio, speech_audio, self.strip_min_gap_s,
+                                        is_cancelled=lambda: self.is_cancelled)
+            if speech_map is None:
+                raise JobCancelled()
+            if speech_map.skipped_s > 0:
+                self.status_update.emit(
+                    f"Skipping {speech_map.skipped_s:.0f}s of silence and music "
+                    f"({100 * speech_map.skipped_s / speech_map.total_s:.0f}% of the audio)."
+                )
+            else:
+                self.status_update.emit("No long silence or music to skip.")
+                speech_audio = sermon_audio
+            self._speech_map = speech_map
+            started = time.perf_counter()
+            try:
+                self.transcribe(speech_audio, sermon_text)
+            finally:
+                self._speech_map = None
+        if speech_map.skipped_s > 0 and speech_map.kept_s > 0 and not self.is_cancelled:
+            # At the speed measured on the kept audio, the skipped audio would have taken this long.
+            saved_s = speech_map.skipped_s * (time.perf_counter() - started) / speech_map.kept_s
+            self.status_update.emit(
+                f"Skipped {speech_map.skipped_s:.0f}s of audio; saved ~{saved_s:.0f}s of transcription."
+            )
+
+    def transcribe_with_server(self, server, sermon_audio, sermon_text):
+        """Transcribe through a resident whisper-server, which already has the model loaded."""
+        self.status_update.emit("Transcribing audio (model already loaded)...")
+        started = time.perf_counter()
+        segments = server.transcribe(sermon_audio, lambda: self.is_cancelled)
+        if segments is None:
+            self.status_update.emit("Transcription cancelled.")
+            return
+        latency = time.perf_counter() - started
+        with self._transcript_writer(sermon_text) as writer:
+            for segment in segments:
+                writer.add(*segment)
+            writer.finish()
+        self._report_progress((self.out_point - self.in_point) / 1000, final=True)
+        self.status_update.emit(f"Transcription completed successfully ({latency:.1f}s on whisper-server).")
+
+    def transcribe_parallel(self, sermon_audio, sermon_text):
+        """Chunked transcription: split at pauses and run several whisper-cli workers at once."""
+        self.status_update.emit(f"Transcribing audio in {self.transcribe_chunks} parallel chunks...")
+        with self._transcript_writer(sermon_text) as writer:
+            transcribe_chunked(
+                self.whisper_cli,
+                self.model_path,
+                sermon_audio,
+                self.transcribe_chunks,
+                threads_per_worker=self.threads_per_worker,
+                is_cancelled=lambda: self.is_cancelled,
+                on_progress=lambda seconds: self._report_transcribed(seconds, final=True),
+                on_segment=writer.add,
+            )
+            if self.is_cancelled:
+                self.status_update.emit("Transcription cancelled.")
+                return
+            writer.finish()
+        self._report_progress((self.out_point - self.in_point) / 1000, final=True)
+        self.status_update.emit("Transcription completed successfully.")
+
+    def format_time_with_ms(self, seconds):
+        hours = int(seconds // 3600)
+        minutes = int((seconds % 3600) // 60)
+        seconds = seconds % 60
+        return f"{hours:02d}:{minutes:02d}:{seconds:06.3f}"
+
+    def cancel(self):
+        self.is_cancelled = True
+
+
+class WaveformThread(QThread):
+    """Load a source's WaveformPyramid and sermon suggestion from their caches, or build whichever is
+    missing from one 16 kHz mono decode (the speech analysis needs that rate; the waveform is binned from it).
+    """
+
+    ready = Signal(str, object)
+    # path, (in_ms, out_ms) of the suggested sermon or None
+    suggested = Signal(str, object)
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.is_cancelled = False
+
+    def run(self):
+        try:
+            cache_path = waveform_cache_path(self.path)
+        except OSError:
+            return
+        pyramid = WaveformPyramid.load(cache_path)
+        if pyramid is not None:
+            self.ready.emit(self.path, pyramid)
+        points = PROBE_CACHE.get(self.path, "sermon_suggestion")
+        if pyramid is None or points is None:
+            os.makedirs(WAVEFORM_CACHE_DIR, exist_ok=True)
+            with tempfile.TemporaryDirectory(dir=WAVEFORM_CACHE_DIR) as work:
+                raw_path = os.path.join(work, "audio.raw")
+                if not decode_mono_pcm(self.path, raw_path, SUGGEST_SAMPLE_RATE, lambda: self.is_cancelled):
+                    if not self.is_cancelled:
+                        self.suggested.emit(self.path, None)
+                    return
+                if pyramid is None:
+                    pyramid = WaveformPyramid.from_raw(raw_path, lambda: self.is_cancelled, SUGGEST_SAMPLE_RATE)
+                    if pyramid is None:
+                        return
+                    try:
+                        pyramid.save(cache_path)
+                    except OSError as e:
+                        print(f"Failed to cache waveform: {e}")
+                    self.ready.emit(self.path, pyramid)
+                if points is None:
+                    points = sermon_points_from_raw(raw_path, lambda: self.is_cancelled)
+                    if points is None:
+                        return
+                    PROBE_CACHE.put(self.path, "sermon_suggestion", points)
+        if not self.is_cancelled:
+            self.suggested.emit(self.path, tuple(points) if points else None)
+
+    def cancel(self):
+        self.is_cancelled = True
+
+
+class FilmstripThread(QThread):
+    """Load a source's Filmstrip from the cache, or build it with a keyframe-only ffmpeg decode."""
+
+    ready = Signal(str, object)
+
+    def __init__(self, path, duration_ms):
+        super().__init__()
+        self.path = path
+        self.duration_ms = duration_ms
+        self.is_cancelled = False
+
+    def run(self):
+        try:
+            directory = os.path.join(THUMBNAIL_CACHE_DIR, source_identity_key(self.path))
+        except OSError:
+            return
+        filmstrip = Filmstrip.load(directory)
+        if filmstrip is None and self.duration_ms > 0:
+            filmstrip = self._build(directory)
+        if filmstrip is not None and not self.is_cancelled:
+            self.ready.emit(self.path, filmstrip)
+
+    def _build(self, directory):
+        duration_s = self.duration_ms / 1000
+        interval_s = max(THUMBNAIL_MIN_INTERVAL_S, duration_s / THUMBNAIL_MAX_COUNT)
+        width, height = THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT
+        columns, rows = THUMBNAIL_TILE
+        os.makedirs(THUMBNAIL_CACHE_DIR, exist_ok=True)
+        work = tempfile.mkdtemp(dir=THUMBNAIL_CACHE_DIR)
+        # Decoding keyframes only is what makes this cheap on long HEVC/AV1 recordings;
+        # the fps filter then takes the latest keyframe at each interval.
+        extract = FFmpeg().option("y").input(self.path, skip_frame="nokey").output(
+            os.path.join(work, "sheet_%03d.jpg"),
+            map="0:v:0",
+            vf=(
+                f"fps=1/{interval_s:.3f},"
+                f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+                f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,tile={columns}x{rows}"
+            ),
+            **{"q:v": 5},
+        )
+        if not run_cancellable(extract.arguments, lambda: self.is_cancelled):
+            shutil.rmtree(work, ignore_errors=True)
+            return None
+        filmstrip = Filmstrip(work, interval_s, int(duration_s // interval_s) + 1)
+        filmstrip.save_index()
+        try:
+            os.replace(work, directory)
+        except OSError:
+            # Another instance finished the same file first; use its copy.
+            shutil.rmtree(work, ignore_errors=True)
+        return Filmstrip.load(directory)
+
+    def cancel(self):
+        self.is_cancelled = True
 
 
+class ProbeThread(QThread):
+    """ffprobe a newly loaded source (media_info) off the GUI thread; a cold probe of a file on a network
+    share can take seconds."""
 
-class ExtractAndTranscribeThread(QThread):
-    status_update = Signal(str)
-    finished = Signal(str)
+    ready = Signal(str, object)
 
-    def __init__(self, input_file, in_point, out_point, base_name, whisper_cli=None, model_path=None, video_encoder=DEFAULT_VIDEO_ENCODER, do_transcribe=True, do_transcode=True):
+    def __init__(self, path):
         super().__init__()
-        self.input_file = input_file
-        self.in_point = in_point
-        self.out_point = out_point
-        self.base_name = base_name
+        self.path = path
         self.is_cancelled = False
-        self.whisper_cli = whisper_cli or get_default_whisper_cli()
-        self.model_path = model_path or os.path.join(DEFAULT_MODELS_DIR, "ggml-large-v3.bin")
-        self.video_encoder = video_encoder or DEFAULT_VIDEO_ENCODER
-        self.do_transcribe = bool(do_transcribe)
-        self.do_transcode = bool(do_transcode)
+
+    def run(self):
+        info = media_info(self.path)
+        if not self.is_cancelled:
+            self.ready.emit(self.path, info)
+
+    def cancel(self):
+        self.is_cancelled = True
 
 
+class KeyframeIndexThread(QThread):
+    """Build (or load from the probe cache) the full keyframe index of a source for fast scrub seeks."""
+
+    ready = Signal(str, object)
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.is_cancelled = False
+
     def run(self):
-        try:
-            input_dir = os.path.dirname(self.input_file)
-            sermon_video = os.path.join(input_dir, f"{self.base_name} sermon.mp4")
-            sermon_audio = os.path.join(input_dir, f"{self.base_name} sermon.wav")
-            sermon_text = os.path.join(input_dir, f"{self.base_name} sermon.txt")
+        info = media_info(self.path)
+        keyframes = info.keyframes(lambda: self.is_cancelled) if info else []
+        if keyframes and not self.is_cancelled:
+            self.ready.emit(self.path, keyframes)
+
+    def cancel(self):
+        self.is_cancelled = True
 
-            in_time = self.format_time_with_ms(self.in_point / 1000)
-            out_time = self.format_time_with_ms(self.out_point / 1000)
 
-            if self.do_transcode:
-                self.video_extract(sermon_video)
-                if self.is_cancelled:
-                    return
-                audio_source = sermon_video
-            else:
-                audio_source = self.input_file
+class ProxyThread(QThread):
+    """Build (or find in the cache) a small short-GOP H.264 playback proxy of a source."""
 
-            if self.do_transcribe:
-                self.audio_extract(audio_source, sermon_audio,
-                                   ss=(in_time if not self.do_transcode else None),
-                                   to=(out_time if not self.do_transcode else None))
-                if self.is_cancelled:
-                    return
-                self.transcribe(sermon_audio, sermon_text)
+    ready = Signal(str, str)
 
-            self.finished.emit("Process complete.")
-        except Exception as e:
-            self.finished.emit(f"Error during processing: {str(e)}")
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.is_cancelled = False
 
-    def _input_is_h264(self, path):
-        """Return True if the primary video stream codec is h264 (safe to -c:v copy)."""
-        if not path:
-            return False
+    def run(self):
         try:
-            cmd = [
-                "ffprobe",
-                "-v", "error",
-                "-select_streams", "v:0",
-                "-show_entries", "stream=codec_name",
-                "-of", "csv=p=0",
-                path,
-            ]
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=15
+            proxy_path = os.path.join(PROXY_CACHE_DIR, f"{source_identity_key(self.path)}.mp4")
+        except OSError:
+            return
+        if not os.path.isfile(proxy_path):
+            os.makedirs(PROXY_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{proxy_path}.{uuid.uuid4().hex}.tmp.mp4"
+            encode = FFmpeg().option("y").input(self.path).output(
+                tmp_path,
+                map=["0:v:0", "0:a:0?"],
+                vf=f"scale=-2:{PROXY_HEIGHT}",
+                vcodec="libx264",
+                preset="veryfast",
+                crf=28,
+                g=PROXY_GOP_FRAMES,
+                acodec="aac",
+                **{"b:a": "96k"},
+                movflags="+faststart",
             )
-            codec = (result.stdout or "").strip().lower()
-            return codec in ("h264", "avc1")
-        except Exception:
-            # ffprobe unavailable or unreadable file -> fall back to re-encode
-            return False
-
-    def video_extract(self, sermon_video):
-        in_time = self.format_time_with_ms(self.in_point / 1000)
-        out_time = self.format_time_with_ms(self.out_point / 1000)
-
-        # Decide early (and only once) whether this will be a pure copy or actual re-encode.
-        is_copy = (self.video_encoder == "h264" and self._input_is_h264(self.input_file))
-        if is_copy:
-            self.status_update.emit("Preparing to extract video segment...")
-        else:
-            self.status_update.emit("Preparing to extract and transcode video segment...")
+            if not run_cancellable(encode.arguments, lambda: self.is_cancelled):
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                return
+            os.replace(tmp_path, proxy_path)
+        if not self.is_cancelled:
+            self.ready.emit(self.path, proxy_path)
 
-        extract = (
-            FFmpeg()
-            .option("y")
-            .input(self.input_file, ss=in_time, to=out_time)
-        )
+    def cancel(self):
+        self.is_cancelled = True
 
-        if is_copy:
-            self.status_update.emit("Input is already H.264 — using fast copy (no re-encode)...")
-            output_opts = {"vcodec": "copy", "acodec": "copy", "movflags": "+faststart"}
-        elif self.video_encoder == "av1":
-            # Replicate Handbrake AV1 (SVT) settings from user logs:
-            # preset 6, tune=psnr, profile main (default), crf 34.50 (RF), level auto
-            v_opts = {"vcodec": "libsvtav1", "preset": 6, "crf": 34.5, "svtav1-params": "tune=1"}
-            output_opts = {**v_opts, "acodec": "copy", "movflags": "+faststart"}
-        elif self.video_encoder == "h265":
-            v_opts = {"vcodec": "libx265", "preset": "fast", "crf": 30}
-            output_opts = {**v_opts, "acodec": "copy", "movflags": "+faststart"}
-        else:
-            # h264 default (re-encode)
-            v_opts = {"vcodec": "libx264", "preset": "fast", "crf": 28}
-            output_opts = {**v_opts, "acodec": "copy", "movflags": "+faststart"}
 
-        extract_video = extract.output(sermon_video, **output_opts)
-        extract_video.execute()
-        self.status_update.emit("Video segment extracted successfully.")
+class EncodeEstimateThread(QThread):
+    """Time sample encodes of a cut with every encoder and preset, and predict the full encode (estimate_encodes)."""
 
-    def audio_extract(self, video_file, audio_file, ss=None, to=None):
-        self.status_update.emit("Converting video to audio...")
+    # path, estimate dict (as each becomes known)
+    estimated = Signal(str, object)
+    ready = Signal(str, object)
 
-        input_kwargs = {}
-        if ss is not None and to is not None:
-            input_kwargs = {"ss": ss, "to": to}
+    def __init__(self, path, in_s, out_s):
+        super().__init__()
+        self.path = path
+        self.in_s = in_s
+        self.out_s = out_s
+        self.is_cancelled = False
 
-        extract_audio = (
-            FFmpeg()
-            .option("y")
-            .input(video_file, **input_kwargs)
-            .output(audio_file, acodec="pcm_s16le", ac=1, ar=16000)
-        )
+    def run(self):
+        estimates = estimate_encodes(self.path, self.in_s, self.out_s, is_cancelled=lambda: self.is_cancelled,
+                                     on_estimate=lambda estimate: self.estimated.emit(self.path, estimate))
+        if not self.is_cancelled:
+            self.ready.emit(self.path, estimates or [])
 
-        extract_audio.execute()
-        self.status_update.emit("Audio conversion completed successfully.")
+    def cancel(self):
+        self.is_cancelled = True
 
-    def transcribe(self, sermon_audio, sermon_text):
-        self.status_update.emit("Transcribing audio...")
 
-        whisper_cmd = [
-            self.whisper_cli,
-            "-m",
-            self.model_path,
-            "-np",
-            "-nt",
-            "-f",
-            sermon_audio,
-        ]
+class PipelineScheduler:
+    """Assembly line for many jobs: one worker pool per stage (probe, video, audio, transcribe),
+    with bounded queues in between so ffmpeg for job N+1 overlaps whisper for job N.
 
-        process = subprocess.Popen(
-            whisper_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True,
-        )
+    Jobs are ExtractAndTranscribeThread objects driven step by step (prepare/run_step) from the pool
+    threads; their usual status_update/finished signals are emitted as they progress. A full downstream
+    queue blocks the upstream worker, which keeps finished-but-unconsumed intermediates bounded.
+    Jobs that would write the same output files run one after another, in submission order.
+    """
 
-        # Initialize an empty list to store the output
-        transcription_output = []
+    def __init__(self, limits=None, queue_size=DEFAULT_STAGE_QUEUE_SIZE, on_finished=None):
+        self.limits = {**DEFAULT_STAGE_LIMITS, **(limits or {})}
+        self.on_finished = on_finished
+        self._started = time.monotonic()
+        self._lock = threading.Condition()
+        self._active = 0
+        # The probe queue is the intake and is unbounded so submit() never blocks the caller.
+        self._queues = {
+            stage: queue.Queue(maxsize=0 if stage == JOB_STAGES[0] else max(1, queue_size))
+            for stage in JOB_STAGES
+        }
+        self._busy = {stage: 0 for stage in JOB_STAGES}
+        self._busy_seconds = {stage: 0.0 for stage in JOB_STAGES}
+        self._completed = {stage: 0 for stage in JOB_STAGES}
+        # Output prefix -> jobs writing it, oldest (the one in the pipeline) first
+        self._outputs = {}
+        self._workers = []
+        for stage in JOB_STAGES:
+            for n in range(max(1, self.limits[stage])):
+                worker = threading.Thread(target=self._work, args=(stage,), name=f"{stage}-{n}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    @staticmethod
+    def pool_for(step):
+        """Which stage pool runs a step: anything involving whisper is a transcribe step,
+        otherwise the first stage it produces (single-pass video+audio is a video step)."""
+        stages = step[0]
+        return "transcribe" if "transcribe" in stages else stages[0]
+
+    def submit(self, job):
+        job._pipeline_steps = None
+        job._pipeline_index = 0
+        with self._lock:
+            self._active += 1
+            writers = self._outputs.setdefault(job.output_prefix(), [])
+            writers.append(job)
+            if len(writers) > 1:
+                job.status_update.emit("Waiting for the job writing the same output files to finish...")
+                return
+        self._queues[JOB_STAGES[0]].put(job)
 
+    def _work(self, stage):
+        q = self._queues[stage]
         while True:
-            if self.is_cancelled:
-                process.terminate()
-                self.status_update.emit("Transcription cancelled.")
+            job = q.get()
+            if job is None:
                 return
+            with self._lock:
+                self._busy[stage] += 1
+            start = time.monotonic()
+            try:
+                next_pool = self._advance(job, stage)
+            except Exception as e:
+                next_pool = None
+                self._finish(job, f"Error during processing: {str(e)}")
+            finally:
+                with self._lock:
+                    self._busy[stage] -= 1
+                    self._busy_seconds[stage] += time.monotonic() - start
+                    self._completed[stage] += 1
+            if next_pool:
+                self._queues[next_pool].put(job)
+
+    def _advance(self, job, stage):
+        """Run every consecutive step of job that belongs to this pool; return the next pool or None."""
+        if job._pipeline_steps is None:
+            job._pipeline_steps = job.prepare()
+        steps = job._pipeline_steps
+        while job._pipeline_index < len(steps):
+            step = steps[job._pipeline_index]
+            pool = self.pool_for(step)
+            if pool != stage:
+                return pool
+            if job.is_cancelled or not job.run_step(step):
+                self._finish(job, "Process cancelled.")
+                return None
+            job._pipeline_index += 1
+        self._finish(job, job._complete_message())
+        return None
+
+    def _finish(self, job, message):
+        job.finished.emit(message)
+        if self.on_finished:
+            self.on_finished(job, message)
+        with self._lock:
+            self._active -= 1
+            writers = self._outputs[job.output_prefix()]
+            writers.remove(job)
+            waiting = writers[0] if writers else None
+            if not writers:
+                del self._outputs[job.output_prefix()]
+            self._lock.notify_all()
+        if waiting is not None:
+            self._queues[JOB_STAGES[0]].put(waiting)
+
+    def stats(self):
+        """Per stage: workers, busy workers, queue depth, jobs handled and utilization (busy share of capacity)."""
+        elapsed = max(1e-6, time.monotonic() - self._started)
+        with self._lock:
+            return {
+                stage: {
+                    "workers": self.limits[stage],
+                    "busy": self._busy[stage],
+                    "queued": self._queues[stage].qsize(),
+                    "completed": self._completed[stage],
+                    "utilization": self._busy_seconds[stage] / (elapsed * max(1, self.limits[stage])),
+                }
+                for stage in JOB_STAGES
+            }
 
-            output = process.stdout.readline()
-            if output:
-                transcription_output.append(output.strip())
-            if output == "" and process.poll() is not None:
-                break
+    def format_stats(self):
+        return " | ".join(
+            f"{stage}: {info['busy']}/{info['workers']} busy, {info['queued']} queued, {info['utilization']:.0%}"
+            for stage, info in self.stats().items()
+        )
 
-        if process.returncode == 0:
-            with open(sermon_text, "w") as f:
-                # Join the lines and write to the file
-                f.write("\n".join(transcription_output))
-            self.status_update.emit("Transcription completed successfully.")
-        else:
-            self.status_update.emit(f"Transcription failed: {process.stderr.read()}")
+    def active_jobs(self):
+        with self._lock:
+            return self._active
 
-    def format_time_with_ms(self, seconds):
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        seconds = seconds % 60
-        return f"{hours:02d}:{minutes:02d}:{seconds:06.3f}"
+    def wait(self):
+        """Block until every submitted job has finished."""
+        with self._lock:
+            while self._active:
+                self._lock.wait()
 
-    def cancel(self):
-        self.is_cancelled = True
+    def shutdown(self):
+        """Stop the workers once they drain their queues (daemon threads; call wait() first to finish jobs)."""
+        for stage in JOB_STAGES:
+            for _ in range(max(1, self.limits[stage])):
+                self._queues[stage].put(None)
 
 
 class SettingsDialog(QDialog):
-    """Settings dialog for whisper-cli path (model and video encoder are now in main right panel)."""
+    """Settings dialog for whisper-cli path, parallel transcription, result cache and pipeline workers (model and video encoder are now in main right panel)."""
 
-    def __init__(self, parent, current_whisper_cli=""):
+    def __init__(self, parent, current_whisper_cli="", current_transcribe_chunks=1, current_threads_per_worker=None,
+                 current_cache_max_gb=DEFAULT_CACHE_MAX_GB, current_stage_limits=None, current_use_proxy=True,
+                 current_use_whisper_server=True, current_model_dirs=None,
+                 current_target_encode_minutes=DEFAULT_TARGET_ENCODE_MINUTES, current_encode_segments=1,
+                 current_strip_non_speech=False, current_strip_min_gap_s=DEFAULT_STRIP_MIN_GAP_S):
         super().__init__(parent)
         self.setWindowTitle("Settings")
         self.setMinimumWidth(500)
@@ -301,6 +3161,96 @@ class SettingsDialog(QDialog):
         cli_layout.addWidget(self.browse_cli_button)
         layout.addLayout(cli_layout)
 
+        # Folders scanned for ggml-*.bin models (first folder wins on duplicate names)
+        layout.addWidget(QLabel(f"Model folders (separated by '{os.pathsep}'):"))
+        self.model_dirs_edit = QLineEdit(os.pathsep.join(current_model_dirs or [DEFAULT_MODELS_DIR]))
+        layout.addWidget(self.model_dirs_edit)
+
+        # Parallel (chunked) transcription: 1 = single whisper-cli process over the whole sermon
+        parallel_layout = QHBoxLayout()
+        parallel_layout.addWidget(QLabel("Parallel transcription chunks:"))
+        self.chunks_spin = QSpinBox()
+        self.chunks_spin.setRange(1, 64)
+        self.chunks_spin.setValue(int(current_transcribe_chunks or 1))
+        parallel_layout.addWidget(self.chunks_spin)
+        parallel_layout.addWidget(QLabel("Threads per worker:"))
+        self.threads_spin = QSpinBox()
+        self.threads_spin.setRange(0, 256)
+        self.threads_spin.setSpecialValueText("Auto")
+        self.threads_spin.setValue(int(current_threads_per_worker or 0))
+        parallel_layout.addWidget(self.threads_spin)
+        layout.addLayout(parallel_layout)
+
+        # Result cache: reuse unchanged stage outputs across re-runs (0 disables)
+        cache_layout = QHBoxLayout()
+        cache_layout.addWidget(QLabel("Result cache size (GB):"))
+        self.cache_spin = QSpinBox()
+        self.cache_spin.setRange(0, 10000)
+        self.cache_spin.setSpecialValueText("Off")
+        self.cache_spin.setValue(int(current_cache_max_gb))
+        cache_layout.addWidget(self.cache_spin)
+        cache_layout.addStretch()
+        layout.addLayout(cache_layout)
+
+        # Turnaround the "Auto" encoder preset aims for (the slowest preset predicted to make it is used)
+        target_layout = QHBoxLayout()
+        target_layout.addWidget(QLabel("Target encode time for the Auto preset (minutes):"))
+        self.target_spin = QSpinBox()
+        self.target_spin.setRange(1, 24 * 60)
+        self.target_spin.setValue(int(current_target_encode_minutes))
+        target_layout.addWidget(self.target_spin)
+        target_layout.addStretch()
+        layout.addLayout(target_layout)
+
+        # Segment-parallel video encode: 1 = one ffmpeg process over the whole cut
+        segments_layout = QHBoxLayout()
+        segments_layout.addWidget(QLabel("Parallel encode segments:"))
+        self.segments_spin = QSpinBox()
+        self.segments_spin.setRange(1, 64)
+        self.segments_spin.setValue(int(current_encode_segments or 1))
+        segments_layout.addWidget(self.segments_spin)
+        segments_layout.addStretch()
+        layout.addLayout(segments_layout)
+
+        # Worker pool size per pipeline stage (the scheduler is created at launch)
+        layout.addWidget(QLabel("Pipeline workers per stage (applies on next launch):"))
+        stages_layout = QHBoxLayout()
+        limits = {**DEFAULT_STAGE_LIMITS, **(current_stage_limits or {})}
+        self.stage_spins = {}
+        for stage in JOB_STAGES:
+            stages_layout.addWidget(QLabel(f"{stage}:"))
+            spin = QSpinBox()
+            spin.setRange(1, 64)
+            spin.setValue(int(limits[stage]))
+            stages_layout.addWidget(spin)
+            self.stage_spins[stage] = spin
+        layout.addLayout(stages_layout)
+
+        # Low-resolution playback proxy for 4K / HEVC / AV1 sources (marking only; jobs use the original)
+        self.proxy_cb = QCheckBox(f"Play a {PROXY_HEIGHT}p proxy of 4K / HEVC / AV1 recordings (built in the background)")
+        self.proxy_cb.setChecked(bool(current_use_proxy))
+        layout.addWidget(self.proxy_cb)
+
+        # Resident whisper-server (found next to whisper-cli or on PATH); whisper-cli is used when there is none
+        self.whisper_server_cb = QCheckBox("Keep the model loaded between jobs (whisper-server, when available)")
+        self.whisper_server_cb.setChecked(bool(current_use_whisper_server))
+        layout.addWidget(self.whisper_server_cb)
+
+        # Speech-only whisper input (timestamps are mapped back); streamed audio has no WAV to analyse
+        strip_layout = QHBoxLayout()
+        self.strip_cb = QCheckBox("Skip silence and music longer than")
+        self.strip_cb.setToolTip("Transcribe only the speech of the WAV (needs Keep WAV file)")
+        self.strip_cb.setChecked(bool(current_strip_non_speech))
+        strip_layout.addWidget(self.strip_cb)
+        self.strip_gap_spin = QSpinBox()
+        self.strip_gap_spin.setRange(2, 600)
+        self.strip_gap_spin.setSuffix(" s")
+        self.strip_gap_spin.setValue(int(current_strip_min_gap_s))
+        strip_layout.addWidget(self.strip_gap_spin)
+        strip_layout.addWidget(QLabel("before transcribing"))
+        strip_layout.addStretch()
+        layout.addLayout(strip_layout)
+
         layout.addStretch()
 
         # Dialog buttons
@@ -328,54 +3278,331 @@ class SettingsDialog(QDialog):
     def get_whisper_cli(self):
         return self.whisper_cli
 
+    def get_transcribe_chunks(self):
+        return self.chunks_spin.value()
+
+    def get_threads_per_worker(self):
+        return self.threads_spin.value() or None
+
+    def get_cache_max_gb(self):
+        return self.cache_spin.value()
+
+    def get_stage_limits(self):
+        return {stage: spin.value() for stage, spin in self.stage_spins.items()}
+
+    def get_use_proxy(self):
+        return self.proxy_cb.isChecked()
+
+    def get_use_whisper_server(self):
+        return self.whisper_server_cb.isChecked()
+
+    def get_target_encode_minutes(self):
+        return self.target_spin.value()
+
+    def get_encode_segments(self):
+        return self.segments_spin.value()
+
+    def get_strip_non_speech(self):
+        return self.strip_cb.isChecked()
+
+    def get_strip_min_gap_s(self):
+        return self.strip_gap_spin.value()
+
+    def get_model_dirs(self):
+        dirs = [d.strip() for d in self.model_dirs_edit.text().split(os.pathsep) if d.strip()]
+        return dirs or [DEFAULT_MODELS_DIR]
+
+
+class VlcEventBridge(QObject):
+    """Re-emits VLC player events, which libvlc delivers on its own thread, as Qt signals
+    (so connected slots run queued on the GUI thread).
+    """
+
+    time_changed = Signal(int)
+    length_changed = Signal(int)
+    playing = Signal()
+    paused = Signal()
+    stopped = Signal()
+    end_reached = Signal()
+
+    def __init__(self, player, parent=None):
+        super().__init__(parent)
+        events = player.event_manager()
+        events.event_attach(vlc.EventType.MediaPlayerTimeChanged, self._on_time_changed)
+        events.event_attach(vlc.EventType.MediaPlayerLengthChanged, self._on_length_changed)
+        events.event_attach(vlc.EventType.MediaPlayerPlaying, lambda event: self.playing.emit())
+        events.event_attach(vlc.EventType.MediaPlayerPaused, lambda event: self.paused.emit())
+        events.event_attach(vlc.EventType.MediaPlayerStopped, lambda event: self.stopped.emit())
+        events.event_attach(vlc.EventType.MediaPlayerEndReached, lambda event: self.end_reached.emit())
+
+    def _on_time_changed(self, event):
+        self.time_changed.emit(int(event.u.new_time))
+
+    def _on_length_changed(self, event):
+        self.length_changed.emit(int(event.u.new_length))
+
+
+class SeekController(QObject):
+    """Coalesces seeks on a VLC player.
+
+    Only the latest target is kept: a seek requested while another is in flight replaces any pending one,
+    and is issued once VLC reports the new time (or after SEEK_TIMEOUT_MS). Fast seeks snap to the nearest
+    keyframe, which VLC can show without decoding forward from one; precise seeks go to the exact time.
+    python-vlc 3 has no fast-seek flag, so snapping to the keyframe index is how a seek is made fast.
+    """
+
+    def __init__(self, player, time_changed, parent=None):
+        super().__init__(parent)
+        self.player = player
+        self.keyframes_ms = []
+        self.latencies_ms = deque(maxlen=SEEK_LATENCY_SAMPLES)
+        self.timeouts = 0
+        self.dropped = 0
+        self._pending = None
+        self._in_flight = None  # (target ms, perf_counter when issued)
+        self._timeout = QTimer(self)
+        self._timeout.setSingleShot(True)
+        self._timeout.setInterval(SEEK_TIMEOUT_MS)
+        self._timeout.timeout.connect(self._on_timeout)
+        time_changed.connect(self._on_time_changed)
+
+    def set_keyframes(self, keyframes_s):
+        self.keyframes_ms = [int(k * 1000) for k in keyframes_s]
+
+    def reset(self):
+        """Forget pending work and the keyframe index (a new file was loaded)."""
+        self._pending = None
+        self._in_flight = None
+        self._timeout.stop()
+        self.keyframes_ms = []
+
+    def seek(self, ms, precise=True):
+        target = int(ms) if precise else self._snap(int(ms))
+        if self._pending is not None:
+            self.dropped += 1
+        self._pending = target
+        if self._in_flight is None:
+            self._issue()
+
+    def _snap(self, ms):
+        if not self.keyframes_ms:
+            return ms
+        i = bisect.bisect_left(self.keyframes_ms, ms)
+        candidates = self.keyframes_ms[max(0, i - 1):i + 1]
+        return min(candidates, key=lambda k: abs(k - ms))
+
+    def _issue(self):
+        target, self._pending = self._pending, None
+        if target is None:
+            return
+        self._in_flight = (target, time.perf_counter())
+        self.player.set_time(target)
+        self._timeout.start()
+
+    def _on_time_changed(self, ms):
+        if self._in_flight is None:
+            return
+        target, issued = self._in_flight
+        self.latencies_ms.append((time.perf_counter() - issued) * 1000)
+        self._in_flight = None
+        self._timeout.stop()
+        self._issue()
+
+    def _on_timeout(self):
+        # No time change reported (e.g. a seek to the current frame); move on to the latest target.
+        self.timeouts += 1
+        self._in_flight = None
+        self._issue()
+
+    def stats(self):
+        """Seek-to-frame latency summary of recent seeks."""
+        latencies = sorted(self.latencies_ms)
+        if not latencies:
+            return "no seeks measured"
+        median = latencies[len(latencies) // 2]
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        return (f"seek latency median {median:.0f} ms, p95 {p95:.0f} ms over {len(latencies)} seeks "
+                f"({self.dropped} coalesced, {self.timeouts} timed out)")
+
+
+class WaveformLane(QWidget):
+    """Audio overview under the timeline: the peak envelope with the RMS level inside it,
+    and the in/out selection shaded. Columns are recomputed only when the width or range changes.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedHeight(48)
+        self.pyramid = None
+        self.duration_ms = 0
+        self.in_ms = 0
+        self.out_ms = 0
+        self._columns = None
+        self._columns_key = None
+        self._gain = 1.0
+        self.suggestion = None
+
+    def set_pyramid(self, pyramid):
+        self.pyramid = pyramid
+        # Scale to the loudest peak so quiet (far-mic) recordings still show their shape.
+        self._gain = 1.0 / max(float(pyramid.levels[-1][0][0]), 1e-3) if pyramid and pyramid.levels[-1][0].size else 1.0
+        self._columns_key = None
+        self.update()
+
+    def set_duration(self, duration_ms):
+        if duration_ms != self.duration_ms:
+            self.duration_ms = duration_ms
+            self.update()
+
+    def set_suggestion(self, suggestion):
+        """Mark suggested (in_ms, out_ms) points, or clear them with None."""
+        self.suggestion = suggestion
+        self.update()
+
+    def set_selection(self, in_ms, out_ms):
+        if (in_ms, out_ms) != (self.in_ms, self.out_ms):
+            self.in_ms, self.out_ms = in_ms, out_ms
+            self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        width, height = self.width(), self.height()
+        painter.fillRect(0, 0, width, height, QColor(32, 32, 32))
+        if self.duration_ms <= 0:
+            return
+        if self.out_ms > self.in_ms:
+            x_in = int(width * self.in_ms / self.duration_ms)
+            x_out = int(width * self.out_ms / self.duration_ms)
+            painter.fillRect(x_in, 0, max(1, x_out - x_in), height, QColor(40, 70, 110))
+        if self.pyramid is None:
+            return
+        key = (width, self.duration_ms)
+        if key != self._columns_key:
+            self._columns = self.pyramid.columns(0.0, self.duration_ms / 1000, width)
+            self._columns_key = key
+        peaks, rms = self._columns
+        mid = height / 2
+        scale = mid * self._gain
+        painter.setPen(QColor(120, 160, 200))
+        for x, level in enumerate(peaks):
+            half = float(level) * scale
+            painter.drawLine(x, int(mid - half), x, int(mid + half))
+        painter.setPen(QColor(210, 225, 240))
+        for x, level in enumerate(rms):
+            half = float(level) * scale
+            painter.drawLine(x, int(mid - half), x, int(mid + half))
+        if self.suggestion:
+            painter.setPen(QColor(240, 190, 60))
+            for ms in self.suggestion:
+                x = int(width * ms / self.duration_ms)
+                painter.drawLine(x, 0, x, height)
+
+
+class ThumbnailPreview(QWidget):
+    """Floating filmstrip thumbnail with its time, shown above the timeline while hovering or dragging."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.ToolTip)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(2, 2, 2, 2)
+        layout.setSpacing(0)
+        self.image = QLabel()
+        layout.addWidget(self.image)
+        self.time = QLabel()
+        self.time.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.time)
+
+    def show_at(self, global_pos, pixmap, time_text):
+        self.image.setPixmap(pixmap)
+        self.time.setText(time_text)
+        self.adjustSize()
+        self.move(global_pos.x() - self.width() // 2, global_pos.y() - self.height() - 8)
+        self.show()
+
+
+class DiscoveryThread(QThread):
+    """Find installed models (and, on first run, a whisper-cli) off the GUI thread during startup.
+
+    Emits [(model_path, label), ...] with labels from the ModelRegistry (reading uncached headers here).
+    """
+
+    ready = Signal(list, str)
+
+    def __init__(self, find_whisper_cli, model_dirs=None):
+        super().__init__()
+        self.find_whisper_cli = find_whisper_cli
+        self.model_dirs = model_dirs
+
+    def run(self):
+        # A fresh registry, so results recorded by benchmarks/bench_models.py since launch are picked up.
+        registry = ModelRegistry()
+        models = [(path, registry.describe(path)) for path in get_installed_models(self.model_dirs)]
+        whisper_cli = get_default_whisper_cli() if self.find_whisper_cli else ""
+        self.ready.emit(models, whisper_cli)
+
 
 class SermonTranscriber(QMainWindow):
-    def __init__(self):
+    def __init__(self, startup_timing=False, seek_timing=False):
         super().__init__()
         self.setWindowTitle("Sermon Transcriber")
 
         # Create status bar
         self.statusBar().showMessage("Ready")
 
-        # Initialize VLC
-        self.instance = vlc.Instance()
-        self.player = self.instance.media_player_new()
-
-        # Attach event handlers for state sync (prevents UI desync after seeks/ends)
-        em = self.player.event_manager()
-        em.event_attach(vlc.EventType.MediaPlayerEndReached, self._on_end_reached)
-        em.event_attach(vlc.EventType.MediaPlayerPlaying, self._on_playing)
-        em.event_attach(vlc.EventType.MediaPlayerPaused, self._on_paused)
-        em.event_attach(vlc.EventType.MediaPlayerStopped, self._on_stopped)
-
-        # Load models + config early (needed for dropdowns in right panel)
-        self.available_models = get_installed_models()
+        # VLC is created after the window first paints (or on the first load, if sooner); see _ensure_player.
+        self.instance = None
+        self.player = None
+        self.vlc_events = None
+        self.seek_controller = None
+        self.probe_thread = None
+        self.keyframe_thread = None
+        # Startup milestones (time.time()), reported with --startup-timing
+        self.startup_timing = startup_timing
+        self.startup_times = {"window_created": None, "first_paint": None, "interactive": None}
+        # Print the seek latency summary after each scrub (--seek-timing)
+        self.seek_timing = seek_timing
+        self.discovery_thread = None
+        # The file being marked. VLC may be playing a proxy of it; jobs always use this original.
+        self.source_file = None
+        self.playing_proxy = False
+        self.proxy_thread = None
+
+        # Config is read now (it sets up the right panel); the model list is filled in by DiscoveryThread.
+        self.available_models = []
         config = load_config()
-        self.selected_model = config.get("selected_model")
-        if not self.selected_model or (self.available_models and self.selected_model not in self.available_models):
-            self.selected_model = self.available_models[0] if self.available_models else "ggml-large-v3.bin"
+        self.model_dirs = config.get("model_dirs") or [DEFAULT_MODELS_DIR]
+        # A file name in one of the model dirs, or a path
+        self.selected_model = config.get("selected_model") or "ggml-large-v3.bin"
 
         self.video_encoder = config.get("video_encoder", DEFAULT_VIDEO_ENCODER)
         if self.video_encoder not in (k for _, k in VIDEO_ENCODER_OPTIONS):
             self.video_encoder = DEFAULT_VIDEO_ENCODER
 
+        # "" (encoder default), AUTO_PRESET, or a preset from ENCODER_PRESETS
+        self.video_preset = str(config.get("video_preset") or "")
+        self.target_encode_minutes = config.get("target_encode_minutes", DEFAULT_TARGET_ENCODE_MINUTES)
+
         self.do_transcribe = config.get("do_transcribe", True)
         self.do_transcode = config.get("do_transcode", True)
-
-        # For whisper_cli: if no loadable config (or no key), seek a reasonable default on first run
-        if not config or "whisper_cli" not in config:
-            self.whisper_cli = get_default_whisper_cli()
-            # Save immediately so the discovered default is persisted (include new flags)
-            init_config = {
-                "selected_model": self.selected_model,
-                "whisper_cli": self.whisper_cli,
-                "video_encoder": self.video_encoder,
-                "do_transcribe": self.do_transcribe,
-                "do_transcode": self.do_transcode,
-            }
-            save_config(init_config)
-        else:
-            self.whisper_cli = config.get("whisper_cli") or get_default_whisper_cli()
+        self.single_pass = config.get("single_pass", True)
+        self.smart_cut = config.get("smart_cut", True)
+        self.stream_audio = config.get("stream_audio", False)
+        self.transcribe_chunks = config.get("transcribe_chunks", 1)
+        self.threads_per_worker = config.get("threads_per_worker")
+        self.encode_segments = config.get("encode_segments", 1)
+        self.strip_non_speech = config.get("strip_non_speech", False)
+        self.strip_min_gap_s = config.get("strip_min_gap_s", DEFAULT_STRIP_MIN_GAP_S)
+        self.cache_max_gb = config.get("cache_max_gb", DEFAULT_CACHE_MAX_GB)
+        self.stage_limits = {**DEFAULT_STAGE_LIMITS, **config.get("stage_limits", {})}
+        self.stage_queue_size = config.get("stage_queue_size", DEFAULT_STAGE_QUEUE_SIZE)
+        self.use_proxy = config.get("use_proxy", True)
+        self.use_whisper_server = config.get("use_whisper_server", True)
+        # Optional explicit whisper-server executable (default: next to whisper-cli, else on PATH)
+        self.whisper_server = config.get("whisper_server")
+
+        # For whisper_cli: if no loadable config (or no key), DiscoveryThread seeks a reasonable default on first run
+        self.first_run = not config or "whisper_cli" not in config
+        self.whisper_cli = None if self.first_run else config.get("whisper_cli")
 
         # Create central widget and main horizontal layout (video+controls | right action panel)
         central_widget = QWidget()
@@ -408,6 +3635,18 @@ class SermonTranscriber(QMainWindow):
         self.timeline.sliderReleased.connect(self.on_timeline_release)
         left_layout.addWidget(self.timeline)
 
+        # Thumbnail preview while hovering/dragging the timeline (filmstrip built in the background after load)
+        self.timeline.setMouseTracking(True)
+        self.timeline.installEventFilter(self)
+        self.thumbnail_preview = ThumbnailPreview(self)
+        self.filmstrip = None
+        self.filmstrip_thread = None
+
+        # Audio overview under the timeline, computed in the background after load (cached per file)
+        self.waveform_lane = WaveformLane()
+        left_layout.addWidget(self.waveform_lane)
+        self.waveform_thread = None
+
         # In/Out points row (same groups as before)
         points_layout = QHBoxLayout()
 
@@ -471,6 +3710,14 @@ class SermonTranscriber(QMainWindow):
         points_layout.addWidget(out_group)
 
         left_layout.addLayout(points_layout)
+
+        # One-click in/out from the background speech analysis (enabled once a suggestion is ready)
+        self.suggest_button = QPushButton("No sermon suggestion yet")
+        self.suggest_button.setToolTip("Set in/out to the longest continuous stretch of speech")
+        self.suggest_button.setEnabled(False)
+        self.suggest_button.clicked.connect(self.apply_suggested_points)
+        left_layout.addWidget(self.suggest_button)
+        self.suggested_points = None
         main_layout.addWidget(left_widget, 4)
 
         # --- RIGHT: new panel with enable checkboxes + moved dropdowns + action button ---
@@ -485,17 +3732,16 @@ class SermonTranscriber(QMainWindow):
 
         right_layout.addWidget(QLabel("Model:"))
         self.model_combo = QComboBox()
-        if self.available_models:
-            self.model_combo.addItems(self.available_models)
-            if self.selected_model in self.available_models:
-                self.model_combo.setCurrentText(self.selected_model)
-            else:
-                self.model_combo.setCurrentIndex(0)
-        else:
-            self.model_combo.addItem("No models found (ggml-*.bin)")
-            self.model_combo.setEnabled(False)
+        self.model_combo.addItem("Looking for models...")
+        self.model_combo.setEnabled(False)
         right_layout.addWidget(self.model_combo)
 
+        # Unchecked: pipe audio straight from ffmpeg into whisper without writing sermon.wav
+        self.keep_wav_cb = QCheckBox("Keep WAV file")
+        self.keep_wav_cb.setToolTip("Uncheck to stream audio into whisper without writing the WAV to disk")
+        self.keep_wav_cb.setChecked(not self.stream_audio)
+        right_layout.addWidget(self.keep_wav_cb)
+
         right_layout.addSpacing(12)
 
         # Transcoding enable + format dropdown (moved from settings)
@@ -515,17 +3761,64 @@ class SermonTranscriber(QMainWindow):
             self.encoder_combo.setCurrentIndex(0)
         right_layout.addWidget(self.encoder_combo)
 
+        # Encoder preset (filled per encoder) and the pre-flight time/size estimate of the current cut
+        preset_layout = QHBoxLayout()
+        preset_layout.addWidget(QLabel("Preset:"))
+        self.preset_combo = QComboBox()
+        self.preset_combo.setToolTip("Auto picks the slowest preset predicted to finish within the target time (Settings)")
+        self._fill_preset_combo()
+        preset_layout.addWidget(self.preset_combo, 1)
+        self.estimate_button = QPushButton("Estimate")
+        self.estimate_button.setToolTip("Time short sample encodes of the cut and predict encode time and size per preset")
+        self.estimate_button.clicked.connect(self.estimate_encode)
+        preset_layout.addWidget(self.estimate_button)
+        right_layout.addLayout(preset_layout)
+        self.estimate_thread = None
+
         right_layout.addSpacing(16)
 
-        # Main action button (moved here)
+        # Main action button (moved here); adds a job to the persistent queue
         self.transcribe_button = QPushButton("Extract and Transcribe")
+        self.transcribe_button.setToolTip("Queue the current in/out selection for extraction and transcription")
         self.transcribe_button.clicked.connect(self.start_extract_and_transcribe)
         right_layout.addWidget(self.transcribe_button)
 
+        # Job queue with per-job status (persisted; unfinished jobs resume on next launch)
+        right_layout.addWidget(QLabel("Jobs:"))
+        self.job_list = QListWidget()
+        self.job_list.setMinimumHeight(120)
+        self.job_list.currentItemChanged.connect(lambda *_: self._show_progress())
+        right_layout.addWidget(self.job_list)
+        # Progress of the selected job (or the most recently active one): percent, speed, ETA
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setVisible(False)
+        right_layout.addWidget(self.progress_bar)
+        job_buttons = QHBoxLayout()
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setToolTip("Cancel the selected job")
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.clicked.connect(self.cancel_extract_and_transcribe)
+        job_buttons.addWidget(self.cancel_button)
+        self.remove_job_button = QPushButton("Remove")
+        self.remove_job_button.setToolTip("Remove the selected job from the queue")
+        self.remove_job_button.clicked.connect(self.remove_selected_job)
+        job_buttons.addWidget(self.remove_job_button)
+        right_layout.addLayout(job_buttons)
+
+        # Per-stage pipeline load (queue depth + utilization), refreshed while jobs are running
+        self.pipeline_label = QLabel("")
+        self.pipeline_label.setWordWrap(True)
+        self.pipeline_label.setStyleSheet("color: gray; font-size: 11px;")
+        right_layout.addWidget(self.pipeline_label)
+        self.pipeline_timer = QTimer(self)
+        self.pipeline_timer.setInterval(1000)
+        self.pipeline_timer.timeout.connect(self._update_pipeline_stats)
+
         # Small settings gear (kept accessible)
         self.settings_button = QPushButton("⚙️ Settings")
         self.settings_button.setFixedHeight(26)
-        self.settings_button.setToolTip("Settings (whisper-cli path)")
+        self.settings_button.setToolTip("Settings (whisper-cli path, parallel transcription)")
         self.settings_button.clicked.connect(self.open_settings)
         right_layout.addWidget(self.settings_button)
 
@@ -537,20 +3830,25 @@ class SermonTranscriber(QMainWindow):
         self.was_playing = False
         self.in_point = 0
         self.out_point = 0
-        self.extraction_thread = None
+        # Jobs handed to the pipeline scheduler, by job id
+        self.running_jobs = {}
+        # Latest (stage, percent, speed, eta) per running job; the most recently updated job last
+        self.job_progress = {}
         self.has_valid_video = False
+        # ffprobe metadata of the loaded file (None until loaded, or if ffprobe cannot read it)
+        self.media_info = None
+        self.job_queue = JobQueue()
+        self.scheduler = PipelineScheduler(self.stage_limits, queue_size=self.stage_queue_size)
+        self.result_cache = ResultCache(max_bytes=int(self.cache_max_gb * 1024**3))
 
         # Wire config persistence for the new main-panel controls
         self.transcribe_cb.toggled.connect(self._save_config)
         self.transcode_cb.toggled.connect(self._save_config)
+        self.keep_wav_cb.toggled.connect(self._save_config)
         self.model_combo.currentIndexChanged.connect(self._save_config)
+        self.encoder_combo.currentIndexChanged.connect(self._fill_preset_combo)
         self.encoder_combo.currentIndexChanged.connect(self._save_config)
-
-        # Timer for updates
-        self.timer = QTimer(self)
-        self.timer.setInterval(100)
-        self.timer.timeout.connect(self.update_ui)
-        self.timer.start()
+        self.preset_combo.currentIndexChanged.connect(self._save_config)
 
         # Add scrubbing state
         self.is_scrubbing = False
@@ -559,17 +3857,105 @@ class SermonTranscriber(QMainWindow):
         # (timeline scrubber + in/out + play/pause buttons)
         self._set_video_controls_enabled(False)
 
+        self._refresh_job_list()
+        if self.job_queue.next_queued():
+            self.statusBar().showMessage("Resuming queued jobs...")
+            QTimer.singleShot(0, self._submit_queued_jobs)
+
+        self._discover_models()
+
+        self.startup_times["window_created"] = time.time()
         self.show()
 
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.startup_times["first_paint"] is None:
+            self.startup_times["first_paint"] = time.time()
+            # Queued behind this paint, so the window is on screen before libvlc loads.
+            QTimer.singleShot(0, self._ensure_player)
+
+    def _ensure_player(self):
+        """Create the VLC instance and player (once); loading libvlc's plugins is the slow part of startup."""
+        if self.player is not None:
+            return
+        load_vlc()
+        self.instance = vlc.Instance()
+        self.player = self.instance.media_player_new()
+
+        # Player state is driven by VLC events (prevents UI desync after seeks/ends). They arrive on libvlc's
+        # thread; the bridge re-emits them as signals, so these slots run queued on the GUI thread.
+        self.vlc_events = VlcEventBridge(self.player, self)
+        self.vlc_events.time_changed.connect(self._on_time_changed)
+        self.vlc_events.length_changed.connect(self._on_length_changed)
+        self.vlc_events.end_reached.connect(self._on_end_reached)
+        self.vlc_events.playing.connect(self._on_playing)
+        self.vlc_events.paused.connect(self._on_paused)
+        self.vlc_events.stopped.connect(self._on_stopped)
+        # Scrub seeks go through the controller, which waits for VLC's time change between seeks.
+        self.seek_controller = SeekController(self.player, self.vlc_events.time_changed, self)
+        self._check_interactive()
+
+    def _discover_models(self):
+        """(Re)scan the model dirs in the background; _on_discovery_ready fills the model combo."""
+        if self.discovery_thread is not None:
+            self.discovery_thread.wait()
+        self.discovery_thread = DiscoveryThread(self.first_run, self.model_dirs)
+        self.discovery_thread.ready.connect(self._on_discovery_ready)
+        self.discovery_thread.start()
+
+    def _on_discovery_ready(self, models, whisper_cli):
+        self.available_models = [path for path, _ in models]
+        selected_path = resolve_model_path(self.selected_model, self.model_dirs)
+        if selected_path not in self.available_models and self.available_models:
+            selected_path = self.available_models[0]
+            self.selected_model = selected_path
+        # Repopulating is not a user choice: keep it from rewriting the config
+        self.model_combo.blockSignals(True)
+        self.model_combo.clear()
+        if models:
+            # Item data holds the model path; the text adds its type, size and measured speed
+            for path, label in models:
+                self.model_combo.addItem(label, path)
+            self.model_combo.setCurrentIndex(self.model_combo.findData(selected_path))
+            self.model_combo.setEnabled(True)
+        else:
+            self.model_combo.addItem("No models found (ggml-*.bin)")
+            self.model_combo.setEnabled(False)
+        self.model_combo.blockSignals(False)
+
+        if self.first_run:
+            # Settings may have been saved while discovery ran: merge the discovered defaults into the
+            # current config, only where nothing is set yet.
+            self.whisper_cli = self.whisper_cli or whisper_cli
+            config = load_config()
+            if not config.get("whisper_cli"):
+                config["whisper_cli"] = self.whisper_cli
+            if not config.get("selected_model"):
+                config["selected_model"] = self.selected_model
+            save_config(config)
+            self.first_run = False
+        self.discovery_thread = None
+        self._check_interactive()
+
+    def _check_interactive(self):
+        """Record (and with --startup-timing, report) when VLC and discovery are both done."""
+        if self.player is None or self.discovery_thread is not None or self.startup_times["interactive"]:
+            return
+        self.startup_times["interactive"] = time.time()
+        if self.startup_timing:
+            print(f"STARTUP {json.dumps(self.startup_times)}", flush=True)
+            QApplication.instance().quit()
+
     def browse_file(self):
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select Video File", "", "Video Files (*.mp4 *.mov *.mkv)"
+            self, "Select Video File", "", "Video Files (" + " ".join(f"*{ext}" for ext in VIDEO_EXTENSIONS) + ")"
         )
         if file_path:
             self.load_video(file_path)
 
     def load_video(self, file_path):
         try:
+            self._ensure_player()
             # Stop any existing playback
             self.player.stop()
             self.has_valid_video = False
@@ -595,16 +3981,25 @@ class SermonTranscriber(QMainWindow):
             else:
                 self.player.set_xwindow(self.video_widget.winId())
 
+            # The probe runs in the background; what needs its duration or codec starts when it is ready.
+            self.media_info = None
+            self.source_file = file_path
+            self.playing_proxy = False
+            self.filmstrip = None
+            self.thumbnail_preview.hide()
+            self.seek_controller.reset()
+            self._reset_suggestion()
+            self._load_waveform(file_path)
+            self._probe_source(file_path)
+
             # Create a new media
             media = self.instance.media_new(file_path)
             media.parse_with_options(vlc.MediaParseFlag.local, 0)
             self.player.set_media(media)
 
-            # Ensure timeline (playhead bar) is visible with placeholder range immediately.
-            # Real duration will override once known (via cue or update_ui).
-            self.timeline.setRange(
-                0, 600000
-            )  # ~10min placeholder so bar renders visibly
+            # Ensure timeline (playhead bar) is visible with a placeholder range immediately. It is replaced
+            # once the probe or VLC knows the duration (via cue or its LengthChanged event).
+            self.timeline.setRange(0, self._media_duration_ms() or PLACEHOLDER_DURATION_MS)
             self.timeline.setValue(0)
             self.timeline.setVisible(True)
             self.timeline.show()
@@ -641,10 +4036,10 @@ class SermonTranscriber(QMainWindow):
             self.player.pause()
             # Force to start to ensure consistent first frame is the one shown.
             self.player.set_time(0)
-            duration = self.player.get_length()
+            duration = self._media_duration_ms()
             if duration <= 0:
-                # Keep placeholder; update_ui will upgrade range once duration known
-                duration = 600000
+                # Keep placeholder; _on_length_changed will upgrade range once duration known
+                duration = PLACEHOLDER_DURATION_MS
             self._apply_duration(duration)
             # Force clean paused state (events should have synced, but be explicit)
             self.playing = False
@@ -661,7 +4056,7 @@ class SermonTranscriber(QMainWindow):
     def setup_timeline(self):
         """Legacy/fallback path. Set up timeline after media is loaded. Starts paused."""
         try:
-            duration = self.player.get_length()
+            duration = self._media_duration_ms()
             if duration <= 0:
                 # Fallback: try brief play to populate length, then stop (legacy, may black frame)
                 self.player.play()
@@ -676,7 +4071,7 @@ class SermonTranscriber(QMainWindow):
     def _finish_setup_after_play(self):
         try:
             self.player.stop()
-            duration = self.player.get_length()
+            duration = self._media_duration_ms()
             self._apply_duration(duration)
         except Exception as e:
             print(f"Error in fallback setup: {e}")
@@ -693,23 +4088,51 @@ class SermonTranscriber(QMainWindow):
         self.play_button.setText("▶️")
 
         # Only consider "valid video loaded" (and enable controls) when we have a real positive duration.
-        # Placeholder (600000) or <=0 means load not yet succeeded or invalid file.
-        if duration > 0 and duration != 600000:
-            self.has_valid_video = True
-            self._set_video_controls_enabled(True)
-
-            # Default out point to end of video (in_point stays 0). Update labels.
-            # This is the requested "out point defaults to end on load".
-            # (User can still override later via the set-out button.)
-            self.in_point = 0
-            self.out_point = duration
-            self.in_label.setText(self.format_time(0))
-            self.out_label.setText(self.format_time(duration / 1000))
+        # Placeholder or <=0 means load not yet succeeded or invalid file.
+        if duration > 0 and duration != PLACEHOLDER_DURATION_MS:
+            self._mark_video_valid(duration)
         else:
             self.has_valid_video = False
             self._set_video_controls_enabled(False)
 
-    def _on_end_reached(self, event):
+    def _mark_video_valid(self, duration):
+        """Enable the media controls for a loaded video of known duration."""
+        self.has_valid_video = True
+        self._set_video_controls_enabled(True)
+
+        # Default out point to end of video (in_point stays 0). Update labels.
+        # This is the requested "out point defaults to end on load".
+        # (User can still override later via the set-out button.)
+        self.in_point = 0
+        self.out_point = duration
+        self.in_label.setText(self.format_time(0))
+        self.out_label.setText(self.format_time(duration / 1000))
+        self.waveform_lane.set_duration(duration)
+        self.waveform_lane.set_selection(self.in_point, self.out_point)
+
+    def _on_time_changed(self, time_ms):
+        """Follow the playhead. Only fires while VLC's position actually moves, so a paused player costs nothing."""
+        if self.is_scrubbing or time_ms < 0:
+            return
+        if time_ms != self.timeline.value():
+            self.timeline.setValue(time_ms)
+        text = self.format_time(time_ms / 1000)
+        if text != self.time_label.text():
+            self.time_label.setText(text)
+
+    def _on_length_changed(self, length_ms):
+        """Upgrade the timeline range (and enable controls) once VLC knows the duration."""
+        duration = self._media_duration_ms() or length_ms
+        if duration <= 0:
+            return
+        if duration != self.timeline.maximum():
+            self.timeline.setRange(0, duration)
+            if self.timeline.value() > duration:
+                self.timeline.setValue(duration)
+        if not self.has_valid_video:
+            self._mark_video_valid(duration)
+
+    def _on_end_reached(self):
         """Handle end of media (e.g. scrubbed to end or natural end)."""
         self.playing = False
         self.was_playing = False
@@ -718,15 +4141,15 @@ class SermonTranscriber(QMainWindow):
         # Keep timeline at end; allow replay via play (will restart)
         print("Media end reached (or seeked to end)")
 
-    def _on_playing(self, event):
+    def _on_playing(self):
         self.play_button.setText("⏸️")
         self.playing = True
 
-    def _on_paused(self, event):
+    def _on_paused(self):
         self.play_button.setText("▶️")
         self.playing = False
 
-    def _on_stopped(self, event):
+    def _on_stopped(self):
         self.play_button.setText("▶️")
         self.playing = False
         self.was_playing = False
@@ -764,13 +4187,16 @@ class SermonTranscriber(QMainWindow):
         Then resume play if it was playing before press (except at end).
         """
         self.is_scrubbing = False
+        self.thumbnail_preview.hide()
         # Ensure seek to the (possibly clicked) final position. Harmless if already set by change handler.
         pos = self.timeline.value()
         duration = self.timeline.maximum()
         if duration > 0 and pos > duration - 100:
             pos = duration
-        self.player.set_time(pos)
+        self.seek_controller.seek(pos, precise=True)
         self.time_label.setText(self.format_time(pos / 1000))
+        if self.seek_timing:
+            print(f"Scrub: {self.seek_controller.stats()}", flush=True)
 
         if self.was_playing:
             state = self.player.get_state()
@@ -785,7 +4211,7 @@ class SermonTranscriber(QMainWindow):
 
     def on_timeline_change(self, value):
         """Called on user interaction via valueChanged (catches groove clicks reliably + continuous drags).
-        Guard prevents seeking on programmatic setValue (from update_ui, jumps, load, etc.).
+        Guard prevents seeking on programmatic setValue (from _on_time_changed, jumps, load, etc.).
         Pause is done in press; seek here. Clamp near end to avoid deadlock issues.
         """
         if not (getattr(self, "is_scrubbing", False) or self.timeline.isSliderDown()):
@@ -793,36 +4219,203 @@ class SermonTranscriber(QMainWindow):
         duration = self.timeline.maximum()
         if duration > 0 and value > duration - 100:  # ~100ms buffer from very end
             value = duration
-        self.player.set_time(value)
+        # With a filmstrip, dragging only previews; VLC seeks once, on release.
+        handle_x = QStyle.sliderPositionFromValue(
+            self.timeline.minimum(), self.timeline.maximum(), value, max(1, self.timeline.width())
+        )
+        if not self._show_thumbnail(value, handle_x):
+            self.seek_controller.seek(value, precise=False)
         # Update time label immediately during scrubbing
         self.time_label.setText(self.format_time(value / 1000))
 
-    def update_ui(self):
-        """Regular UI updates. Always sync position when not scrubbing (works for paused too).
-        Also auto-upgrades timeline range once real duration is available from VLC.
-        """
+    def _load_waveform(self, file_path):
+        """Start building (or loading) the waveform and sermon suggestion of a newly loaded file;
+        drops the previous one."""
+        if self.waveform_thread is not None:
+            # Cancelling stops ffmpeg / the reduction within a block; wait so the QThread is not freed running.
+            self.waveform_thread.cancel()
+            self.waveform_thread.wait()
+        self.waveform_lane.set_pyramid(None)
+        self.waveform_lane.set_selection(0, 0)
+        self.waveform_lane.set_duration(self._media_duration_ms())
+        self.waveform_thread = WaveformThread(file_path)
+        self.waveform_thread.ready.connect(self._on_waveform_ready)
+        self.waveform_thread.suggested.connect(self._on_points_suggested)
+        self.waveform_thread.start()
+
+    def _on_waveform_ready(self, path, pyramid):
+        # Ignore a result for a file that has since been replaced.
+        if self.waveform_thread is not None and path == self.waveform_thread.path:
+            self.waveform_lane.set_pyramid(pyramid)
+
+    def _probe_source(self, file_path):
+        """Probe a newly loaded file in the background (cached, so reopening a file answers at once)."""
+        if self.probe_thread is not None:
+            # ffprobe cannot be interrupted, but it has a timeout; the stale result is ignored anyway.
+            self.probe_thread.cancel()
+            self.probe_thread.wait()
+        self.probe_thread = ProbeThread(file_path)
+        self.probe_thread.ready.connect(self._on_probe_ready)
+        self.probe_thread.start()
+
+    def _on_probe_ready(self, path, info):
+        if self.probe_thread is None or path != self.probe_thread.path or path != self.source_file:
+            return
+        self.media_info = info
+        duration = self._media_duration_ms()
+        if duration > 0:
+            if duration != self.timeline.maximum():
+                self.timeline.setRange(0, duration)
+                if self.timeline.value() > duration:
+                    self.timeline.setValue(duration)
+            self.waveform_lane.set_duration(duration)
+        self._load_filmstrip(path)
+        self._load_keyframe_index(path)
+        self._load_proxy(path)
+
+    def _load_filmstrip(self, file_path):
+        """Start building (or loading) the thumbnails of a newly loaded file; drops the previous ones."""
+        if self.filmstrip_thread is not None:
+            self.filmstrip_thread.cancel()
+            self.filmstrip_thread.wait()
+        self.filmstrip = None
+        self.thumbnail_preview.hide()
+        self.filmstrip_thread = FilmstripThread(file_path, max(0, self._media_duration_ms()))
+        self.filmstrip_thread.ready.connect(self._on_filmstrip_ready)
+        self.filmstrip_thread.start()
+
+    def _load_keyframe_index(self, file_path):
+        """Index the new file's keyframes in the background so drag seeks can snap to them."""
+        if self.keyframe_thread is not None:
+            self.keyframe_thread.cancel()
+            self.keyframe_thread.wait()
+        self.seek_controller.reset()
+        self.keyframe_thread = KeyframeIndexThread(file_path)
+        self.keyframe_thread.ready.connect(self._on_keyframes_ready)
+        self.keyframe_thread.start()
+
+    def _on_keyframes_ready(self, path, keyframes):
+        # The proxy has a keyframe every few frames, so only the original needs snapping.
+        if self.keyframe_thread is not None and path == self.keyframe_thread.path and not self.playing_proxy:
+            self.seek_controller.set_keyframes(keyframes)
+
+    def _load_proxy(self, file_path):
+        """Start a playback proxy for sources that are heavy to decode (if enabled in Settings)."""
+        if self.proxy_thread is not None:
+            self.proxy_thread.cancel()
+            self.proxy_thread.wait()
+            self.proxy_thread = None
+        info = self.media_info
+        if not self.use_proxy or not info or not info.video:
+            return
+        if info.video_height <= PROXY_MIN_SOURCE_HEIGHT and info.video_codec not in PROXY_SOURCE_CODECS:
+            return
+        self.statusBar().showMessage(f"Building a {PROXY_HEIGHT}p playback proxy in the background...")
+        self.proxy_thread = ProxyThread(file_path)
+        self.proxy_thread.ready.connect(self._on_proxy_ready)
+        self.proxy_thread.start()
+
+    def _on_proxy_ready(self, path, proxy_path):
+        if path != self.source_file:
+            return
         if self.is_scrubbing:
+            # Never swap media under the operator's hand; try again shortly.
+            QTimer.singleShot(500, lambda: self._on_proxy_ready(path, proxy_path))
+            return
+        position = max(0, self.player.get_time())
+        was_playing = self.player.is_playing()
+        self.seek_controller.reset()
+        self.player.set_media(self.instance.media_new(proxy_path))
+        self.playing_proxy = True
+        # Start it to get a frame up, then restore the position (and pause unless it was playing).
+        self.player.play()
+        QTimer.singleShot(150, lambda: self._resume_after_proxy_swap(position, was_playing))
+        self.statusBar().showMessage(f"Playing {PROXY_HEIGHT}p proxy; jobs still use the original")
+
+    def _resume_after_proxy_swap(self, position, was_playing):
+        self.player.set_time(position)
+        if not was_playing:
+            self.player.pause()
+
+    def _source_ms(self, ms):
+        """Map a player time to the original: the proxy shares its timeline, clamped to the original's length."""
+        duration = self.media_info.duration_ms if self.media_info else None
+        return min(ms, duration) if duration else ms
+
+    def _on_filmstrip_ready(self, path, filmstrip):
+        if self.filmstrip_thread is not None and path == self.filmstrip_thread.path:
+            self.filmstrip = filmstrip
+
+    def _timeline_value_at(self, x):
+        return QStyle.sliderValueFromPosition(
+            self.timeline.minimum(), self.timeline.maximum(), int(x), max(1, self.timeline.width())
+        )
+
+    def _show_thumbnail(self, value, x):
+        """Show the filmstrip frame nearest value above the timeline at x. False if there is none."""
+        pixmap = self.filmstrip.thumbnail(value) if self.filmstrip else None
+        if pixmap is None:
+            return False
+        self.thumbnail_preview.show_at(
+            self.timeline.mapToGlobal(QPoint(int(x), 0)), pixmap, self.format_time(value / 1000)
+        )
+        return True
+
+    def eventFilter(self, obj, event):
+        if obj is self.timeline and getattr(self, "has_valid_video", False):
+            if event.type() == QEvent.MouseMove and not self.timeline.isSliderDown():
+                x = event.position().x()
+                self._show_thumbnail(self._timeline_value_at(x), x)
+            elif event.type() == QEvent.Leave and not self.timeline.isSliderDown():
+                self.thumbnail_preview.hide()
+        return super().eventFilter(obj, event)
+
+    def _reset_suggestion(self):
+        """Drop the previous file's suggestion; the waveform thread analyses the new file's speech."""
+        self.suggested_points = None
+        self.waveform_lane.set_suggestion(None)
+        self.suggest_button.setEnabled(False)
+        self.suggest_button.setText("Looking for the sermon...")
+
+    def _on_points_suggested(self, path, suggestion):
+        if self.waveform_thread is None or path != self.waveform_thread.path:
             return
-        time_pos = self.player.get_time()
-        if time_pos < 0:
+        if suggestion is None:
+            self.suggest_button.setText("No sermon suggestion")
             return
-        dur = self.player.get_length()
-        if dur > 0 and dur != self.timeline.maximum():
-            self.timeline.setRange(0, dur)
-            if self.timeline.value() > dur:
-                self.timeline.setValue(dur)
-        if dur > 0 and not getattr(self, "has_valid_video", False):
-            self.has_valid_video = True
-            self._set_video_controls_enabled(True)
-
-            # Default out point to video end when duration first becomes known via this path.
-            # (Mirrors the logic in _apply_duration for cue/setup paths.)
-            self.in_point = 0
-            self.out_point = dur
-            self.in_label.setText(self.format_time(0))
-            self.out_label.setText(self.format_time(dur / 1000))
-        self.timeline.setValue(time_pos)
-        self.time_label.setText(self.format_time(time_pos / 1000))
+        in_ms, out_ms = suggestion
+        self.suggested_points = (in_ms, out_ms)
+        self.waveform_lane.set_suggestion(self.suggested_points)
+        self.suggest_button.setText(
+            f"Use suggested sermon {self.format_time(in_ms / 1000)} → {self.format_time(out_ms / 1000)}"
+        )
+        self.suggest_button.setEnabled(self.has_valid_video)
+
+    def apply_suggested_points(self):
+        if not self.suggested_points:
+            return
+        self.in_point, self.out_point = self.suggested_points
+        self.in_label.setText(self.format_time(self.in_point / 1000))
+        self.out_label.setText(self.format_time(self.out_point / 1000))
+        self.waveform_lane.set_selection(self.in_point, self.out_point)
+        self.statusBar().showMessage("In/out set to the suggested sermon")
+
+    def closeEvent(self, event):
+        for thread in (self.probe_thread, self.waveform_thread, self.filmstrip_thread, self.keyframe_thread,
+                       self.proxy_thread, self.estimate_thread):
+            if thread is not None:
+                thread.cancel()
+                thread.wait(2000)
+        if self.discovery_thread is not None:
+            self.discovery_thread.wait(2000)
+        WHISPER_SERVERS.shutdown()
+        super().closeEvent(event)
+
+    def _media_duration_ms(self):
+        """Duration of the loaded file: from ffprobe when available, else as reported by VLC (<=0 if unknown)."""
+        if self.media_info and self.media_info.duration_ms:
+            return self.media_info.duration_ms
+        return self.player.get_length()
 
     def format_time(self, seconds):
         hours = int(seconds // 3600)
@@ -833,10 +4426,12 @@ class SermonTranscriber(QMainWindow):
     def set_in_point(self):
         self.in_point = self.player.get_time()
         self.in_label.setText(self.format_time(self.in_point / 1000))
+        self.waveform_lane.set_selection(self.in_point, self.out_point)
 
     def set_out_point(self):
         self.out_point = self.player.get_time()
         self.out_label.setText(self.format_time(self.out_point / 1000))
+        self.waveform_lane.set_selection(self.in_point, self.out_point)
 
     def jump_to_in_point(self):
         """Jump playhead (and UI) to the current in_point.
@@ -852,11 +4447,11 @@ class SermonTranscriber(QMainWindow):
                 # Do not force flags yet; will resume
 
             target = self.in_point
-            duration = self.player.get_length()
+            duration = self._media_duration_ms()
             if duration > 0 and target > duration:
                 target = duration
 
-            self.player.set_time(target)
+            self.seek_controller.seek(target)
             self.timeline.setValue(target)
             self.time_label.setText(self.format_time(target / 1000))
 
@@ -892,11 +4487,11 @@ class SermonTranscriber(QMainWindow):
                 # Do not force flags yet; will resume
 
             target = self.out_point
-            duration = self.player.get_length()
+            duration = self._media_duration_ms()
             if duration > 0 and target > duration:
                 target = duration
 
-            self.player.set_time(target)
+            self.seek_controller.seek(target)
             self.timeline.setValue(target)
             self.time_label.setText(self.format_time(target / 1000))
 
@@ -918,73 +4513,196 @@ class SermonTranscriber(QMainWindow):
             print(f"Error jumping to out point: {e}")
 
     def start_extract_and_transcribe(self):
-        if self.extraction_thread is None or not self.extraction_thread.isRunning():
-            # Get the input file path from the current media
-            media = self.player.get_media()
-            if not media:
-                self.statusBar().showMessage("No video loaded")
-                return
-            input_file = media.get_mrl()
-            if input_file.startswith("file://"):
-                input_file = input_file[7:]  # Remove 'file://' prefix
-
-            # URL decode the path
-            input_file = unquote(input_file)
-
-            # Get the base name of the input file
-            base_name = os.path.splitext(os.path.basename(input_file))[0]
-
-            # Read live state from right panel controls
-            do_transcribe = self.transcribe_cb.isChecked()
-            do_transcode = self.transcode_cb.isChecked()
-            model_name = self.model_combo.currentText() if (self.model_combo.count() > 0 and self.model_combo.isEnabled()) else self.selected_model
-            model_path = os.path.join(DEFAULT_MODELS_DIR, model_name) if model_name else None
-            video_encoder = self._get_current_video_encoder()
-
-            self.extraction_thread = ExtractAndTranscribeThread(
-                input_file, self.in_point, self.out_point, base_name,
-                whisper_cli=self.whisper_cli,
-                model_path=model_path,
-                video_encoder=video_encoder,
-                do_transcribe=do_transcribe,
-                do_transcode=do_transcode,
-            )
-            self.extraction_thread.status_update.connect(self.update_status)
-            self.extraction_thread.finished.connect(self.process_finished)
-            self.extraction_thread.start()
+        """Queue the current video + in/out selection; the pipeline scheduler runs it as stage workers free up."""
+        # The original file, even while the player shows its proxy
+        input_file = self.source_file
+        if not input_file:
+            self.statusBar().showMessage("No video loaded")
+            return
+
+        # Get the base name of the input file
+        base_name = os.path.splitext(os.path.basename(input_file))[0]
 
-            self.transcribe_button.setText("Cancel")
-            self.transcribe_button.clicked.disconnect()
-            self.transcribe_button.clicked.connect(self.cancel_extract_and_transcribe)
+        # Read live state from right panel controls
+        if self.model_combo.count() > 0 and self.model_combo.isEnabled():
+            model_path = self.model_combo.currentData()
         else:
-            self.cancel_extract_and_transcribe()
+            model_path = resolve_model_path(self.selected_model, self.model_dirs)
+        options = {
+            "whisper_cli": self.whisper_cli,
+            "model_path": model_path,
+            "video_encoder": self._get_current_video_encoder(),
+            "video_preset": self.preset_combo.currentData() or None,
+            "target_encode_s": self.target_encode_minutes * 60,
+            "do_transcribe": self.transcribe_cb.isChecked(),
+            "do_transcode": self.transcode_cb.isChecked(),
+            "single_pass": self.single_pass,
+            "smart_cut": self.smart_cut,
+            "stream_audio": not self.keep_wav_cb.isChecked(),
+            "transcribe_chunks": self.transcribe_chunks,
+            "threads_per_worker": self.threads_per_worker,
+            "encode_segments": self.encode_segments,
+            "strip_non_speech": self.strip_non_speech,
+            "strip_min_gap_s": self.strip_min_gap_s,
+            "whisper_server": (
+                (self.whisper_server or find_whisper_server(self.whisper_cli)) if self.use_whisper_server else None
+            ),
+        }
+
+        self.job_queue.add(input_file, self._source_ms(self.in_point), self._source_ms(self.out_point), base_name, options)
+        self._refresh_job_list()
+        self._submit_queued_jobs()
+        self.statusBar().showMessage(f"Queued {base_name}")
+
+    def _submit_queued_jobs(self):
+        """Hand every queued job to the pipeline scheduler; the stage pools decide what runs when."""
+        while True:
+            job = self.job_queue.next_queued()
+            if not job:
+                break
+            thread = ExtractAndTranscribeThread(
+                job["input_file"], job["in_point"], job["out_point"], job["base_name"],
+                job_queue=self.job_queue,
+                job_id=job["id"],
+                result_cache=self.result_cache,
+                **job["options"],
+            )
+            # Emitted from scheduler threads; the lambdas run queued on the GUI thread.
+            thread.status_update.connect(lambda message, job_id=job["id"]: self.update_status(message, job_id))
+            thread.progress.connect(
+                lambda stage, percent, speed, eta, job_id=job["id"]: self.update_progress(job_id, stage, percent, speed, eta)
+            )
+            thread.finished.connect(lambda message, job_id=job["id"]: self.process_finished(message, job_id))
+            self.running_jobs[job["id"]] = thread
+            self.job_queue.update(job["id"], status="running", message="Waiting in pipeline")
+            self.scheduler.submit(thread)
+        self.cancel_button.setEnabled(bool(self.running_jobs))
+        if self.running_jobs and not self.pipeline_timer.isActive():
+            self.pipeline_timer.start()
+        self._refresh_job_list()
 
     def cancel_extract_and_transcribe(self):
-        if self.extraction_thread and self.extraction_thread.isRunning():
-            self.extraction_thread.cancel()
-            self.extraction_thread.wait()
-            self.process_finished("Process cancelled.")
+        """Cancel the selected running job (or the only one, if just one is running)."""
+        item = self.job_list.currentItem()
+        job_id = item.data(Qt.UserRole) if item else None
+        if job_id not in self.running_jobs and len(self.running_jobs) == 1:
+            job_id = next(iter(self.running_jobs))
+        thread = self.running_jobs.get(job_id)
+        if thread:
+            thread.cancel()
+            self.job_queue.update(job_id, message="Cancelling...")
+            self._refresh_job_list()
+
+    def remove_selected_job(self):
+        item = self.job_list.currentItem()
+        if not item:
+            return
+        job_id = item.data(Qt.UserRole)
+        if job_id in self.running_jobs:
+            self.statusBar().showMessage("Cancel the running job before removing it")
+            return
+        self.job_queue.remove(job_id)
+        self._refresh_job_list()
 
-    def update_status(self, message):
+    def update_status(self, message, job_id=None):
         self.statusBar().showMessage(message)
+        if job_id:
+            self.job_queue.update(job_id, message=message)
+            self._refresh_job_list()
 
-    def process_finished(self, message):
+    def process_finished(self, message, job_id=None):
         self.statusBar().showMessage(message)
-        self.transcribe_button.setText("Extract and Transcribe")
-        self.transcribe_button.clicked.disconnect()
-        self.transcribe_button.clicked.connect(self.start_extract_and_transcribe)
-        self.extraction_thread = None
+        if job_id:
+            if message.startswith("Error"):
+                status = "failed"
+            elif message == "Process cancelled.":
+                status = "cancelled"
+            else:
+                status = "done"
+            self.job_queue.update(job_id, status=status, message=message)
+            self.running_jobs.pop(job_id, None)
+            self.job_progress.pop(job_id, None)
+            self._show_progress()
+        self.cancel_button.setEnabled(bool(self.running_jobs))
+        self._refresh_job_list()
+        self._update_pipeline_stats()
+
+    def update_progress(self, job_id, stage, percent, speed, eta):
+        self.job_progress.pop(job_id, None)
+        self.job_progress[job_id] = (stage, percent, speed, eta)
+        self._show_progress()
+
+    def _show_progress(self):
+        """Show the selected job's progress in the bar, or the most recently active job's."""
+        current = self.job_list.currentItem()
+        job_id = current.data(Qt.UserRole) if current else None
+        if job_id not in self.job_progress:
+            job_id = next(reversed(self.job_progress), None)
+        if job_id is None:
+            self.progress_bar.setVisible(False)
+            return
+        stage, percent, speed, eta = self.job_progress[job_id]
+        eta_text = self.format_time(eta) if eta >= 0 else "--:--:--"
+        self.progress_bar.setValue(int(percent))
+        self.progress_bar.setFormat(f"{stage} %p% · {speed:.1f}× realtime · ETA {eta_text}")
+        self.progress_bar.setVisible(True)
+
+    def _update_pipeline_stats(self):
+        self.pipeline_label.setText(self.scheduler.format_stats().replace(" | ", "\n"))
+        if not self.running_jobs:
+            self.pipeline_timer.stop()
+
+    def _refresh_job_list(self):
+        """Redraw the job list from the queue (one line per job: name, status, latest message)."""
+        selected = self.job_list.currentItem().data(Qt.UserRole) if self.job_list.currentItem() else None
+        self.job_list.clear()
+        for job in self.job_queue.jobs():
+            item = QListWidgetItem(f"{job['base_name']} — {job['status']}: {job.get('message', '')}")
+            item.setToolTip(job["input_file"])
+            item.setData(Qt.UserRole, job["id"])
+            self.job_list.addItem(item)
+            if job["id"] == selected:
+                self.job_list.setCurrentItem(item)
 
     def open_settings(self):
-        """Open the settings dialog (only for whisper-cli path; model + transcoder format live in main right panel)."""
-        dialog = SettingsDialog(self, self.whisper_cli)
+        """Open the settings dialog (whisper-cli path, parallel transcription; model + transcoder format live in main right panel)."""
+        dialog = SettingsDialog(self, self.whisper_cli, self.transcribe_chunks, self.threads_per_worker,
+                                self.cache_max_gb, self.stage_limits, self.use_proxy, self.use_whisper_server,
+                                self.model_dirs, self.target_encode_minutes, self.encode_segments,
+                                self.strip_non_speech, self.strip_min_gap_s)
         if dialog.exec():
             new_cli = dialog.get_whisper_cli()
             if new_cli:
                 self.whisper_cli = new_cli
+            self.transcribe_chunks = dialog.get_transcribe_chunks()
+            self.threads_per_worker = dialog.get_threads_per_worker()
+            self.cache_max_gb = dialog.get_cache_max_gb()
+            self.result_cache.max_bytes = int(self.cache_max_gb * 1024**3)
+            self.stage_limits = dialog.get_stage_limits()
+            self.use_proxy = dialog.get_use_proxy()
+            self.use_whisper_server = dialog.get_use_whisper_server()
+            self.target_encode_minutes = dialog.get_target_encode_minutes()
+            self.encode_segments = dialog.get_encode_segments()
+            self.strip_non_speech = dialog.get_strip_non_speech()
+            self.strip_min_gap_s = dialog.get_strip_min_gap_s()
+            model_dirs = dialog.get_model_dirs()
+            if model_dirs != self.model_dirs:
+                self.model_dirs = model_dirs
+                self._discover_models()
             # Persist (model/encoder/do_* driven by main panel + _save_config)
             config = load_config()
             config["whisper_cli"] = self.whisper_cli
+            config["transcribe_chunks"] = self.transcribe_chunks
+            config["threads_per_worker"] = self.threads_per_worker
+            config["cache_max_gb"] = self.cache_max_gb
+            config["stage_limits"] = self.stage_limits
+            config["use_proxy"] = self.use_proxy
+            config["use_whisper_server"] = self.use_whisper_server
+            config["model_dirs"] = self.model_dirs
+            config["target_encode_minutes"] = self.target_encode_minutes
+            config["encode_segments"] = self.encode_segments
+            config["strip_non_speech"] = self.strip_non_speech
+            config["strip_min_gap_s"] = self.strip_min_gap_s
             save_config(config)
             self.statusBar().showMessage("Settings updated")
 
@@ -998,24 +4716,81 @@ class SermonTranscriber(QMainWindow):
         self.play_button.setEnabled(enabled)
         self.jump_out_button.setEnabled(enabled)
         self.out_button.setEnabled(enabled)
-        if hasattr(self, "transcribe_button") and getattr(self, "transcribe_button", None) and self.transcribe_button.text() == "Extract and Transcribe":
+        if getattr(self, "transcribe_button", None):
             self.transcribe_button.setEnabled(enabled)
+        if getattr(self, "suggest_button", None):
+            self.suggest_button.setEnabled(enabled and bool(self.suggested_points))
 
     def _save_config(self):
         """Persist model, encoder, and the two enable checkboxes from the right panel controls."""
         try:
             config = load_config()
             if self.model_combo.count() > 0 and self.model_combo.isEnabled():
-                config["selected_model"] = self.model_combo.currentText()
+                config["selected_model"] = self.model_combo.currentData()
             config["video_encoder"] = self._get_current_video_encoder()
+            config["video_preset"] = self.preset_combo.currentData() or ""
             config["do_transcribe"] = self.transcribe_cb.isChecked()
             config["do_transcode"] = self.transcode_cb.isChecked()
+            config["stream_audio"] = not self.keep_wav_cb.isChecked()
             if self.whisper_cli:
                 config["whisper_cli"] = self.whisper_cli
             save_config(config)
         except Exception:
             pass  # never let save break UI
 
+    def _fill_preset_combo(self, *_):
+        """List the presets of the selected encoder, keeping the chosen one where the encoder has it."""
+        encoder = self._get_current_video_encoder()
+        current = self.preset_combo.currentData() if self.preset_combo.count() else self.video_preset
+        default = ENCODER_SETTINGS.get(encoder, ENCODER_SETTINGS[DEFAULT_VIDEO_ENCODER])["preset"]
+        self.preset_combo.blockSignals(True)
+        self.preset_combo.clear()
+        self.preset_combo.addItem(f"Default ({default})", "")
+        self.preset_combo.addItem("Auto (meet target time)", AUTO_PRESET)
+        for preset in ENCODER_PRESETS.get(encoder, ()):
+            self.preset_combo.addItem(str(preset), str(preset))
+        self.preset_combo.setCurrentIndex(max(0, self.preset_combo.findData(current or "")))
+        self.preset_combo.blockSignals(False)
+
+    def estimate_encode(self):
+        """Time sample encodes of the current cut in the background; the results open in a dialog."""
+        if not self.source_file or self.out_point <= self.in_point:
+            self.statusBar().showMessage("Load a video and set in/out points to estimate the encode")
+            return
+        if self.estimate_thread is not None:
+            self.estimate_thread.cancel()
+            self.estimate_thread.wait()
+        self.estimate_button.setEnabled(False)
+        self.statusBar().showMessage("Timing sample encodes...")
+        self.estimate_thread = EncodeEstimateThread(
+            self.source_file, self._source_ms(self.in_point) / 1000, self._source_ms(self.out_point) / 1000
+        )
+        self.estimate_thread.estimated.connect(self._on_encode_estimated)
+        self.estimate_thread.ready.connect(self._on_encode_estimates_ready)
+        self.estimate_thread.start()
+
+    def _on_encode_estimated(self, path, estimate):
+        if self.estimate_thread is None or path != self.estimate_thread.path:
+            return
+        self.statusBar().showMessage(f"Timing sample encodes... {format_estimates([estimate])}")
+
+    def _on_encode_estimates_ready(self, path, estimates):
+        if self.estimate_thread is None or path != self.estimate_thread.path:
+            return
+        self.estimate_thread = None
+        self.estimate_button.setEnabled(True)
+        if not estimates:
+            self.statusBar().showMessage("Could not time sample encodes of this file")
+            return
+        self.statusBar().showMessage("Encode estimate ready")
+        target_s = self.target_encode_minutes * 60
+        QMessageBox.information(
+            self, "Encode estimate",
+            f"Predicted encode time and size of the {self.format_time((self.out_point - self.in_point) / 1000)} cut "
+            f"on this machine (Auto aims for {self.target_encode_minutes} min):\n\n"
+            + format_estimates(estimates, target_s),
+        )
+
     def _get_current_video_encoder(self):
         if hasattr(self, "encoder_combo") and self.encoder_combo.count() > 0:
             try:
@@ -1053,10 +4828,211 @@ class SermonTranscriber(QMainWindow):
         if not path:
             return False
         ext = os.path.splitext(path)[1].lower()
-        return ext in (".mp4", ".mov", ".mkv")
+        return ext in VIDEO_EXTENSIONS
+
+
+def load_batch_points(directory, points_file=None):
+    """Collect sermon in/out points for a batch directory as {video file name: (in_ms, out_ms)}.
+    Reads a CSV (columns: file,in,out) if given or if sermons.csv exists, plus any per-video
+    "<name>.json" sidecar ({"in": ..., "out": ...}), which wins over the CSV.
+    Times are seconds or [HH:]MM:SS[.mmm]; a missing value means the start/end of the file.
+    """
+    points = {}
+    csv_path = points_file or os.path.join(directory, "sermons.csv")
+    if os.path.isfile(csv_path):
+        with open(csv_path, newline="") as f:
+            for row in csv.DictReader(f):
+                name = os.path.basename((row.get("file") or "").strip())
+                if name:
+                    points[name] = (parse_timestamp_ms(row.get("in")), parse_timestamp_ms(row.get("out")))
+
+    for name in os.listdir(directory):
+        stem, ext = os.path.splitext(name)
+        sidecar = os.path.join(directory, f"{stem}.json")
+        if ext.lower() in VIDEO_EXTENSIONS and os.path.isfile(sidecar):
+            try:
+                with open(sidecar, "r") as f:
+                    data = json.load(f)
+                points[name] = (parse_timestamp_ms(data.get("in")), parse_timestamp_ms(data.get("out")))
+            except Exception as e:
+                print(f"Ignoring unreadable sidecar {sidecar}: {e}")
+    return points
+
+
+def find_batch_videos(directory):
+    """Source videos in directory, skipping our own "<name> sermon.mp4" outputs."""
+    videos = []
+    for name in sorted(os.listdir(directory)):
+        stem, ext = os.path.splitext(name)
+        if ext.lower() in VIDEO_EXTENSIONS and not stem.endswith(" sermon"):
+            videos.append(os.path.join(directory, name))
+    return videos
+
+
+def batch_main(argv):
+    """Headless entry point: `python transcribe.py batch <dir> --jobs N`."""
+    config = load_config()
+    parser = argparse.ArgumentParser(
+        prog="transcribe.py batch",
+        description="Extract and transcribe every service recording in a directory without the GUI.",
+    )
+    parser.add_argument("directory", help="directory of service recordings (.mp4/.mov/.mkv)")
+    parser.add_argument("--jobs", type=int, default=2, help="parallel video transcodes (default: 2)")
+    parser.add_argument("--probe-jobs", type=int, default=DEFAULT_STAGE_LIMITS["probe"], help="parallel probes")
+    parser.add_argument("--audio-jobs", type=int, default=DEFAULT_STAGE_LIMITS["audio"], help="parallel audio extracts")
+    parser.add_argument("--ffmpeg-jobs", type=int, default=None,
+                        help="cap on concurrent ffmpeg processes across stages (default: video + audio jobs)")
+    parser.add_argument("--whisper-jobs", type=int, default=1, help="concurrent whisper stages (default: 1)")
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_STAGE_QUEUE_SIZE,
+                        help="jobs allowed to wait between two stages (default: %(default)s)")
+    parser.add_argument("--points", help="CSV of file,in,out (default: <dir>/sermons.csv if present)")
+    parser.add_argument("--auto-points", action="store_true",
+                        help="for recordings without given points, cut at the longest stretch of speech")
+    parser.add_argument("--whisper-cli", default=config.get("whisper_cli"), help="whisper-cli executable")
+    parser.add_argument("--whisper-server", default=config.get("whisper_server"),
+                        help="whisper-server executable (default: next to whisper-cli, else on PATH)")
+    parser.add_argument("--no-whisper-server", action="store_true",
+                        help="run one whisper-cli per recording instead of keeping the model loaded")
+    parser.add_argument("--model", default=None, help="model file name in the model dirs, or a path")
+    parser.add_argument("--encoder", choices=[key for _, key in VIDEO_ENCODER_OPTIONS],
+                        default=config.get("video_encoder", DEFAULT_VIDEO_ENCODER))
+    parser.add_argument("--preset",
+                        help=f"encoder preset (default: as in the app), or '{AUTO_PRESET}' for the slowest one predicted to meet --target-minutes")
+    parser.add_argument("--target-minutes", type=float,
+                        default=config.get("target_encode_minutes", DEFAULT_TARGET_ENCODE_MINUTES),
+                        help="encode time the auto preset aims for, per recording (default: %(default)s)")
+    parser.add_argument("--estimate", action="store_true",
+                        help="only time sample encodes and print the predicted encode time and size per preset")
+    parser.add_argument("--encode-segments", type=int, default=config.get("encode_segments", 1),
+                        help="re-encode each cut as this many segments in parallel (default: %(default)s)")
+    parser.add_argument("--strip-non-speech", action=argparse.BooleanOptionalAction,
+                        default=config.get("strip_non_speech", False),
+                        help="transcribe only the speech, skipping long silence and music (default: as in the app)")
+    parser.add_argument("--strip-min-gap", type=float, default=config.get("strip_min_gap_s", DEFAULT_STRIP_MIN_GAP_S),
+                        help="shortest silence/music run to skip, in seconds (default: %(default)s)")
+    parser.add_argument("--no-transcode", action="store_true", help="skip writing the sermon video")
+    parser.add_argument("--no-transcribe", action="store_true", help="skip audio extraction and whisper")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.directory):
+        parser.error(f"not a directory: {args.directory}")
+    presets = [AUTO_PRESET, *map(str, ENCODER_PRESETS[args.encoder])]
+    if args.preset and args.preset not in presets:
+        parser.error(f"unknown preset for {args.encoder}: {args.preset} (one of {', '.join(presets)})")
+    preset = args.preset or str(config.get("video_preset") or "")
+    if preset not in presets:
+        preset = None  # none saved, or saved for another encoder
+
+    model = args.model or config.get("selected_model") or "ggml-large-v3.bin"
+    whisper_server = None
+    if not args.no_whisper_server and config.get("use_whisper_server", True):
+        whisper_server = args.whisper_server or find_whisper_server(args.whisper_cli or get_default_whisper_cli())
+    model_path = resolve_model_path(model, config.get("model_dirs"))
+    limits = {
+        "probe": max(1, args.probe_jobs),
+        "video": max(1, args.jobs),
+        "audio": max(1, args.audio_jobs),
+        "transcribe": max(1, args.whisper_jobs),
+    }
+    ffmpeg_slot = threading.BoundedSemaphore(max(1, args.ffmpeg_jobs or limits["video"] + limits["audio"]))
+    result_cache = ResultCache(max_bytes=int(config.get("cache_max_gb", DEFAULT_CACHE_MAX_GB) * 1024**3))
+    points = load_batch_points(args.directory, args.points)
+    videos = find_batch_videos(args.directory)
+    if not videos:
+        print(f"No videos found in {args.directory}")
+        return 0
+
+    failures = []
+    # Latest (stage, percent, speed, eta) per recording, printed with the pipeline stats
+    progress = {}
+
+    def job_finished(job, message):
+        progress.pop(os.path.basename(job.input_file), None)
+        print(f"[{os.path.basename(job.input_file)}] {message}")
+        if not message.startswith("Process complete"):
+            failures.append(job.base_name)
+
+    scheduler = PipelineScheduler(limits, queue_size=args.queue_size, on_finished=job_finished)
+    print(f"Processing {len(videos)} recording(s); stage workers: "
+          + ", ".join(f"{stage} {n}" for stage, n in limits.items()))
+    for input_file in videos:
+        name = os.path.basename(input_file)
+        in_point, out_point = points.get(name, (None, None))
+        if name not in points and args.auto_points:
+            suggestion = suggest_sermon_points(input_file)
+            if suggestion:
+                in_point, out_point = suggestion
+                print(f"[{name}] Suggested sermon: {in_point / 1000:.0f}s to {out_point / 1000:.0f}s")
+            else:
+                print(f"[{name}] No clear sermon found; using the whole recording")
+        in_point = in_point or 0
+        if out_point is None:
+            # Cached, so the job's own probe stage does not launch ffprobe again.
+            out_point = probe_duration_ms(input_file)
+            if out_point is None:
+                print(f"[{name}] Error: could not read duration (is ffprobe installed?)")
+                failures.append(name)
+                continue
+        if args.estimate:
+            estimates = estimate_encodes(input_file, in_point / 1000, out_point / 1000)
+            print(f"[{name}] Cut of {(out_point - in_point) / 1000:.0f}s:")
+            print(format_estimates(estimates or [], args.target_minutes * 60) or "  (could not time sample encodes)")
+            continue
+        job = ExtractAndTranscribeThread(
+            input_file, in_point, out_point, os.path.splitext(name)[0],
+            whisper_cli=args.whisper_cli,
+            model_path=model_path,
+            video_encoder=args.encoder,
+            video_preset=preset,
+            target_encode_s=args.target_minutes * 60,
+            do_transcribe=not args.no_transcribe,
+            do_transcode=not args.no_transcode,
+            single_pass=config.get("single_pass", True),
+            smart_cut=config.get("smart_cut", True),
+            stream_audio=config.get("stream_audio", False),
+            transcribe_chunks=config.get("transcribe_chunks", 1),
+            threads_per_worker=config.get("threads_per_worker"),
+            encode_segments=args.encode_segments,
+            strip_non_speech=args.strip_non_speech,
+            strip_min_gap_s=args.strip_min_gap,
+            whisper_server=whisper_server,
+            ffmpeg_slot=ffmpeg_slot,
+            result_cache=result_cache,
+        )
+        # No Qt event loop here: deliver signals synchronously on the worker thread.
+        job.status_update.connect(lambda msg, name=name: print(f"[{name}] {msg}"), Qt.DirectConnection)
+        job.progress.connect(
+            lambda stage, percent, speed, eta, name=name: progress.__setitem__(name, (stage, percent, speed, eta)),
+            Qt.DirectConnection,
+        )
+        scheduler.submit(job)
+
+    if args.estimate:
+        scheduler.shutdown()
+        return 1 if failures else 0
+    while scheduler.active_jobs():
+        time.sleep(1)
+        if scheduler.active_jobs():
+            print(f"Pipeline: {scheduler.format_stats()}")
+            for name, (stage, percent, speed, eta) in list(progress.items()):
+                eta_text = f"ETA {eta:.0f}s" if eta >= 0 else "ETA ?"
+                print(f"[{name}] {stage} {percent:.0f}% at {speed:.1f}x realtime, {eta_text}")
+    scheduler.wait()
+    print(f"Pipeline: {scheduler.format_stats()}")
+    scheduler.shutdown()
+    if WHISPER_SERVERS.servers:
+        print(f"whisper-server: {WHISPER_SERVERS.format_stats()}")
+    WHISPER_SERVERS.shutdown()
+    print(f"Done: {len(videos) - len(failures)} succeeded, {len(failures)} failed.")
+    return 1 if failures else 0
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        sys.exit(batch_main(sys.argv[2:]))
     app = QApplication(sys.argv)
-    window = SermonTranscriber()
+    # --startup-timing: print the startup milestones as JSON and quit once interactive (benchmarks/bench_startup.py)
+    # --seek-timing: print the seek latency after each scrub
+    window = SermonTranscriber(startup_timing="--startup-timing" in sys.argv[1:],
+                               seek_timing="--seek-timing" in sys.argv[1:])
     sys.exit(app.exec())